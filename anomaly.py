@@ -0,0 +1,145 @@
+# anomaly.py
+"""이상치 탐지 (NumPy 벡터 연산)
+
+중앙값/MAD 기반 robust z-score로 평소와 다른 주·일·유입경로·기자를 표시한다.
+평균/표준편차 대신 중앙값/MAD를 쓰므로 기준 구간에 급등 주가 섞여 있어도 기준값이 끌려가지 않는다.
+
+- rolling_z: 직전 window개 값 기준 (주간 추이)
+- seasonal_z: 같은 요일(주기 period)의 직전 seasons개 값 기준 (일별·유입경로별)
+- group_z: 같은 시점의 다른 그룹 대비 (기자별 기사 1건당 조회수, 로그 스케일)
+
+모든 함수는 (n,) 또는 (n, m) 배열을 받아 축 0(시간) 방향으로 한 번에 계산한다.
+기준 값이 min_periods개 미만이면 z는 NaN(판정하지 않음)이다.
+진행 중인 주·오늘처럼 집계가 확정되지 않은 행(final=0)은 값이 작게 나오므로 NaN으로 두고 판정하지 않는다.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+MAD_SCALE = 1.4826  # 정규분포에서 MAD -> 표준편차 환산
+Z_THRESHOLD = 3.5
+MIN_REL_SCALE = 0.05  # MAD가 0에 가까울 때 척도 하한 (기준 중앙값의 5%)
+
+FLAG_UP = "▲ 급증"
+FLAG_DOWN = "▼ 급감"
+
+
+def _robust_z(values, history, min_periods):
+    """history(..., k)의 중앙값/MAD로 values(...)의 z-score와 기준값(중앙값) 계산"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 전부 NaN인 구간
+        med = np.nanmedian(history, axis=-1)
+        mad = np.nanmedian(np.abs(history - med[..., None]), axis=-1) * MAD_SCALE
+    scale = np.maximum(mad, np.maximum(np.abs(med) * MIN_REL_SCALE, 1.0))
+    z = (values - med) / scale
+    enough = np.count_nonzero(~np.isnan(history), axis=-1) >= min_periods
+    return np.where(enough, z, np.nan), np.where(enough, med, np.nan)
+
+
+def rolling_z(values, window=8, min_periods=4):
+    """직전 window개 값(현재 값 제외) 기준 robust z. 반환: (z, 기준값)"""
+    x = np.asarray(values, dtype=float)
+    pad = np.full((window,) + x.shape[1:], np.nan)
+    history = sliding_window_view(np.concatenate([pad, x]), window, axis=0)[:len(x)]
+    return _robust_z(x, history, min_periods)
+
+
+def seasonal_z(values, period=7, seasons=4, min_periods=2):
+    """같은 주기 위치(예: 같은 요일)의 직전 seasons개 값 기준 robust z. 반환: (z, 기준값)"""
+    x = np.asarray(values, dtype=float)
+    n, lag = len(x), period * seasons
+    padded = np.concatenate([np.full((lag,) + x.shape[1:], np.nan), x])
+    history = np.stack([padded[lag - period * k: lag - period * k + n] for k in range(1, seasons + 1)], axis=-1)
+    return _robust_z(x, history, min_periods)
+
+
+def group_z(values, min_periods=3):
+    """그룹 간 비교: 전체 그룹의 중앙값/MAD 기준 robust z (값은 log1p 변환 후 비교)"""
+    x = np.log1p(np.clip(np.asarray(values, dtype=float), 0, None))
+    z, _ = _robust_z(x, x[None, :], min_periods)
+    return z[0] if z.ndim > 1 else z
+
+
+def flags(z, threshold=Z_THRESHOLD):
+    """z-score -> 표시 문자열 ('▲ 급증' / '▼ 급감' / '')"""
+    z = np.asarray(z, dtype=float)
+    return np.where(z >= threshold, FLAG_UP, np.where(z <= -threshold, FLAG_DOWN, ""))
+
+
+# -----------------------------------------------------------------------------
+# [보고서 데이터 적용]
+# -----------------------------------------------------------------------------
+def _final_values(df, columns):
+    """지표 배열 (final 컬럼이 있으면 미확정 행은 NaN)"""
+    values = df[list(columns)].to_numpy(dtype=float, copy=True)
+    if "final" in df.columns:
+        values[~df["final"].astype(bool).to_numpy()] = np.nan
+    return values
+
+
+def annotate_weekly(df, columns=("UV", "PV"), window=8):
+    """주간 추이(오래된 주부터 정렬)에 <col>_z 컬럼과 '이상' 컬럼(|z|가 가장 큰 지표 기준) 추가. 미확정 주는 판정 안 함"""
+    if df.empty:
+        return df.assign(이상="")
+    z, _ = rolling_z(_final_values(df, columns), window=window)
+    df = df.assign(**{f"{c}_z": z[:, i].round(2) for i, c in enumerate(columns)})
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        worst = np.take_along_axis(z, np.nanargmax(np.nan_to_num(np.abs(z), nan=-1), axis=1)[:, None], axis=1)[:, 0]
+    return df.assign(이상=flags(worst))
+
+
+def annotate_daily(df_history, start_date, columns=("UV", "PV")):
+    """일별 합계 이력(date 컬럼)으로 같은 요일 기준 z 계산 후 start_date 이후 행만 반환 ('이상'은 마지막 지표 기준)
+
+    final 컬럼이 있으면 미확정 일자(오늘 등)는 판정하지 않는다.
+    """
+    if df_history.empty:
+        return df_history.assign(이상="")
+    df = df_history.sort_values("date")
+    # 빠진 날짜는 NaN으로 채워 요일 위치를 맞춘 뒤 계산하고, 결과에서는 다시 제외
+    days = pd.date_range(df["date"].iloc[0], df["date"].iloc[-1]).strftime("%Y-%m-%d")
+    values = pd.DataFrame(_final_values(df, columns), index=df["date"]).reindex(days).to_numpy(dtype=float)
+    z, _ = seasonal_z(values)
+    z = pd.DataFrame(z, index=days, columns=list(columns)).loc[df["date"]].to_numpy()
+    df = df.assign(**{f"{c}_z": z[:, i].round(2) for i, c in enumerate(columns)})
+    df = df.assign(이상=flags(df[f"{columns[-1]}_z"]))
+    return df[df["date"] >= start_date].reset_index(drop=True)
+
+
+def source_period_scores(df_source_daily, start_date, end_date):
+    """유입경로별 일별 조회수(date × 유입경로 피벗 가능 형태)로 기간 이상 점수 계산
+
+    일별 같은 요일 기준 z를 기간 내에서 합산(Stouffer: 평균 × √일수)한다.
+    end_date는 확정된 마지막 날짜까지로 넘긴다 (진행 중인 날은 조회수가 작아 급감으로 잡힘).
+    반환 컬럼: 유입경로, 기준 조회수(같은 요일 중앙값의 기간 합), 이상도, 이상
+    """
+    cols = ["유입경로", "기준 조회수", "이상도", "이상"]
+    if df_source_daily.empty:
+        return pd.DataFrame(columns=cols)
+    wide = df_source_daily.pivot_table(index="date", columns="유입경로", values="조회수", aggfunc="sum", fill_value=0)
+    days = pd.date_range(wide.index.min(), end_date).strftime("%Y-%m-%d")
+    wide = wide.reindex(days, fill_value=0)
+    z, base = seasonal_z(wide.to_numpy())
+    in_period = (wide.index >= start_date) & (wide.index <= end_date)
+    z, base = z[in_period], base[in_period]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        valid = np.count_nonzero(~np.isnan(z), axis=0)
+        score = np.nanmean(z, axis=0) * np.sqrt(valid)
+        baseline = np.where(valid > 0, np.nansum(base, axis=0), np.nan)
+    return pd.DataFrame({
+        "유입경로": wide.columns,
+        "기준 조회수": np.round(baseline),
+        "이상도": np.round(score, 2),
+        "이상": flags(score),
+    })
+
+
+def annotate_groups(df, value_col, threshold=Z_THRESHOLD):
+    """그룹(기자 등) 테이블에 다른 그룹 대비 '이상' 컬럼 추가"""
+    if df.empty:
+        return df.assign(이상="")
+    return df.assign(이상=flags(group_z(df[value_col].to_numpy()), threshold))
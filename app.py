@@ -3,12 +3,12 @@ import streamlit as st
 import streamlit.components.v1 as components
 from datetime import datetime
 
-# 모듈 임포트
+# 모듈 임포트 (data/views는 pandas·plotly·GA4 라이브러리를 끌어오므로 로그인 이후에 임포트)
 import config
 import auth
-import data
-import views
-from utils import WEEK_MAP
+import perf
+import sites
+from utils import format_range, period_options, recent_weeks, resolve_period, week_range
 
 # 1. 페이지 설정
 st.set_page_config(
@@ -26,6 +26,9 @@ st.markdown(config.PRINT_CSS, unsafe_allow_html=True)
 if not auth.check_password():
     st.stop()
 
+import data
+import views
+
 # =================================================================
 # ▼ 메인 로직 시작 ▼
 # =================================================================
@@ -53,23 +56,75 @@ with c2:
             st.session_state['print_mode'] = True
             st.rerun()
         
+    # 조회 기간: 기간 키(주 시작일 / 'YYYY-MM' / 'YYYY-Qn') 또는 (시작일, 종료일) 튜플
     if not st.session_state['print_mode']:
-        selected_week = st.selectbox("📅 조회 주차", list(WEEK_MAP.keys()), key="week_select", label_visibility="collapsed")
-        st.session_state['selected_week_for_print'] = selected_week
+        period_type = st.radio("조회 단위", ["주간", "월간", "분기", "기간 지정", "실시간"], horizontal=True, key="period_type", label_visibility="collapsed")
+        if period_type == "실시간":
+            selected_period = "__live__"
+        elif period_type == "기간 지정":
+            default_range = [datetime.strptime(d, '%Y-%m-%d').date() for d in week_range(recent_weeks(1)[0])]
+            picked = st.date_input("📅 조회 기간", value=default_range, max_value=datetime.now().date(), key="range_select", label_visibility="collapsed")
+            picked = list(picked) if isinstance(picked, (list, tuple)) else [picked]
+            selected_period = (picked[0].strftime('%Y-%m-%d'), picked[-1].strftime('%Y-%m-%d'))
+        else:
+            options = period_options(period_type, 52 if period_type == "주간" else None)
+            select_key = "week_select" if period_type == "주간" else f"period_select_{period_type}"
+            selected_period = st.selectbox("📅 조회 기간", list(options.keys()), format_func=options.get, key=select_key, label_visibility="collapsed")
+        if selected_period != "__live__":
+            st.session_state['selected_period_for_print'] = selected_period
     else:
-        selected_week = st.session_state.get('selected_week_for_print', st.session_state.get('week_select', list(WEEK_MAP.keys())[0]))
+        selected_period = st.session_state.get('selected_period_for_print', st.session_state.get('week_select', recent_weeks(1)[0]))
+
+    # 사이트 선택 (자매 사이트가 등록된 경우만 표시, '그룹 전체'는 사이트별 현황표)
+    site_keys = list(config.SITES.keys())
+    if len(site_keys) > 1 and not st.session_state['print_mode']:
+        selected_site = st.selectbox("사이트", site_keys + ["__group__"], key="site_select", label_visibility="collapsed",
+                                     format_func=lambda k: "그룹 전체" if k == "__group__" else config.SITES[k]['name'])
+        st.session_state['selected_site_for_print'] = selected_site
+    else:
+        selected_site = st.session_state.get('selected_site_for_print', config.DEFAULT_SITE)
+
+# 실시간 모드: 과거 섹션은 로드하지 않고 KPI/인기 기사 영역만 주기적으로 다시 그림
+if selected_period == "__live__":
+    import live
+    live_site = config.DEFAULT_SITE if selected_site == "__group__" else selected_site
+
+    @st.fragment(run_every=live.POLL_SECONDS)
+    def render_live_fragment():
+        window = live.get_window(live_site)
+        window.refresh()
+        views.render_live(window.snapshot())
 
-st.markdown(f'<div class="period-info">📅 조회 기간: {WEEK_MAP[selected_week]}</div>', unsafe_allow_html=True)
+    render_live_fragment()
+    st.stop()
+
+_, period_start, period_end = resolve_period(*selected_period) if isinstance(selected_period, tuple) else resolve_period(selected_period)
+st.markdown(f'<div class="period-info">📅 조회 기간: {format_range(period_start, period_end)}</div>', unsafe_allow_html=True)
 st.markdown(f"<div class='update-time'>최종 집계: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>", unsafe_allow_html=True)
 
+# 그룹 전체: 사이트별 보고서를 병렬 로드하여 현황표만 표시
+if selected_site == "__group__":
+    args = selected_period if isinstance(selected_period, tuple) else (selected_period, None)
+    with perf.trace("그룹 " + " ~ ".join(a for a in args if a)):
+        _, df_overview = data.load_group_overview(*args)
+    views.render_group_overview(df_overview)
+    st.stop()
+
+# 이후 크롤링(카테고리 비교 등)도 선택한 사이트 기준
+sites.set_current(selected_site)
+
 # 데이터 로드
-# [수정] data.py에서 반환하는 df_top10_sources, published_article_count, df_all_articles_with_metadata 추가 수신 (총 20개 항목)
+def load_with_trace(period):
+    args = period if isinstance(period, tuple) else (period, None)
+    with perf.trace(" ~ ".join(a for a in args if a)):
+        return data.load_all_dashboard_data(*args, selected_site)
+
+# [수정] data.py에서 반환하는 df_top10_sources, published_article_count, df_all_articles_with_metadata, df_top10_daily 추가 수신
+# 기자별 집계(writer_stats, 본명/필명 기준)도 보고서와 함께 캐시됨 (총 22개 항목)
+report = load_with_trace(selected_period)
 (cur_uv, cur_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last, 
  df_region_curr, df_region_last, df_age_curr, df_age_last, df_gender_curr, df_gender_last, 
- df_top10, df_raw_all, new_ratio, search_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata) = data.load_all_dashboard_data(selected_week)
-
-# 기자별 데이터 생성 (본명 기준) - 전체 활성 기사 기준
-writers_df = data.get_writers_df_real(df_all_articles_with_metadata)
+ df_top10, df_raw_all, new_ratio, search_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata, df_top10_daily, writer_stats) = report
 
 # 뷰 렌더링
 if st.session_state['print_mode']:
@@ -78,7 +133,7 @@ if st.session_state['print_mode']:
     
     st.markdown('<div class="print-preview-layout">', unsafe_allow_html=True)
     
-    views.render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count)
+    views.render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count, selected_period)
     st.markdown("<br>", unsafe_allow_html=True)
     views.render_traffic(df_traffic_curr, df_traffic_last)
     
@@ -95,7 +150,7 @@ if st.session_state['print_mode']:
     views.render_top10_detail(df_top10)
     st.markdown("<br>", unsafe_allow_html=True)
     # [수정] df_top10_sources 인자 추가
-    views.render_top10_trends(df_top10, df_top10_sources)
+    views.render_top10_trends(df_top10, df_top10_sources, df_top10_daily)
     
     st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
     
@@ -103,16 +158,26 @@ if st.session_state['print_mode']:
     
     st.markdown('<div class="page-break"></div>', unsafe_allow_html=True)
     
-    views.render_writer_integrated(writers_df, df_all_articles_with_metadata)
+    views.render_writer_integrated(writer_stats)
     
     st.markdown('<div class="print-footer">Cook&Chef Weekly Report - Generated by AI System</div>', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True) 
 
 else:
     # [일반 모드]
+    # 섹션별 내려받기 (버튼을 누를 때 캐시된 보고서에서 생성)
+    import export
+    _, col_xlsx, col_csv = st.columns([4, 1, 1])
+    for col, fmt, label in ((col_xlsx, "xlsx", "📥 Excel"), (col_csv, "csv.zip", "📥 CSV")):
+        col.download_button(
+            label, data=lambda fmt=fmt: b"".join(export.stream(report, fmt)),
+            file_name=export.filename(selected_period, fmt, selected_site), mime=export.MIME[fmt],
+            on_click="ignore", key=f"export_{fmt}",
+        )
+
     tabs = st.tabs(["1.성과요약", "2.접근경로", "3.방문자특성", "4.Top10상세", "5.Top10추이", "6.카테고리", "7.기자(통합)"])
     
-    with tabs[0]: views.render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count)
+    with tabs[0]: views.render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count, selected_period)
     with tabs[1]: views.render_traffic(df_traffic_curr, df_traffic_last)
     with tabs[2]: 
         views.render_demo_region(df_region_curr, df_region_last)
@@ -120,8 +185,13 @@ else:
         views.render_demo_age_gender(df_age_curr, df_age_last, df_gender_curr, df_gender_last)
     with tabs[3]: views.render_top10_detail(df_top10)
     # [수정] df_top10_sources 인자 추가
-    with tabs[4]: views.render_top10_trends(df_top10, df_top10_sources)
-    with tabs[5]: views.render_category(df_all_articles_with_metadata, selected_week)
-    with tabs[6]: views.render_writer_integrated(writers_df, df_all_articles_with_metadata)
+    with tabs[4]: views.render_top10_trends(df_top10, df_top10_sources, df_top10_daily)
+    with tabs[5]: views.render_category(df_all_articles_with_metadata, selected_period)
+    with tabs[6]: views.render_writer_integrated(writer_stats)
+
+# 숨김 진단 화면: ?diag=perf
+if st.query_params.get("diag") == "perf" and not st.session_state['print_mode']:
+    with st.expander("⏱ 성능 진단", expanded=True):
+        views.render_perf_panel(perf.recent_traces())
 
 st.markdown('<div class="footer-note no-print">※ 본 보고서는 쿡앤셰프(Cook&Chef) 홈페이지 및 애널리틱스 데이터를 활용하여 구성하였습니다.</div>', unsafe_allow_html=True)
\ No newline at end of file
@@ -1,13 +1,156 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime
 
-from flask import Flask, redirect, render_template, request, session, url_for
+from flask import Flask, Response, abort, g, jsonify, redirect, render_template, render_template_string, request, session, url_for
 
 import config
-import data
-from utils import WEEK_MAP
+import metrics
+import perf
+from utils import PERIOD_KINDS, format_range, period_options, recent_weeks, resolve_period
+
+
+PERF_TEMPLATE = """
+<!doctype html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>성능 진단</title>
+{{ css|safe }}
+<style>
+.perf-trace { margin: 24px 0 40px; }
+.perf-row { display: flex; align-items: center; font-size: 12px; height: 18px; }
+.perf-name { width: 320px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+.perf-track { position: relative; flex: 1; height: 12px; background: #f7f9fa; }
+.perf-bar { position: absolute; height: 12px; }
+.perf-section { background: #1a237e; }
+.perf-ga4 { background: #d32f2f; }
+.perf-crawl { background: #8d6e63; }
+.perf-step { background: #78909c; }
+.perf-ms { width: 90px; text-align: right; font-family: monospace; }
+</style>
+</head>
+<body>
+<div class="report-title">⏱ 최근 데이터 로드 성능</div>
+{% for t in traces %}
+<div class="perf-trace">
+  <div class="sub-header">{{ t.started_at }} · {{ t.label }} · {{ '{:,.0f}'.format(t.duration_ms) }}ms · 캐시 {{ t.attrs.cache }}
+    · GA4 {{ t.summary.ga4_calls }}회/{{ '{:,}'.format(t.summary.ga4_rows) }}행 · 크롤링 {{ t.summary.crawl_calls }}건(적중 {{ t.summary.crawl_hits }})</div>
+  {% for s in t.spans %}
+  <div class="perf-row" title="{{ s.attrs }}">
+    <div class="perf-name">{{ s.name }} {{ s.attrs.report or s.attrs.path or '' }}</div>
+    <div class="perf-track">
+      <div class="perf-bar perf-{{ s.kind }}" style="left: {{ 100 * s.offset_ms / (t.duration_ms or 1) }}%; width: {{ [100 * s.duration_ms / (t.duration_ms or 1), 0.2]|max }}%;"></div>
+    </div>
+    <div class="perf-ms">{{ '{:,.1f}'.format(s.duration_ms) }}</div>
+  </div>
+  {% endfor %}
+</div>
+{% else %}
+<p>기록된 로드가 없습니다.</p>
+{% endfor %}
+</body>
+</html>
+"""
+
+
+GROUP_TEMPLATE = """
+<!doctype html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>그룹 사이트 성과 현황</title>
+{{ css|safe }}
+</head>
+<body>
+<div class="report-title">📰 그룹 사이트 성과 현황</div>
+<div class="period-info">📅 조회 기간: {{ period }}</div>
+{{ table|safe }}
+<p class="section-desc">그룹 합계 UV는 사이트별 UV 단순 합계입니다 (사이트 간 중복 방문자 포함).</p>
+</body>
+</html>
+"""
+
+
+def load_with_trace(period, site=config.DEFAULT_SITE):
+    # data(pandas/streamlit)는 첫 대시보드 요청 시 임포트: 워커 부팅과 로그인 화면을 가볍게 유지
+    import data
+    args = period if isinstance(period, tuple) else (period, None)
+    with perf.trace(" ~ ".join(a for a in args if a)):
+        return data.load_all_dashboard_data(*args, site)
+
+
+def site_from_request():
+    """?site=<config.SITES 키> (기본: config.DEFAULT_SITE)"""
+    site = request.args.get("site")
+    return site if site in config.SITES else config.DEFAULT_SITE
+
+
+def period_from_request():
+    """?start=YYYY-MM-DD&end=YYYY-MM-DD, ?period=<기간 키>, ?week=<주 시작일> 순으로 해석 (기본: 이번 주)
+
+    기간 키는 utils.resolve_period 참고 (주 'YYYY-MM-DD', 월 'YYYY-MM', 분기 'YYYY-Qn').
+    반환: (load_with_trace 인자, 라벨, 'YYYY.MM.DD ~ YYYY.MM.DD' 표시용 기간)
+    잘못된 날짜·기간 키나 시작일 > 종료일이면 400 응답으로 중단한다.
+    """
+    start, end = request.args.get("start"), request.args.get("end")
+    key = request.args.get("period") or request.args.get("week")
+    try:
+        if start and end:
+            label, s_dt, e_dt = resolve_period(start, end)
+            period = (start, end)
+        elif key:
+            label, s_dt, e_dt = resolve_period(key)
+            # 주간 키는 일요일로 정규화된 값으로 캐시를 공유
+            period = key if len(key) != 10 else s_dt
+        else:
+            period = recent_weeks(1)[0]
+            label, s_dt, e_dt = resolve_period(period)
+    except (KeyError, ValueError) as e:
+        abort(Response(f"잘못된 기간입니다: {e}", status=400, content_type="text/plain; charset=utf-8"))
+    return period, label, format_range(s_dt, e_dt)
+
+
+def report_context(report, period, label, period_text, site):
+    """dashboard.html / print.html 템플릿 변수 (Flask 화면과 정적 사이트 생성(staticsite.py)이 같이 씀)"""
+    # 기자별 집계는 보고서와 함께 캐시됨 (템플릿은 예전 컬럼 이름: '작성자'=본명)
+    writers_df = report.writer_stats.by_pen.rename(columns={'본명': '작성자'})
+    return dict(
+        css=config.CSS,
+        print_css=config.PRINT_CSS,
+        now=datetime.now(),
+        week_map=period_options("주간"),
+        period_options={kind: period_options(kind) for kind in PERIOD_KINDS},
+        selected_week=period if isinstance(period, str) else None,
+        selected_label=label,
+        period=period_text,
+        sites=config.SITES,
+        selected_site=site,
+        # 숫자/지표
+        cur_uv=report.cur_uv,
+        cur_pv=report.cur_pv,
+        new_ratio=report.new_ratio,
+        search_ratio=report.search_ratio,
+        active_article_count=report.active_article_count,
+        published_article_count=report.published_article_count,
+        # 데이터(테이블/차트)
+        df_daily=report.df_daily,
+        df_weekly=report.df_weekly,
+        df_traffic_curr=report.df_traffic_curr,
+        df_traffic_last=report.df_traffic_last,
+        df_region_curr=report.df_region_curr,
+        df_region_last=report.df_region_last,
+        df_age_curr=report.df_age_curr,
+        df_age_last=report.df_age_last,
+        df_gender_curr=report.df_gender_curr,
+        df_gender_last=report.df_gender_last,
+        df_top10=report.df_top10,
+        df_top10_sources=report.df_top10_sources,
+        df_top10_daily=report.df_top10_daily,
+        writers_df=writers_df,
+    )
 
 
 def create_app() -> Flask:
@@ -17,6 +160,24 @@ def create_app() -> Flask:
 
     access_code = os.getenv("ACCESS_CODE", "cncnews2026")
 
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_latency(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            route = request.url_rule.rule if request.url_rule else "<unmatched>"
+            metrics.HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started, route=route, method=request.method, status=response.status_code
+            )
+        return response
+
+    @app.get("/metrics")
+    def metrics_endpoint():
+        return Response(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
     @app.get("/")
     def index():
         if not session.get("password_correct"):
@@ -52,129 +213,92 @@ def create_app() -> Flask:
         if not session.get("password_correct"):
             return redirect(url_for("login"))
 
-        selected_week = request.args.get("week")
-        if selected_week not in WEEK_MAP:
-            selected_week = list(WEEK_MAP.keys())[0]
-
-        (
-            cur_uv,
-            cur_pv,
-            df_daily,
-            df_weekly,
-            df_traffic_curr,
-            df_traffic_last,
-            df_region_curr,
-            df_region_last,
-            df_age_curr,
-            df_age_last,
-            df_gender_curr,
-            df_gender_last,
-            df_top10,
-            _df_raw_all,
-            new_ratio,
-            search_ratio,
-            active_article_count,
-            df_top10_sources,
-            published_article_count,
-            df_all_articles_with_metadata,
-        ) = data.load_all_dashboard_data(selected_week)
-
-        writers_df = data.get_writers_df_real(df_all_articles_with_metadata)
+        selected_period, selected_label, period_text = period_from_request()
+        selected_site = site_from_request()
 
-        return render_template(
-            "dashboard.html",
-            css=config.CSS,
-            print_css=config.PRINT_CSS,
-            now=datetime.now(),
-            week_map=WEEK_MAP,
-            selected_week=selected_week,
-            period=WEEK_MAP[selected_week],
-            # 숫자/지표
-            cur_uv=cur_uv,
-            cur_pv=cur_pv,
-            new_ratio=new_ratio,
-            search_ratio=search_ratio,
-            active_article_count=active_article_count,
-            published_article_count=published_article_count,
-            # 데이터(테이블/차트)
-            df_daily=df_daily,
-            df_weekly=df_weekly,
-            df_traffic_curr=df_traffic_curr,
-            df_traffic_last=df_traffic_last,
-            df_region_curr=df_region_curr,
-            df_region_last=df_region_last,
-            df_age_curr=df_age_curr,
-            df_age_last=df_age_last,
-            df_gender_curr=df_gender_curr,
-            df_gender_last=df_gender_last,
-            df_top10=df_top10,
-            df_top10_sources=df_top10_sources,
-            writers_df=writers_df,
-        )
+        report = load_with_trace(selected_period, selected_site)
+        return render_template("dashboard.html", **report_context(report, selected_period, selected_label, period_text, selected_site))
 
     @app.get("/print")
     def print_view():
         if not session.get("password_correct"):
             return redirect(url_for("login"))
 
-        selected_week = request.args.get("week")
-        if selected_week not in WEEK_MAP:
-            selected_week = list(WEEK_MAP.keys())[0]
-
-        (
-            cur_uv,
-            cur_pv,
-            df_daily,
-            df_weekly,
-            df_traffic_curr,
-            df_traffic_last,
-            df_region_curr,
-            df_region_last,
-            df_age_curr,
-            df_age_last,
-            df_gender_curr,
-            df_gender_last,
-            df_top10,
-            _df_raw_all,
-            new_ratio,
-            search_ratio,
-            active_article_count,
-            df_top10_sources,
-            published_article_count,
-            df_all_articles_with_metadata,
-        ) = data.load_all_dashboard_data(selected_week)
-
-        writers_df = data.get_writers_df_real(df_all_articles_with_metadata)
+        selected_period, selected_label, period_text = period_from_request()
+        selected_site = site_from_request()
 
-        return render_template(
-            "print.html",
-            css=config.CSS,
-            print_css=config.PRINT_CSS,
-            now=datetime.now(),
-            week_map=WEEK_MAP,
-            selected_week=selected_week,
-            period=WEEK_MAP[selected_week],
-            cur_uv=cur_uv,
-            cur_pv=cur_pv,
-            new_ratio=new_ratio,
-            search_ratio=search_ratio,
-            active_article_count=active_article_count,
-            published_article_count=published_article_count,
-            df_daily=df_daily,
-            df_weekly=df_weekly,
-            df_traffic_curr=df_traffic_curr,
-            df_traffic_last=df_traffic_last,
-            df_region_curr=df_region_curr,
-            df_region_last=df_region_last,
-            df_age_curr=df_age_curr,
-            df_age_last=df_age_last,
-            df_gender_curr=df_gender_curr,
-            df_gender_last=df_gender_last,
-            df_top10=df_top10,
-            df_top10_sources=df_top10_sources,
-            writers_df=writers_df,
+        report = load_with_trace(selected_period, selected_site)
+        return render_template("print.html", **report_context(report, selected_period, selected_label, period_text, selected_site))
+
+    @app.get("/group")
+    def group_overview():
+        if not session.get("password_correct"):
+            return redirect(url_for("login"))
+        import data
+
+        selected_period, _, period_text = period_from_request()
+        args = selected_period if isinstance(selected_period, tuple) else (selected_period, None)
+        with perf.trace("그룹 " + " ~ ".join(a for a in args if a)):
+            _, df_overview = data.load_group_overview(*args)
+        if request.args.get("format") == "json":
+            return jsonify(df_overview.to_dict(orient="records"))
+        table = df_overview.to_html(index=False, classes="group-table", border=0, float_format=lambda v: f"{v:,.1f}")
+        return render_template_string(GROUP_TEMPLATE, css=config.CSS, period=period_text, table=table)
+
+    @app.get("/export/<period>.xlsx", defaults={"fmt": "xlsx"})
+    @app.get("/export/<period>.csv.zip", defaults={"fmt": "csv.zip"})
+    def export_report(period, fmt):
+        """보고서 섹션별 내려받기: /export/<기간 키>.xlsx, /export/<기간 키>.csv.zip (?end=YYYY-MM-DD 로 사용자 지정 기간)
+
+        캐시된 보고서를 행 묶음 단위로 바로 써서 내보내는 스트리밍 응답 (기간이 길어도 메모리 일정)
+        """
+        if not session.get("password_correct"):
+            return redirect(url_for("login"))
+        import export
+
+        end = request.args.get("end") or None
+        try:
+            _, s_dt, _ = resolve_period(period, end)
+        except (KeyError, ValueError, TypeError):
+            return Response("알 수 없는 기간입니다.", status=404, content_type="text/plain; charset=utf-8")
+        # 주간 키는 일요일로 정규화된 값으로 캐시를 공유 (대시보드와 같은 규칙)
+        key = (period, end) if end else (s_dt if len(period) == 10 else period)
+        site = site_from_request()
+        report = load_with_trace(key, site)
+        return Response(
+            export.stream(report, fmt),
+            mimetype=export.MIME[fmt],
+            headers={"Content-Disposition": f'attachment; filename="{export.filename(key, fmt, site)}"'},
         )
 
+    @app.get("/live")
+    def live_snapshot():
+        """실시간 모드 JSON: 마지막 폴링 후 live.POLL_SECONDS가 지났을 때만 GA4 Realtime 재조회"""
+        if not session.get("password_correct"):
+            return redirect(url_for("login"))
+        import live
+
+        window = live.get_window(site_from_request())
+        window.refresh()
+        snap = window.snapshot(top_n=request.args.get("n", default=live.TOP_N, type=int))
+        snap["top"] = snap.pop("df_top").to_dict(orient="records")
+        df_minutes = snap.pop("df_minutes")
+        snap["minutes"] = [{"time": t.strftime("%H:%M"), "pv": int(v)} for t, v in zip(df_minutes["시각"], df_minutes["조회수"])]
+        return jsonify(snap)
+
+    @app.get("/admin/perf")
+    def admin_perf():
+        if not session.get("password_correct"):
+            return redirect(url_for("login"))
+
+        n = request.args.get("n", default=perf.MAX_TRACES, type=int)
+        traces = perf.recent_traces(n)
+        if request.args.get("format") == "json":
+            return jsonify(traces)
+        for t in traces:
+            t["summary"] = perf.summarize(t)
+        return render_template_string(PERF_TEMPLATE, css=config.CSS, traces=traces)
+
     return app
 
 
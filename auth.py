@@ -2,8 +2,6 @@
 import streamlit as st
 import json
 import os
-from google.oauth2 import service_account 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
 
 def check_password():
     """비밀번호 입력 및 검증"""
@@ -42,6 +40,9 @@ def check_password():
 @st.cache_resource
 def get_ga4_client():
     """GA4 클라이언트 생성 (캐싱 적용)"""
+    # GA4 클라이언트 라이브러리는 무거우므로 첫 사용 시점에 임포트 (로그인 화면 지연 방지)
+    from google.oauth2 import service_account
+    from google.analytics.data_v1beta import BetaAnalyticsDataClient
     try:
         # 로컬 환경: JSON 파일에서 읽기
         json_path = "ga-key.json"
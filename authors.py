@@ -0,0 +1,118 @@
+# authors.py
+"""본명-필명 매핑 레지스트리
+
+매핑은 코드가 아니라 버전이 붙은 파일(authors.json, 경로는 CNCNEWS_AUTHORS_FILE로 변경 가능)에서 읽는다.
+파일이 바뀌면(수정 시각 기준) 다음 조회 때 다시 읽으므로 매핑 변경에 배포가 필요 없다.
+
+- 항목마다 시작일/종료일(포함)을 둘 수 있어, 필명이 다른 기자에게 넘어가도 과거 보고서는 당시 매핑으로 집계된다.
+- 필명 -> 본명, 본명 -> 필명 목록은 dict 인덱스로 O(1) 조회하고, 날짜별 스냅샷은 한 번만 만든다.
+- real_names()는 필명 컬럼을 본명 Categorical(정수 코드)로 바꿔, 기자별 집계가 문자열 대신 코드로 묶이게 한다.
+"""
+import json
+import os
+import threading
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+PATH = os.environ.get("CNCNEWS_AUTHORS_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "authors.json"))
+
+_OPEN_START = date.min
+_OPEN_END = date.max
+
+
+def _to_date(value, default):
+    """'YYYY-MM-DD' / date / datetime / Timestamp -> date (없으면 default)"""
+    if value is None or value == "":
+        return default
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+class AuthorRegistry:
+    """기간별 본명-필명 매핑과 조회 인덱스"""
+
+    def __init__(self, entries, version=None):
+        self.version = version
+        self._by_pen = {}   # 필명 -> [(시작일, 종료일, 본명)]
+        self._by_real = {}  # 본명 -> [(시작일, 종료일, 필명)]
+        for item in entries:
+            start = _to_date(item.get("시작일"), _OPEN_START)
+            end = _to_date(item.get("종료일"), _OPEN_END)
+            self._by_pen.setdefault(item["필명"], []).append((start, end, item["본명"]))
+            self._by_real.setdefault(item["본명"], []).append((start, end, item["필명"]))
+        # 본명 범주 (등록 순서 유지) - 집계용 Categorical의 기본 범주
+        self.real_dtype = pd.CategoricalDtype(list(self._by_real))
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._by_pen)
+
+    def pen_to_real(self, on=None):
+        """on 날짜(기본 오늘)에 유효한 {필명: 본명} (날짜별로 한 번만 생성)"""
+        day = _to_date(on, None) or date.today()
+        snapshot = self._snapshots.get(day)
+        if snapshot is None:
+            snapshot = {pen: real for pen, spans in self._by_pen.items()
+                        for start, end, real in spans if start <= day <= end}
+            with self._lock:
+                if len(self._snapshots) > 64:
+                    self._snapshots.clear()
+                self._snapshots[day] = snapshot
+        return snapshot
+
+    def real_name(self, pen, on=None):
+        """필명의 본명 (매핑이 없으면 필명 그대로)"""
+        return self.pen_to_real(on).get(pen, pen)
+
+    def pens(self, real, on=None):
+        """본명에 연결된 필명 목록 (on을 주면 그 날짜에 유효한 것만)"""
+        spans = self._by_real.get(real, [])
+        if on is None:
+            return list(dict.fromkeys(pen for _, _, pen in spans))
+        day = _to_date(on, None)
+        return [pen for start, end, pen in spans if start <= day <= end]
+
+    def real_names(self, pens, on=None):
+        """필명 컬럼(또는 필명 Categorical) -> 본명 Categorical
+
+        필명 범주(고유값)만 조회한 뒤 정수 코드로 옮긴다. 매핑 없는 필명은 그대로 본명 범주에 추가.
+        """
+        pens = pens if isinstance(pens, pd.Categorical) else pd.Categorical(pens)
+        mapping = self.pen_to_real(on)
+        reals = [mapping.get(pen, pen) for pen in pens.categories]
+        extra = [r for r in dict.fromkeys(reals) if r not in self._by_real]
+        dtype = pd.CategoricalDtype(list(self.real_dtype.categories) + extra) if extra else self.real_dtype
+        lookup = np.append(dtype.categories.get_indexer(reals), -1)  # 코드 -1(결측)은 마지막 칸(-1)으로
+        return pd.Categorical.from_codes(lookup[pens.codes], dtype=dtype)
+
+def load(path=None):
+    """매핑 파일에서 레지스트리 생성"""
+    with open(path or PATH, encoding="utf-8") as f:
+        doc = json.load(f)
+    return AuthorRegistry(doc.get("authors", []), version=doc.get("version"))
+
+
+_registry = None
+_registry_mtime = None
+_load_lock = threading.Lock()
+
+
+def registry():
+    """현재 레지스트리 (파일이 바뀌었으면 다시 읽음, 파일이 없으면 빈 매핑)"""
+    global _registry, _registry_mtime
+    try:
+        mtime = os.stat(PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _registry is None or mtime != _registry_mtime:
+        with _load_lock:
+            if _registry is None or mtime != _registry_mtime:
+                _registry = load() if mtime is not None else AuthorRegistry([])
+                _registry_mtime = mtime
+    return _registry
@@ -0,0 +1,666 @@
+# bench.py
+"""주간 보고서 파이프라인 벤치마크 (독립 실행형)
+
+GA4와 쿡앤셰프 사이트를 로컬 대역(stand-in)으로 교체한 뒤 각 단계를 측정하고
+결과를 JSON으로 저장한다. 커밋 간 회귀 비교는 --compare 옵션으로 한다.
+
+    python bench.py --output bench_results.json
+    python bench.py --only load,decode --repeat 5
+    python bench.py --compare bench_results_old.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 벤치마크 중에는 streamlit bare 모드 경고를 숨김 (streamlit 임포트 전에 설정)
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+# 운영 팩트 DB를 건드리지 않도록 임시 경로 사용 (facts 임포트 전에 설정)
+os.environ.setdefault("CNCNEWS_FACTS_DB", os.path.join(tempfile.gettempdir(), "cncnews_bench_facts.sqlite"))
+os.environ.setdefault("CNCNEWS_CRAWL_DB", os.path.join(tempfile.gettempdir(), "cncnews_bench_crawl.sqlite"))
+
+import anomaly
+import config
+import crawlcache
+import data
+import export
+import parsing
+import facts
+import normalize
+import utils
+import views
+
+# -----------------------------------------------------------------------------
+# [대역] GA4 / 사이트
+# -----------------------------------------------------------------------------
+SOURCES = ["naver", "m.search.naver.com", "google", "daum.net", "(direct)", "facebook.com", "bing", "newsletter"]
+REGIONS = ["Seoul", "Gyeonggi-do", "Incheon", "Busan", "Daegu", "Jeju-do", "(not set)"]
+AGES = ["18-24", "25-34", "35-44", "45-54", "55-64", "65+", "unknown"]
+GENDERS = ["male", "female", "unknown"]
+AUTHORS = ["오영호", "허세인", "박하늘", "이준민", "홍지우", "김세온", "조서율", "오요리", "김철호", "정영"]
+CATEGORIES = [("푸드이슈", "트렌드"), ("셰프", "인터뷰"), ("레시피", "한식"), ("외식", "창업"), ("뉴스", "이슈")]
+
+
+def article_path(idx):
+    return f"/news/articleView.html?idxno={idx}"
+
+
+class FakeGA4Client:
+    """RunReportRequest의 차원 구성에 맞춰 결정적인 응답 행을 생성"""
+
+    FACT_SOURCES = 4
+    LIVE_LAG_MINUTES = 180
+
+    def __init__(self, n_articles=2000, latency=0.0):
+        self.n_articles = n_articles
+        self.latency = latency
+        self.calls = 0
+
+    def _dimension_rows(self, request):
+        dims = [d.name for d in request.dimensions]
+        start = datetime.strptime(request.date_ranges[0].start_date, "%Y-%m-%d")
+        end = datetime.strptime(request.date_ranges[0].end_date, "%Y-%m-%d")
+        if not dims:
+            return [[]]
+        if dims == ["date"]:
+            n_days = (end - start).days + 1
+            return [[(start + timedelta(days=i)).strftime("%Y%m%d")] for i in range(n_days)]
+        if dims == ["yearWeek"]:
+            n_days = (end - start).days + 1
+            return [[w] for w in dict.fromkeys(utils.ga4_year_week(start + timedelta(days=i)) for i in range(n_days))]
+        if dims == ["pageTitle"]:
+            return [[f"기사 제목 {i}"] for i in range(self.n_articles)]
+        if dims == ["dateHourMinute"]:
+            # 오늘 분별 조회수, runReport 집계 지연(LIVE_LAG_MINUTES)만큼 최근 분은 아직 없음
+            until = min(end + timedelta(days=1), datetime.now() - timedelta(minutes=self.LIVE_LAG_MINUTES))
+            n_minutes = max(0, int((until - start).total_seconds() // 60))
+            return [[(start + timedelta(minutes=i)).strftime("%Y%m%d%H%M")] for i in range(n_minutes)]
+        if dims == ["sessionSource"]:
+            return [[s] for s in SOURCES]
+        if dims == ["region"]:
+            return [[r] for r in REGIONS]
+        if dims == ["userAgeBracket"]:
+            return [[a] for a in AGES]
+        if dims == ["userGender"]:
+            return [[g] for g in GENDERS]
+        if dims == ["pageTitle", "pagePath"]:
+            rows = [[f"기사 제목 {i}", article_path(i)] for i in range(self.n_articles)]
+            rows.append(["쿡앤셰프 - Cook&Chef", "/"])
+            rows.append(["쿡앤셰프 전체기사", "/news/cate/"])
+            return rows
+        if dims == ["date", "pagePath", "pageTitle", "sessionSource"]:
+            # 기사당 상위 유입경로 FACT_SOURCES개 + 사이트 메인/목록 페이지
+            rows = []
+            for i in range((end - start).days + 1):
+                day = (start + timedelta(days=i)).strftime("%Y%m%d")
+                for idx in range(self.n_articles):
+                    for src in SOURCES[:self.FACT_SOURCES]:
+                        rows.append([day, article_path(idx), f"기사 제목 {idx}", src])
+                for src in SOURCES:
+                    rows.append([day, "/", "쿡앤셰프 - Cook&Chef", src])
+            return rows
+        if dims == ["pagePath", "sessionSource"]:
+            values = list(request.dimension_filter.filter.in_list_filter.values)
+            return [[p, s] for p in values for s in SOURCES]
+        if dims == ["pagePath", "date"]:
+            values = list(request.dimension_filter.filter.in_list_filter.values)
+            return [[p, (start + timedelta(days=i)).strftime("%Y%m%d")] for p in values for i in range((end - start).days + 1)]
+        return [["(not set)"] * len(dims)]
+
+    def _matches(self, expr, row):
+        """FilterExpression(and_group/not_expression/string_filter/in_list_filter) 평가"""
+        which = type(expr).pb(expr).WhichOneof("expr")
+        if which is None:
+            return True
+        if which == "and_group":
+            return all(self._matches(e, row) for e in expr.and_group.expressions)
+        if which == "or_group":
+            return any(self._matches(e, row) for e in expr.or_group.expressions)
+        if which == "not_expression":
+            return not self._matches(expr.not_expression, row)
+        f = expr.filter
+        value = row.get(f.field_name, "")
+        if type(f).pb(f).WhichOneof("one_filter") == "in_list_filter":
+            return value in list(f.in_list_filter.values)
+        sf = f.string_filter
+        target = sf.value if sf.case_sensitive else sf.value.lower()
+        value = value if sf.case_sensitive else value.lower()
+        match_type = sf.MatchType(sf.match_type).name
+        if match_type == "FULL_REGEXP":
+            return re.fullmatch(target, value) is not None
+        if match_type == "PARTIAL_REGEXP":
+            return re.search(target, value) is not None
+        if match_type == "BEGINS_WITH":
+            return value.startswith(target)
+        if match_type == "ENDS_WITH":
+            return value.endswith(target)
+        if match_type == "EXACT":
+            return value == target
+        return target in value
+
+    def run_report(self, request):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        metrics = [m.name for m in request.metrics]
+        rows = self._dimension_rows(request)
+        dims = [d.name for d in request.dimensions]
+        rows = [r for r in rows if self._matches(request.dimension_filter, dict(zip(dims, r)))]
+        if request.offset:
+            rows = rows[request.offset:]
+        if request.limit:
+            rows = rows[:request.limit]
+        return SimpleNamespace(rows=[fake_row(dims, metrics, i) for i, dims in enumerate(rows)])
+
+    def run_realtime_report(self, request):
+        """최근 30분 minutesAgo × unifiedScreenName (상위 50개 기사), 차원이 없으면 합계 1행"""
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        metrics = [m.name for m in request.metrics]
+        dims = [d.name for d in request.dimensions]
+        if not dims:
+            rows = [[]]
+        else:
+            rows = [[f"{m:02d}", f"기사 제목 {i}"] for m in range(30) for i in range(min(self.n_articles, 50))]
+            rows = [r[:len(dims)] for r in rows]
+        if request.limit:
+            rows = rows[:request.limit]
+        return SimpleNamespace(rows=[fake_row(r, metrics, i % 50) for i, r in enumerate(rows)])
+
+
+def fake_row(dim_values, metrics, i):
+    metric_values = []
+    for m in metrics:
+        if m == "bounceRate":
+            val = f"{0.3 + (i % 50) / 100:.4f}"
+        elif m == "userEngagementDuration":
+            val = str(30 + i % 300)
+        elif m == "engagedSessions":
+            val = str(max(1, 100000 // (i + 1)) // 2)
+        else:
+            val = str(max(1, 100000 // (i + 1)))
+        metric_values.append(SimpleNamespace(value=val))
+    return SimpleNamespace(
+        dimension_values=[SimpleNamespace(value=v) for v in dim_values],
+        metric_values=metric_values,
+    )
+
+
+def fake_response(n_rows, dims=("pageTitle", "pagePath"), metrics=("screenPageViews", "activeUsers", "newUsers", "userEngagementDuration", "bounceRate")):
+    rows = [fake_row([f"기사 제목 {i}", article_path(i)][:len(dims)], list(metrics), i) for i in range(n_rows)]
+    return SimpleNamespace(rows=rows)
+
+
+class FakeSite:
+    """cooknchefnews.com 목록/기사 페이지를 흉내내는 requests.get 대역 (ETag 조건부 요청 지원)"""
+
+    def __init__(self, week_start, n_published=150, per_page=20, latency=0.0, sitemap=False):
+        self.week_start = week_start
+        self.n_published = n_published
+        self.per_page = per_page
+        self.latency = latency
+        self.sitemap = sitemap
+        self.calls = 0
+        self.not_modified = 0
+
+    def published_date(self, idx):
+        # idx가 작을수록 최신 기사. n_published 이후는 지난 기사
+        if idx < self.n_published:
+            return self.week_start + timedelta(days=6 - (idx % 7))
+        return self.week_start - timedelta(days=1 + (idx - self.n_published) // self.per_page)
+
+    def list_page(self, page_num):
+        first = (page_num - 1) * self.per_page
+        items = []
+        for idx in range(first, first + self.per_page):
+            items.append(
+                f'<dl><dt><a href="{article_path(idx)}">기사 제목 {idx}</a></dt>'
+                f'<dd class="winfo"><span class="date">{self.published_date(idx).strftime("%Y.%m.%d")}</span></dd></dl>'
+            )
+        return "<html><body>" + "".join(items) + "</body></html>"
+
+    def article_page(self, idx):
+        author = AUTHORS[idx % len(AUTHORS)]
+        cat, subcat = CATEGORIES[idx % len(CATEGORIES)]
+        pub = self.published_date(idx).strftime("%Y-%m-%d")
+        return (
+            "<html><body>"
+            f'<div class="naviLink">Home &gt; {cat} &gt; {subcat}</div>'
+            f'<div class="viewTitle"><h3>기사 제목 {idx}</h3><dl><dd>{author} 기자 {author}@cooknchefnews.com / 기사승인 : {pub} 10:{idx % 60:02d}</dd></dl></div>'
+            + "<p>본문 단락입니다. " * 1500 + "</p>"
+            f'<span class="sns-like-count">{idx % 17}</span><span class="comment-count">{idx % 5}</span>'
+            "</body></html>"
+        )
+
+    def sitemap_xml(self, n_days=60):
+        """최근 n_days일 기사를 담은 Google News 형식 사이트맵 (sitemap=True일 때만 제공)"""
+        items = []
+        idx = 0
+        while (self.week_start - self.published_date(idx)).days < n_days:
+            items.append(
+                f"<url><loc>http://www.cooknchefnews.com{article_path(idx)}</loc>"
+                f"<news:news><news:publication_date>{self.published_date(idx).strftime('%Y-%m-%d')}T10:{idx % 60:02d}:00+09:00</news:publication_date></news:news></url>"
+            )
+            idx += 1
+        return ('<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+                'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">' + "".join(items) + "</urlset>")
+
+    def html_for(self, url):
+        if url.endswith("/sitemap.xml"):
+            return self.sitemap_xml() if self.sitemap else None
+        if "pagenum=" in url:
+            return self.list_page(int(url.split("pagenum=")[1]))
+        if "idxno=" in url:
+            return self.article_page(int(url.split("idxno=")[1]))
+        return "<html></html>"
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        text = self.html_for(url)
+        if text is None:
+            return SimpleNamespace(text="", content=b"", encoding="utf-8", apparent_encoding="utf-8", status_code=404, headers={})
+        etag = f'"{hash(text) & 0xffffffff:08x}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            self.not_modified += 1
+            return SimpleNamespace(text="", encoding="utf-8", apparent_encoding="utf-8", status_code=304, headers={"ETag": etag})
+        return SimpleNamespace(text=text, content=text.encode("utf-8"), encoding="utf-8", apparent_encoding="utf-8", status_code=200, headers={"ETag": etag})
+
+
+# -----------------------------------------------------------------------------
+# [측정] 공통 헬퍼
+# -----------------------------------------------------------------------------
+def measure(fn, repeat=3, setup=None):
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return {
+        "runs": runs,
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+    }
+
+
+def clear_caches():
+    facts.clear()
+    crawlcache.clear()
+    clear_streamlit_caches()
+
+
+def clear_streamlit_caches():
+    data.load_all_dashboard_data.clear()
+    data.crawl_single_article_cached.clear()
+    data.crawl_article_list_page.clear()
+    data.crawl_feed.clear()
+
+
+def first_week():
+    key = utils.recent_weeks(2)[1]  # 지난 주(완결 주차)
+    return key, datetime.strptime(key, "%Y-%m-%d")
+
+
+# -----------------------------------------------------------------------------
+# [벤치마크 케이스]
+# -----------------------------------------------------------------------------
+def bench_load(args, results):
+    label, start = first_week()
+    client = FakeGA4Client(n_articles=args.articles, latency=args.ga4_latency)
+    site = FakeSite(start, n_published=args.published, latency=args.site_latency)
+    with mock.patch.object(data, "get_ga4_client", return_value=client), \
+         mock.patch("requests.get", side_effect=site.get):
+        cold = measure(lambda: data.load_all_dashboard_data(label), repeat=args.repeat, setup=clear_caches)
+        cold.update(ga4_calls=client.calls // args.repeat, site_calls=site.calls // args.repeat)
+        results.append({"name": "load_all_dashboard_data.cold", "params": {"articles": args.articles, "published": args.published}, **cold})
+
+        # 보고서 캐시만 만료된 상황: 팩트 테이블과 크롤링 캐시는 유지
+        calls_before = client.calls
+        refresh = measure(lambda: data.load_all_dashboard_data(label), repeat=args.repeat, setup=data.load_all_dashboard_data.clear)
+        refresh.update(ga4_calls=(client.calls - calls_before) // args.repeat)
+        results.append({"name": "load_all_dashboard_data.facts_warm", "params": {"articles": args.articles, "published": args.published}, **refresh})
+
+        # 크롤링 캐시(st.cache_data)까지 만료된 상황: 저장된 검증자로 조건부 GET (304면 파싱 생략)
+        not_modified_before = site.not_modified
+        revalidate = measure(lambda: data.load_all_dashboard_data(label), repeat=args.repeat, setup=clear_streamlit_caches)
+        revalidate.update(not_modified=(site.not_modified - not_modified_before) // args.repeat)
+        results.append({"name": "load_all_dashboard_data.crawl_revalidate", "params": {"articles": args.articles, "published": args.published}, **revalidate})
+
+        data.load_all_dashboard_data(label)
+        warm = measure(lambda: data.load_all_dashboard_data(label), repeat=args.repeat)
+        results.append({"name": "load_all_dashboard_data.warm", "params": {"articles": args.articles, "published": args.published}, **warm})
+
+    # 발행 기사 목록: 목록 페이지 크롤링 vs 사이트맵 (크롤링 캐시 없이 목록 단계만)
+    e_dt = (start + timedelta(days=6)).strftime("%Y-%m-%d")
+    for use_sitemap in (False, True):
+        site = FakeSite(start, n_published=args.published, latency=args.site_latency, sitemap=use_sitemap)
+        with mock.patch("requests.get", side_effect=site.get):
+            def setup():
+                crawlcache.clear()
+                clear_streamlit_caches()
+                data.crawl_feed.clear()
+            res = measure(lambda: data.discover_published(label, e_dt, 20), repeat=args.repeat, setup=setup)
+        res.update(site_calls=site.calls // args.repeat, found=len(data.discover_published(label, e_dt, 20)))
+        results.append({"name": "discover_published." + ("sitemap" if use_sitemap else "list"), "params": {"published": args.published}, **res})
+
+
+def bench_decode(args, results):
+    for n_rows in (1_000, 10_000, 100_000):
+        # 응답 생성 비용은 제외하고 디코딩만 측정
+        response = fake_response(n_rows)
+        client = SimpleNamespace(run_report=lambda request, r=response: r)
+        with mock.patch.object(data, "get_ga4_client", return_value=client):
+            res = measure(lambda: data.run_ga4_report(
+                "2026-01-01", "2026-01-07", ["pageTitle", "pagePath"],
+                ["screenPageViews", "activeUsers", "newUsers", "userEngagementDuration", "bounceRate"],
+                "screenPageViews", limit=None,
+            ), repeat=args.repeat)
+        results.append({"name": "run_ga4_report.decode", "params": {"rows": n_rows}, **res})
+
+
+def bench_extract(args, results):
+    _, start = first_week()
+    site = FakeSite(start)
+    article_html, list_html = site.article_page(7), site.list_page(1)
+    res = measure(lambda: parsing.parse_article_html(article_html), repeat=max(args.repeat, 10))
+    results.append({"name": "extract.article_page", "params": {"bytes": len(article_html)}, **res})
+    res = measure(lambda: parsing.parse_list_html(list_html), repeat=max(args.repeat, 10))
+    results.append({"name": "extract.list_page", "params": {"bytes": len(list_html)}, **res})
+
+
+def bench_crawl(args, results):
+    """기사 메타데이터 크롤링 fan-out (스레드 10개 내려받기 + 파싱 프로세스 1개 vs 코어 수)"""
+    _, start = first_week()
+    site = FakeSite(start, n_published=args.published, latency=args.site_latency)
+    paths = [article_path(i) for i in range(args.published)]
+
+    def run():
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(data.fetch_article_meta, paths))
+
+    def setup():
+        crawlcache.clear()
+        data.crawl_single_article_cached.clear()
+
+    for workers in sorted({1, os.cpu_count() or 1, args.parse_workers or 1}):
+        with mock.patch("requests.get", side_effect=site.get), mock.patch.object(config, "CRAWL_PARSE_WORKERS", workers):
+            data.shutdown_parse_pool()
+            if workers > 1:
+                data.parse_html(parsing.parse_list_html, "")  # 작업자 기동 시간은 제외
+            res = measure(run, repeat=args.repeat, setup=setup)
+            data.shutdown_parse_pool()
+        results.append({"name": "crawl.article_fanout", "params": {"articles": len(paths), "parse_workers": workers, "cpus": os.cpu_count()}, **res})
+
+
+def synthetic_articles(n):
+    rng = np.random.default_rng(0)
+    cats = [CATEGORIES[i % len(CATEGORIES)] for i in range(n)]
+    return pd.DataFrame({
+        "제목": [f"기사 제목 {i}" for i in range(n)],
+        "경로": [article_path(i) for i in range(n)],
+        "전체조회수": rng.integers(1, 5000, n),
+        "전체방문자수": rng.integers(1, 3000, n),
+        "newUsers": rng.integers(0, 1000, n),
+        "평균체류시간": rng.integers(0, 600, n),
+        "이탈률": rng.random(n),
+        "작성자": [AUTHORS[i % len(AUTHORS)] for i in range(n)],
+        "좋아요": rng.integers(0, 30, n),
+        "댓글": rng.integers(0, 10, n),
+        "카테고리": [c[0] for c in cats],
+        "세부카테고리": [c[1] for c in cats],
+        "실발행일시": ["2026-01-07 10:00"] * n,
+    })
+
+
+def bench_writers(args, results):
+    for n in (1_000, 10_000):
+        df = synthetic_articles(n)
+        res = measure(lambda: data.compute_writer_stats(df), repeat=args.repeat)
+        results.append({"name": "compute_writer_stats", "params": {"rows": n}, **res})
+
+
+def author_strings(n):
+    """크롤링 결과처럼 직함/공백/# 이 섞인 작성자 문자열 n개 (고유값은 수백 개)"""
+    forms = ["{} 기자", "{}기자", "편집인 {}", "{} 전문기자", "#{}", "{} 편집 a{}@cooknchefnews.com", "  {}  "]
+    return pd.Series([forms[i % len(forms)].format(AUTHORS[i % len(AUTHORS)], i % 37) for i in range(n)])
+
+
+def bench_normalize(args, results):
+    """작성자 이름 정규화: 행마다 apply (메모 없음) vs 고유값만 정규화하는 컬럼 API (메모 비움)"""
+    for n in (10_000,):
+        authors = author_strings(n)
+        cases = {
+            "apply": lambda: authors.apply(normalize.author_name.__wrapped__),
+            "author_names": lambda: normalize.author_names(authors),
+        }
+        for name, fn in cases.items():
+            res = measure(fn, repeat=args.repeat, setup=normalize.author_name.cache_clear)
+            results.append({"name": f"normalize.{name}", "params": {"rows": n, "unique": authors.nunique()}, **res})
+
+
+def bench_anomaly(args, results):
+    """1년치 일별 합계/유입경로별 조회수, 3년치 주간 합계에 대한 이상치 계산"""
+    rng = np.random.default_rng(0)
+    days = pd.date_range(end=datetime.now().date(), periods=365).strftime("%Y-%m-%d")
+    weekday = np.tile([1.0, 1.1, 1.05, 1.0, 0.95, 0.7, 0.6], 53)[:365]
+    df_days = pd.DataFrame({"date": days, "UV": (5000 * weekday * rng.lognormal(0, 0.1, 365)).astype(int)})
+    df_days["PV"] = df_days["UV"] * 3
+    df_src = pd.DataFrame([(d, src, int(v)) for i, d in enumerate(days) for src, v in zip(SOURCES, rng.poisson(1000 * weekday[i], len(SOURCES)))],
+                          columns=["date", "유입경로", "조회수"])
+    df_weeks = pd.DataFrame({"UV": rng.poisson(30000, 156), "PV": rng.poisson(90000, 156)})
+    cases = {
+        "daily": lambda: anomaly.annotate_daily(df_days, days[-7]),
+        "sources": lambda: anomaly.source_period_scores(df_src, days[-7], days[-1]),
+        "weekly": lambda: anomaly.annotate_weekly(df_weeks),
+        "writers": lambda: anomaly.annotate_groups(data.get_writers_df_real(synthetic_articles(1_000)), "평균조회수"),
+    }
+    for name, fn in cases.items():
+        res = measure(fn, repeat=args.repeat)
+        results.append({"name": f"anomaly.{name}", "params": {"days": len(days)}, **res})
+
+
+def bench_views(args, results):
+    label, start = first_week()
+    client = FakeGA4Client(n_articles=args.articles)
+    site = FakeSite(start, n_published=args.published)
+    with mock.patch.object(data, "get_ga4_client", return_value=client), \
+         mock.patch("requests.get", side_effect=site.get):
+        clear_caches()
+        (cur_uv, cur_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last,
+         df_region_curr, df_region_last, df_age_curr, df_age_last, df_gender_curr, df_gender_last,
+         df_top10, df_raw_all, new_ratio, search_ratio, active_article_count, df_top10_sources,
+         published_article_count, df_all_articles_with_metadata, df_top10_daily, writer_stats) = data.load_all_dashboard_data(label)
+
+        cases = {
+            "render_summary": lambda: views.render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count),
+            "render_traffic": lambda: views.render_traffic(df_traffic_curr, df_traffic_last),
+            "render_demo_region": lambda: views.render_demo_region(df_region_curr, df_region_last),
+            "render_demo_age_gender": lambda: views.render_demo_age_gender(df_age_curr, df_age_last, df_gender_curr, df_gender_last),
+            "render_top10_detail": lambda: views.render_top10_detail(df_top10),
+            "render_top10_trends": lambda: views.render_top10_trends(df_top10, df_top10_sources, df_top10_daily),
+            # selected_week 없이 호출하면 전주 크롤링을 건너뛰므로 렌더링 비용만 측정됨
+            "render_category": lambda: views.render_category(df_all_articles_with_metadata),
+            "render_writer_integrated": lambda: views.render_writer_integrated(writer_stats),
+        }
+        for name, fn in cases.items():
+            res = measure(fn, repeat=args.repeat)
+            results.append({"name": f"views.{name}", "params": {"articles": len(df_all_articles_with_metadata)}, **res})
+
+
+def report_memory(report):
+    """보고서 튜플 안 DataFrame의 deep 메모리 합계와 pickle 크기 (st.cache_data 1개 항목 기준)"""
+    import pickle
+    frames = [v for v in report if isinstance(v, pd.DataFrame)]
+    return {
+        "deep_bytes": int(sum(df.memory_usage(deep=True).sum() for df in frames)),
+        "pickle_bytes": len(pickle.dumps(report, protocol=pickle.HIGHEST_PROTOCOL)),
+    }
+
+
+def bench_memory(args, results):
+    import tracemalloc
+    label, start = first_week()
+    client = FakeGA4Client(n_articles=args.articles)
+    site = FakeSite(start, n_published=args.published)
+    with mock.patch.object(data, "get_ga4_client", return_value=client), \
+         mock.patch("requests.get", side_effect=site.get):
+        clear_caches()
+        tracemalloc.start()
+        report = data.load_all_dashboard_data(label)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    params = {"articles": args.articles, "published": args.published}
+    mem = report_memory(report)
+    for key, value in (("deep_bytes", mem["deep_bytes"]), ("pickle_bytes", mem["pickle_bytes"]), ("load_peak_bytes", peak)):
+        results.append({"name": f"memory.{key}", "params": params, "unit": "bytes",
+                        "runs": [value], "min": value, "median": value, "mean": value})
+
+
+def bench_export(args, results):
+    """보고서 내려받기 스트림: 발행기사 행 수를 늘려도 최대 메모리가 일정한지 (출력 크기 대비)"""
+    import tracemalloc
+    empty = pd.DataFrame()
+    for n in (20_000, 200_000):
+        articles = synthetic_articles(n).astype({"작성자": "category"})
+        report = data.DashboardReport(0, 0, *[empty] * 10, empty, empty, 0, 0, 0, empty, 0, articles, empty,
+                                      data.compute_writer_stats(articles))
+        for fmt in ("xlsx", "csv.zip"):
+            res = measure(lambda: sum(len(chunk) for chunk in export.stream(report, fmt)), repeat=args.repeat)
+            results.append({"name": f"export.{fmt}", "params": {"rows": n}, **res})
+            tracemalloc.start()
+            size = sum(len(chunk) for chunk in export.stream(report, fmt))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            for key, value in (("output_bytes", size), ("peak_bytes", peak)):
+                results.append({"name": f"export.{fmt}.{key}", "params": {"rows": n}, "unit": "bytes",
+                                "runs": [value], "min": value, "median": value, "mean": value})
+
+
+def import_time_us(module):
+    """새 인터프리터에서 python -X importtime으로 측정한 모듈 누적 임포트 시간(us)"""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+        env={**os.environ, "STREAMLIT_LOGGER_LEVEL": "error"},
+    ).stderr
+    cumulative = None
+    for line in out.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1])
+    return cumulative
+
+
+def bench_imports(args, results):
+    # auth: 로그인 화면 경로, app_flask: 워커 부팅, data/views: 첫 대시보드 로드
+    for module in ("auth", "app_flask", "data", "views"):
+        runs = [import_time_us(module) / 1e6 for _ in range(args.repeat)]
+        results.append({"name": "import", "params": {"module": module}, "runs": runs,
+                        "min": min(runs), "median": statistics.median(runs), "mean": statistics.fmean(runs)})
+
+
+CASES = {
+    "imports": bench_imports,
+    "load": bench_load,
+    "decode": bench_decode,
+    "extract": bench_extract,
+    "crawl": bench_crawl,
+    "writers": bench_writers,
+    "normalize": bench_normalize,
+    "anomaly": bench_anomaly,
+    "memory": bench_memory,
+    "export": bench_export,
+    "views": bench_views,
+}
+
+
+# -----------------------------------------------------------------------------
+# [출력] JSON 저장 및 비교
+# -----------------------------------------------------------------------------
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), text=True).strip()
+    except Exception:
+        return None
+
+
+def result_key(r):
+    return r["name"] + json.dumps(r.get("params", {}), sort_keys=True)
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+    print(f"\n{'case':<48}{'base':>12}{'now':>12}{'ratio':>8}  (ms, bytes 항목은 KiB)")
+    for r in results:
+        b = baseline.get(result_key(r))
+        if not b:
+            continue
+        ratio = r["median"] / b["median"] if b["median"] else float("nan")
+        label = r["name"] + (f" {r['params']}" if r.get("params") else "")
+        scale = 1 / 1024 if r.get("unit") == "bytes" else 1000
+        print(f"{label[:47]:<48}{b['median'] * scale:>12.2f}{r['median'] * scale:>12.2f}{ratio:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쿡앤셰프 주간 보고서 파이프라인 벤치마크")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--only", default=",".join(CASES), help="실행할 케이스 (쉼표 구분): " + ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--articles", type=int, default=2000, help="GA4 대역이 반환할 기사 수")
+    parser.add_argument("--published", type=int, default=150, help="해당 주차 발행 기사 수")
+    parser.add_argument("--ga4-latency", type=float, default=0.0, help="GA4 호출당 지연(초)")
+    parser.add_argument("--site-latency", type=float, default=0.0, help="사이트 요청당 지연(초)")
+    parser.add_argument("--parse-workers", type=int, default=0, help="crawl 케이스에 추가로 측정할 파싱 프로세스 수")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in [n.strip() for n in args.only.split(",") if n.strip()]:
+        t0 = time.perf_counter()
+        CASES[name](args, results)
+        print(f"[{name}] {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+    payload = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    for r in results:
+        label = r["name"] + (f" {r['params']}" if r.get("params") else "")
+        if r.get("unit") == "bytes":
+            print(f"{label:<70}{r['median'] / 1024:>10.1f} KiB")
+        else:
+            print(f"{label:<70}{r['median'] * 1000:>10.2f} ms")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,28 @@
 # config.py
 # ----------------- 설정 및 스타일 정의 -----------------
+import os
 
 # GA4 속성 ID
 PROPERTY_ID = "370663478"
 
+# 사이트(GA4 속성) 목록 - 자매 사이트는 항목을 추가하면 사이트 선택/그룹 현황에 나타남
+#   property_id: GA4 속성 ID, base_url: 기사 목록/본문 크롤링 주소 (끝에 / 없이)
+SITES = {
+    "cncnews": {"name": "쿡앤셰프", "property_id": PROPERTY_ID, "base_url": "http://www.cooknchefnews.com"},
+}
+DEFAULT_SITE = "cncnews"
+
+# GA4 동시 요청 상한 (GA4 Data API 쿼터: 속성당 동시 요청 10건). 전체 상한은 모든 속성 합계
+GA4_MAX_CONCURRENT_PER_PROPERTY = 10
+GA4_MAX_CONCURRENT_TOTAL = 16
+
+# 기사 사이트 크롤링 차단기: 연속 실패 CRAWL_FAILURE_THRESHOLD회면 CRAWL_RESET_SECONDS초 동안 요청하지 않음
+CRAWL_FAILURE_THRESHOLD = 3
+CRAWL_RESET_SECONDS = 60
+
+# 기사 HTML 파싱 프로세스 수 (1이면 크롤링 스레드에서 직접 파싱)
+CRAWL_PARSE_WORKERS = int(os.getenv("CNCNEWS_PARSE_WORKERS", os.cpu_count() or 1))
+
 # 색상 팔레트
 COLOR_NAVY = "#1a237e"
 COLOR_RED = "#d32f2f"
@@ -0,0 +1,95 @@
+# crawlcache.py
+"""크롤링 결과와 HTTP 검증자(ETag / Last-Modified) 저장소
+
+st.cache_data가 만료되어도 마지막 파싱 결과와 검증자를 SQLite에 남겨 두고,
+다음 요청을 If-None-Match / If-Modified-Since 조건부 GET으로 보낸다.
+304 응답이면 다시 내려받거나 파싱하지 않고 저장된 결과를 그대로 쓴다.
+사이트 장애(CrawlError) 때 돌려줄 마지막 성공 결과도 여기서 읽는다.
+
+- 키는 전체 URL (사이트 주소 포함)이므로 사이트별로 나누지 않는다.
+- 결과는 JSON으로 저장한다 (기사 메타데이터 튜플은 리스트로 저장되므로 읽는 쪽에서 변환).
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+DB_PATH = os.environ.get("CNCNEWS_CRAWL_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "crawl.sqlite"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    result TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    validated_at TEXT NOT NULL
+);
+"""
+
+_write_lock = threading.Lock()
+_ready = False
+
+
+def connect():
+    """스키마가 준비된 연결 (호출마다 새 연결)"""
+    global _ready
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    if not _ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _ready = True
+    return conn
+
+
+@contextmanager
+def _connection():
+    conn = connect()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def get(url):
+    """저장된 항목 dict(etag, last_modified, result) 또는 None"""
+    with _connection() as conn:
+        row = conn.execute("SELECT etag, last_modified, result FROM pages WHERE url = ?", (url,)).fetchone()
+    if row is None:
+        return None
+    return {"etag": row[0], "last_modified": row[1], "result": json.loads(row[2])}
+
+
+def conditional_headers(entry):
+    """저장된 검증자로 조건부 요청 헤더 구성 (없으면 빈 dict)"""
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def put(url, response_headers, result):
+    """파싱 결과와 응답 검증자 저장 (새로 내려받은 경우)"""
+    now = datetime.now().isoformat(timespec="seconds")
+    with _write_lock, _connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO pages (url, etag, last_modified, result, fetched_at, validated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (url, response_headers.get("ETag"), response_headers.get("Last-Modified"), json.dumps(result, ensure_ascii=False), now, now),
+        )
+
+
+def touch(url):
+    """304 응답: 결과는 그대로 두고 검증 시각만 갱신"""
+    with _write_lock, _connection() as conn:
+        conn.execute("UPDATE pages SET validated_at = ? WHERE url = ?", (datetime.now().isoformat(timespec="seconds"), url))
+
+
+def clear():
+    """저장된 크롤링 결과 전체 삭제 (벤치마크/재크롤링용)"""
+    with _write_lock, _connection() as conn:
+        conn.execute("DELETE FROM pages")
@@ -2,274 +2,709 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import requests
 import concurrent.futures
+import concurrent.futures.process
+import multiprocessing
 import re
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from google.analytics.data_v1beta.types import (
-    DateRange, Dimension, Metric, RunReportRequest, OrderBy, FilterExpression, Filter
-)
+# requests, bs4, google.analytics 타입은 임포트 비용이 커서 사용하는 함수 안에서 임포트함
 
 # 모듈 임포트
+import anomaly
+import authors
 import config
+import crawlcache
+import discovery
+import facts
+import parsing
+import perf
+import sites
 from auth import get_ga4_client
-from utils import WEEK_MAP, clean_author_name
-
-# -----------------------------------------------------------------------------
-# [설정] 본명-필명 매핑 데이터 (2025.12.31 기준)
-# -----------------------------------------------------------------------------
-AUTHOR_MAPPING_DATA = [
-    {"본명": "오영호", "필명": "오영호"},
-    {"본명": "이지헌", "필명": "이지헌"},
-    {"본명": "이정호", "필명": "이정호"},
-    {"본명": "김성은", "필명": "김성은"},
-    {"본명": "송자은", "필명": "송자은"},
-    {"본명": "허선", "필명": "허세인"},
-    {"본명": "박현우", "필명": "박하늘"},
-    {"본명": "이정호", "필명": "이준민"},
-    {"본명": "홍정민", "필명": "홍지우"},
-    {"본명": "김성은", "필명": "김세온"},
-    {"본명": "조소현", "필명": "조서율"},
-    {"본명": "송자은", "필명": "송채연"},
-    {"본명": "심세은", "필명": "심예린"},
-    {"본명": "정수연", "필명": "정서윤"},
-    {"본명": "서진영", "필명": "서현민"},
-    {"본명": "AI협력", "필명": "오요리"},
-    {"본명": "AI협력", "필명": "제조리"},
-    {"본명": "AI협력", "필명": "길라떼"},
-    {"본명": "이경엽", "필명": "김병일"},
-    {"본명": "이경엽", "필명": "노하빈"},
-    {"본명": "이경엽", "필명": "민혜경"},
-    {"본명": "이경엽", "필명": "이은지"},
-    {"본명": "이경엽", "필명": "이경엽"},
-    {"본명": "이경엽", "필명": "정영"},
-    {"본명": "조용수", "필명": "김철호"},
-    {"본명": "조용수", "필명": "마종수"},
-    {"본명": "조용수", "필명": "박노석"},
-    {"본명": "조용수", "필명": "안정미"},
-    {"본명": "조용수", "필명": "유성욱"},
-    {"본명": "조용수", "필명": "조용수"}
-]
-
-def run_ga4_report(start_date, end_date, dimensions, metrics, order_by_metric=None, limit=None, dimension_filter=None):
+from normalize import author_names
+from utils import ga4_week_span, previous_period, recent_weeks, resolve_period, week_key, week_label, week_range
+
+# load_all_dashboard_data 반환값 (튜플 언패킹 시 22개 항목)
+DashboardReport = namedtuple('DashboardReport', [
+    'cur_uv', 'cur_pv', 'df_daily', 'df_weekly', 'df_traffic_curr', 'df_traffic_last',
+    'df_region_curr', 'df_region_last', 'df_age_curr', 'df_age_last', 'df_gender_curr', 'df_gender_last',
+    'df_top10', 'df_raw_all', 'new_ratio', 'search_ratio', 'active_article_count', 'df_top10_sources',
+    'published_article_count', 'df_all_articles_with_metadata', 'df_top10_daily', 'writer_stats'
+])
+
+# 기자별 집계 (compute_writer_stats): 본명 기준 / 필명 기준 표
+WriterStats = namedtuple('WriterStats', ['by_real', 'by_pen'])
+WRITER_STAT_COLUMNS = ['기사수', '총조회수', '평균조회수', '좋아요', '댓글', '총조회수_비율', '평균조회수_비율', '이상']
+
+# 크롤링 실패 시 기본 메타데이터 (작성자, 좋아요, 댓글, 카테고리, 세부카테고리, 발행일시)
+DEFAULT_ARTICLE_META = ("관리자", 0, 0, "뉴스", "이슈", "-")
+ARTICLE_META_COLUMNS = ['작성자', '좋아요', '댓글', '카테고리', '세부카테고리', '실발행일시']
+
+def compact_metrics(df, columns=None):
+    """정수 지표는 int32, 비율 지표는 float32로 축소 (주차별 캐시 항목 메모리 절감)"""
+    for col in (columns if columns is not None else df.columns):
+        if col not in df.columns:
+            continue
+        kind = df[col].dtype.kind
+        if kind in 'iu':
+            df[col] = df[col].astype('int32')
+        elif kind == 'f':
+            df[col] = df[col].astype('float32')
+    return df
+
+# 기사별 지표 (활성기사 수, TOP N, 발행기사 매칭 공용) - 팩트 테이블의 가산 지표
+ARTICLE_METRICS = ["screenPageViews", "userEngagementDuration", "bounceRate"]
+TOP_N_CANDIDATES = 100
+
+# 기사 경로/제외 제목 조건
+# 팩트 테이블은 유입경로 구성·TOP 10 후보(기사 외 경로 포함)·활성기사 수 대체 산식에 전체 페이지가 필요하므로
+# 집계 결과에 pandas로 적용하고, 실시간 인기 기사처럼 제목만 필요한 조회는 GA4 필터(title_exclusion_filter)로 보낸다.
+ARTICLE_PATH_PATTERN = r'article|news|view|story'
+EXCLUDED_TITLE_TERMS = ['cook&chef', '쿡앤셰프']
+
+def title_exclusion_filter(field_name="pageTitle"):
+    """제외어가 들어간 제목을 빼는 FilterExpression (NOT contains, 대소문자 무시)
+
+    GA4 contains는 공백 변형("Cook & Chef")을 거르지 못하므로 결과에도 exclude_branded_titles를 적용할 것.
+    """
+    from google.analytics.data_v1beta.types import Filter, FilterExpression, FilterExpressionList
+    return FilterExpression(and_group=FilterExpressionList(expressions=[
+        FilterExpression(not_expression=FilterExpression(filter=Filter(
+            field_name=field_name,
+            string_filter=Filter.StringFilter(match_type=Filter.StringFilter.MatchType.CONTAINS, value=term, case_sensitive=False),
+        )))
+        for term in EXCLUDED_TITLE_TERMS
+    ]))
+
+def exclude_branded_titles(df):
+    """사이트명이 들어간 제목 제외 - 공백 변형("Cook & Chef", "쿡앤 셰프") 포함 (벡터 연산)"""
+    if df.empty or 'pageTitle' not in df.columns:
+        return df
+    squashed = df['pageTitle'].astype(str).str.lower().str.replace(' ', '', regex=False)
+    pattern = '|'.join(re.escape(t) for t in EXCLUDED_TITLE_TERMS)
+    return df[~squashed.str.contains(pattern, regex=True, na=False)]
+
+def popular_author_mask(authors):
+    """작성자가 '인기기사' 묶음인 행 (공백/대소문자 무시, 벡터 연산)"""
+    squashed = authors.astype(str).str.lower().str.replace(' ', '', regex=False)
+    return squashed.str.contains('인기기사', regex=False, na=False)
+
+def article_rows(df_pages):
+    """기사별 지표 (pageTitle × pagePath, 조회수 내림차순) - 모든 기사 관련 섹션이 공유
+
+    df_pages: facts.article_metrics 결과. 팩트 테이블은 유입경로 구성 계산을 위해 전체 페이지를 담고 있으므로
+    기사 경로/사이트명 제목은 여기서 거른다.
+    """
+    if df_pages.empty:
+        return df_pages
+    df = df_pages[df_pages['pagePath'].str.contains(ARTICLE_PATH_PATTERN, case=False, regex=True, na=False)]
+    return compact_metrics(exclude_branded_titles(df), ARTICLE_METRICS)
+
+def count_active_articles(df_pages):
+    """활성기사 수: 조회가 발생한 기사 경로 고유 개수 (제목 제외 없음)
+
+    기사 경로가 하나도 없으면 루트('/')를 뺀 전체 경로 수로 대신한다.
+    """
+    if df_pages.empty:
+        return 0
+    df_articles = df_pages[df_pages['pagePath'].str.contains(ARTICLE_PATH_PATTERN, case=False, regex=True, na=False)]
+    if df_articles.empty:
+        df_articles = df_pages[df_pages['pagePath'].str.len() > 1]
+    return df_articles['pagePath'].nunique()
+
+# 기사별 방문자 수는 비가산 지표라 팩트 테이블에 없음: 표시할 기사만 pagePath InListFilter로 GA4에서 조회
+ARTICLE_USER_METRICS = ["activeUsers", "newUsers"]
+PATH_FILTER_CHUNK = 500  # InListFilter 한 번에 넣는 경로 수
+
+def path_in_list_filter(paths):
+    """pagePath가 paths 중 하나인 FilterExpression"""
+    from google.analytics.data_v1beta.types import Filter, FilterExpression
+    return FilterExpression(filter=Filter(field_name="pagePath", in_list_filter=Filter.InListFilter(values=list(paths))))
+
+def fetch_article_users(start_date, end_date, paths, dimensions=("pageTitle", "pagePath"), metrics=ARTICLE_USER_METRICS):
+    """지정 기사들의 방문자 수 (GA4가 기간 전체에서 중복 제거한 값). 경로 PATH_FILTER_CHUNK개마다 GA4 1회, 실패 시 빈 DataFrame"""
+    dimensions, metrics = list(dimensions), list(metrics)
+    frames = [run_ga4_report(start_date, end_date, dimensions, metrics, dimension_filter=path_in_list_filter(paths[i:i + PATH_FILTER_CHUNK]))
+              for i in range(0, len(paths), PATH_FILTER_CHUNK)]
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=dimensions + metrics)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if 'date' in dimensions:
+        df['date'] = pd.to_datetime(df['date'], format='%Y%m%d').dt.strftime('%Y-%m-%d')
+    return compact_metrics(df[dimensions + metrics], metrics)
+
+def attach_article_users(df, start_date, end_date):
+    """기사 표(pageTitle, pagePath)에 activeUsers/newUsers 추가 (GA4에 없는 기사는 0, 행 순서와 인덱스 유지)"""
+    df_users = fetch_article_users(start_date, end_date, list(dict.fromkeys(df['pagePath'])))
+    out = df.merge(df_users, on=['pageTitle', 'pagePath'], how='left')
+    out[ARTICLE_USER_METRICS] = out[ARTICLE_USER_METRICS].fillna(0).astype('int32')
+    out.index = df.index
+    return out
+
+# 팩트 추출 시 GA4 페이지 크기 (runReport 최대 행 수)
+FACT_PAGE_SIZE = 100000
+
+def extract_fact_day(day):
+    """하루치 pagePath × pageTitle × sessionSource 팩트 추출 (행 수가 많으면 offset으로 나눠 조회)"""
+    frames, offset = [], 0
+    while True:
+        df = run_ga4_report(day, day, facts.FACT_DIMENSIONS, facts.FACT_METRICS, limit=FACT_PAGE_SIZE, offset=offset, strict=True)
+        frames.append(df)
+        if len(df) < FACT_PAGE_SIZE:
+            break
+        offset += FACT_PAGE_SIZE
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+def ensure_facts(start_date, end_date):
+    """기간 내 미추출/미확정 날짜만 GA4에서 추출하여 팩트 테이블에 저장. 추출 실패한 날짜는 다음 로드 때 재시도"""
+    days = facts.missing_days(start_date, end_date)
+    perf.note(days=len(days))
+    if not days:
+        return 0
+    try:
+        # 일별 합계(UV는 비가산 지표라 날짜 단위로 별도 조회)는 누락 구간 전체를 한 번에 조회
+        df_totals = run_ga4_report(days[0], days[-1], ["date"], facts.TOTAL_METRICS, strict=True)
+    except Exception:
+        return 0
+    totals = {}
+    if not df_totals.empty:
+        df_totals['date'] = pd.to_datetime(df_totals['date'], format='%Y%m%d').dt.strftime('%Y-%m-%d')
+        totals = df_totals.set_index('date')[facts.TOTAL_METRICS].to_dict('index')
+
+    written = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
+        futures = {perf.submit(executor, extract_fact_day, day): day for day in days}
+        for future in concurrent.futures.as_completed(futures):
+            day = futures[future]
+            try:
+                df_day = future.result()
+            except Exception:
+                continue
+            facts.write_day(day, df_day, totals.get(day, {}))
+            written += 1
+    return written
+
+def fetch_top_daily(start_date, end_date, paths):
+    """TOP 기사 일별 곡선 (pagePath × date). 조회수는 팩트 테이블, 일별 방문자 수는 pagePath × date GA4 조회 1회. 조회 없는 날은 0"""
+    df_users = fetch_article_users(start_date, end_date, paths, ["pagePath", "date"], ["activeUsers"])
+    df = facts.article_daily(start_date, end_date, paths).merge(df_users, on=['pagePath', 'date'], how='outer')
+    index = pd.MultiIndex.from_product([paths, facts.day_range(start_date, end_date)], names=['pagePath', 'date'])
+    df = df.set_index(['pagePath', 'date']).reindex(index).fillna(0).reset_index()
+    df[['screenPageViews', 'activeUsers']] = df[['screenPageViews', 'activeUsers']].astype('int64')
+    return compact_metrics(df, ['screenPageViews', 'activeUsers'])
+
+def top_n_articles(df_articles, n=TOP_N_CANDIDATES):
+    """조회수 상위 N개 기사 (동률은 GA4 정렬 순서 유지)"""
+    if df_articles.empty:
+        return df_articles
+    return df_articles.sort_values('screenPageViews', ascending=False, kind='stable').head(n)
+
+class GA4Scheduler:
+    """여러 속성이 공유하는 GA4 요청 스케줄러
+
+    - 속성별 동시 요청 상한(GA4 쿼터)과 프로세스 전체 상한을 세마포어로 함께 제한한다.
+    - 응답의 property_quota로 남은 시간당 토큰을 기록하고, 바닥나면(LOW_TOKENS_PER_HOUR 미만)
+      해당 속성 요청을 한 건씩 순차 실행하여 다른 속성의 파이프라인은 계속 진행되게 한다.
+    """
+    LOW_TOKENS_PER_HOUR = 2000
+
+    def __init__(self, per_property, total):
+        self.per_property = per_property
+        self._total = threading.BoundedSemaphore(total)
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._serial = {}
+        self.quota = {}
+
+    def _for(self, property_id):
+        with self._lock:
+            if property_id not in self._slots:
+                self._slots[property_id] = threading.BoundedSemaphore(self.per_property)
+                self._serial[property_id] = threading.Lock()
+            return self._slots[property_id], self._serial[property_id]
+
+    @contextmanager
+    def slot(self, property_id):
+        sem, serial = self._for(property_id)
+        with sem, self._total:
+            if self.quota.get(property_id, {}).get("low"):
+                with serial:
+                    yield
+            else:
+                yield
+
+    def record(self, property_id, property_quota):
+        tokens = getattr(property_quota, "tokens_per_hour", None)
+        if tokens is None or not (tokens.consumed or tokens.remaining):
+            return
+        self.quota[property_id] = {
+            "tokens_per_hour": tokens.remaining,
+            "low": tokens.remaining < self.LOW_TOKENS_PER_HOUR,
+        }
+
+GA4_SCHEDULER = GA4Scheduler(config.GA4_MAX_CONCURRENT_PER_PROPERTY, config.GA4_MAX_CONCURRENT_TOTAL)
+
+def run_ga4_report(start_date, end_date, dimensions, metrics, order_by_metric=None, limit=None, dimension_filter=None, offset=0, strict=False):
+    """현재 사이트(sites.current())의 GA4 속성에 runReport"""
+    with perf.span("ga4", kind="ga4", report="+".join(dimensions) or "total", start=start_date, end=end_date, site=sites.current()) as sp:
+        df = _run_ga4_report(start_date, end_date, dimensions, metrics, order_by_metric, limit, dimension_filter, offset, strict)
+        sp.attrs["rows"] = len(df)
+        return df
+
+def _run_ga4_report(start_date, end_date, dimensions, metrics, order_by_metric=None, limit=None, dimension_filter=None, offset=0, strict=False):
+    """strict=True이면 실패를 빈 DataFrame 대신 예외로 전달 (팩트 추출처럼 빈 결과를 저장하면 안 되는 경우)"""
     client = get_ga4_client()
-    if not client: return pd.DataFrame()
+    if not client:
+        if strict: raise RuntimeError("GA4 client unavailable")
+        return pd.DataFrame()
+    from google.analytics.data_v1beta.types import DateRange, Dimension, Metric, RunReportRequest, OrderBy
     
     order_bys = [OrderBy(metric=OrderBy.MetricOrderBy(metric_name=order_by_metric), desc=True)] if order_by_metric else []
     
+    property_id = sites.info()["property_id"]
     request_params = {
-        "property": f"properties/{config.PROPERTY_ID}",
+        "property": f"properties/{property_id}",
         "dimensions": [Dimension(name=d) for d in dimensions],
         "metrics": [Metric(name=m) for m in metrics],
         "date_ranges": [DateRange(start_date=start_date, end_date=end_date)],
         "order_bys": order_bys,
-        "limit": limit if limit is not None else 100000  # limit=None일 때 충분히 큰 값으로 설정
+        "limit": limit if limit is not None else 100000,  # limit=None일 때 충분히 큰 값으로 설정
+        "return_property_quota": True,
     }
     if dimension_filter:
         request_params["dimension_filter"] = dimension_filter
+    if offset:
+        request_params["offset"] = offset
 
     request = RunReportRequest(**request_params)
     
     try:
-        response = client.run_report(request)
-        data = []
-        for row in response.rows:
-            row_dict = {dimensions[i]: row.dimension_values[i].value for i in range(len(dimensions))}
-            for i, met in enumerate(metrics):
-                val = row.metric_values[i].value
-                try:
-                    if isinstance(val, str):
-                        row_dict[met] = float(val) if '.' in val else int(val)
-                    else:
-                        row_dict[met] = float(val) if isinstance(val, float) else int(val)
-                except (ValueError, TypeError):
-                    row_dict[met] = 0
-            data.append(row_dict)
-        return pd.DataFrame(data)
-    except: return pd.DataFrame(columns=dimensions + metrics)
-
-@st.cache_data(ttl=86400)
-def crawl_article_list_page(page_num=1):
-    """전체 기사 목록 페이지 크롤링: 해당 주차 기간의 기사만 추출"""
-    base_url = "http://www.cooknchefnews.com/news/cate/"
-    url = f"{base_url}?pagenum={page_num}"
-    
+        with GA4_SCHEDULER.slot(property_id):
+            response = client.run_report(request)
+        GA4_SCHEDULER.record(property_id, getattr(response, "property_quota", None))
+        return _response_to_frame(response, dimensions, metrics)
+    except Exception as e:
+        perf.note(error=type(e).__name__)
+        if strict: raise
+        return pd.DataFrame(columns=dimensions + metrics)
+
+def _response_to_frame(response, dimensions, metrics):
+    """runReport/runRealtimeReport 응답 행 -> DataFrame (정수/실수 지표 변환 후 축소)"""
+    data = []
+    for row in response.rows:
+        row_dict = {dimensions[i]: row.dimension_values[i].value for i in range(len(dimensions))}
+        for i, met in enumerate(metrics):
+            val = row.metric_values[i].value
+            try:
+                if isinstance(val, str):
+                    row_dict[met] = float(val) if '.' in val else int(val)
+                else:
+                    row_dict[met] = float(val) if isinstance(val, float) else int(val)
+            except (ValueError, TypeError):
+                row_dict[met] = 0
+        data.append(row_dict)
+    return compact_metrics(pd.DataFrame(data), metrics)
+
+def run_realtime_report(dimensions, metrics, limit=1000, dimension_filter=None):
+    """현재 사이트 GA4 속성에 runRealtimeReport (최근 30분). 실패 시 빈 DataFrame"""
+    with perf.span("ga4", kind="ga4", report="realtime:" + ("+".join(dimensions) or "total"), site=sites.current()) as sp:
+        client = get_ga4_client()
+        if not client:
+            return pd.DataFrame(columns=dimensions + metrics)
+        from google.analytics.data_v1beta.types import Dimension, Metric, RunRealtimeReportRequest
+        property_id = sites.info()["property_id"]
+        request = RunRealtimeReportRequest(
+            property=f"properties/{property_id}",
+            dimensions=[Dimension(name=d) for d in dimensions],
+            metrics=[Metric(name=m) for m in metrics],
+            limit=limit,
+            dimension_filter=dimension_filter,
+            return_property_quota=True,
+        )
+        try:
+            with GA4_SCHEDULER.slot(property_id):
+                response = client.run_realtime_report(request)
+            GA4_SCHEDULER.record(property_id, getattr(response, "property_quota", None))
+            df = _response_to_frame(response, dimensions, metrics)
+        except Exception as e:
+            perf.note(error=type(e).__name__)
+            df = pd.DataFrame(columns=dimensions + metrics)
+        sp.attrs["rows"] = len(df)
+        return df
+
+class CrawlError(Exception):
+    """크롤링 실패 (캐시하지 않음). CircuitOpen은 요청 없이 즉시 실패한 경우"""
+
+class CircuitOpen(CrawlError):
+    pass
+
+class CircuitBreaker:
+    """사이트별 크롤링 차단기 (closed -> open -> half_open)
+
+    - 연속 실패가 failure_threshold회에 이르면 open: reset_seconds 동안 요청 없이 즉시 실패
+    - reset_seconds가 지나면 half_open: 시험 요청 한 건만 보내고, 성공하면 closed, 실패하면 다시 open
+    - 캐시 적중은 차단기를 거치지 않음 (캐시 함수 본문에서만 확인)
+    """
+
+    def __init__(self, failure_threshold=config.CRAWL_FAILURE_THRESHOLD, reset_seconds=config.CRAWL_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+                self._probing = False
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def success(self):
+        with self._lock:
+            self.state, self.failures, self._probing = "closed", 0, False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state, self.opened_at, self._probing = "open", time.monotonic(), False
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def crawl_breaker(base_url):
+    """사이트 주소별 CircuitBreaker (프로세스 전역)"""
+    with _breakers_lock:
+        if base_url not in _breakers:
+            _breakers[base_url] = CircuitBreaker()
+        return _breakers[base_url]
+
+def _crawl_get(url, base_url, timeout, extra_headers=None):
+    """차단기를 거친 requests.get. 차단 중이면 CircuitOpen, 실패(연결 오류·시간 초과·5xx/429)는 CrawlError
+
+    404 등 나머지 응답(조건부 요청의 304 포함)은 사이트 장애가 아니므로 그대로 반환한다.
+    """
+    import requests
+    breaker = crawl_breaker(base_url)
+    if not breaker.allow():
+        perf.note(outcome="open")
+        raise CircuitOpen(url)
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        **(extra_headers or {}),
     }
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+        if response.status_code >= 500 or response.status_code == 429:
+            raise CrawlError(f"HTTP {response.status_code}")
+    except requests.Timeout as e:
+        breaker.failure()
+        perf.note(outcome="timeout")
+        raise CrawlError(url) from e
+    except Exception as e:
+        breaker.failure()
+        perf.note(outcome="error")
+        raise CrawlError(url) from e
+    breaker.success()
+    return response
+
+def _conditional_get(url, base_url, timeout):
+    """crawlcache 검증자로 조건부 GET. 반환: (응답, 저장된 결과 또는 None - 304일 때만)"""
+    entry = crawlcache.get(url)
+    response = _crawl_get(url, base_url, timeout, crawlcache.conditional_headers(entry))
+    if response.status_code == 304 and entry is not None:
+        perf.note(outcome="not_modified")
+        crawlcache.touch(url)
+        return response, entry["result"]
+    return response, None
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def _get_parse_pool():
+    """HTML 파싱용 프로세스 풀 (작업자 2개 이상일 때만, 첫 사용 시 생성)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None and config.CRAWL_PARSE_WORKERS > 1:
+            # fork는 스레드가 도는 프로세스에서 안전하지 않으므로 spawn (작업자는 가벼운 parsing 모듈만 임포트)
+            _parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=config.CRAWL_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+def shutdown_parse_pool():
+    """파싱 프로세스 풀 종료 (다음 사용 시 config.CRAWL_PARSE_WORKERS로 다시 생성)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+def parse_html(fn, text):
+    """fn(text)를 파싱 프로세스 풀에서 실행 (풀이 없거나 깨졌으면 현재 스레드에서 실행)
+
+    크롤링 스레드는 내려받기만 하고 BeautifulSoup 파싱은 코어 수만큼의 프로세스에서 병렬로 처리되어 GIL에 묶이지 않는다.
+    """
+    global _parse_pool
+    pool = _get_parse_pool()
+    if pool is None:
+        return fn(text)
+    with perf.span("parse", kind="parse", bytes=len(text)):
+        try:
+            return pool.submit(fn, text).result()
+        except concurrent.futures.process.BrokenProcessPool:
+            with _parse_pool_lock:
+                _parse_pool = None
+            perf.note(error="BrokenProcessPool")
+            return fn(text)
+
+# 조건부 GET으로 재검증 비용이 작으므로 좋아요/댓글이 빨리 반영되도록 1시간마다 재검증
+@st.cache_data(ttl=3600)
+def crawl_article_list_page(page_num=1, base_url=config.SITES[config.DEFAULT_SITE]["base_url"]):
+    """전체 기사 목록 페이지 크롤링: 해당 주차 기간의 기사만 추출 (base_url: 사이트 주소, 캐시 키에 포함)
+
+    요청 실패는 CrawlError로 올려 캐시에 남기지 않는다 (fetch_article_list_page에서 처리).
+    페이지가 바뀌지 않았으면(304) 파싱 없이 저장된 목록을 반환한다.
+    """
+    perf.note(cache="miss")
+    url = f"{base_url}/news/cate/?pagenum={page_num}"
+    response, stored = _conditional_get(url, base_url, timeout=5.0)
+    if stored is not None:
+        return stored
     
     try:
-        response = requests.get(url, headers=headers, timeout=5.0)
         response.encoding = response.apparent_encoding
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        articles = []
-        # <dl> 태그로 각 기사 추출
-        dl_list = soup.select('dl')
-        
-        for dl in dl_list:
-            try:
-                # 기사 링크 추출
-                dt = dl.select_one('dt')
-                if not dt:
-                    continue
-                link_elem = dt.select_one('a')
-                if not link_elem:
-                    continue
-                article_path = link_elem.get('href', '')
-                
-                # 발행일시 추출 (<dd class='winfo'><span class="date">)
-                winfo_dd = dl.select_one("dd.winfo")
-                if winfo_dd:
-                    date_span = winfo_dd.select_one("span.date")
-                    if date_span:
-                        date_text = date_span.get_text(strip=True)
-                        # "2026.01.28" 형식을 "2026-01-28"로 변환
-                        if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                            date_text = date_text.replace('.', '-')
-                        articles.append({
-                            'path': article_path,
-                            'published_date': date_text
-                        })
-            except:
-                continue
+        articles = parsing.parse_list_html(response.text)
         
+        perf.note(outcome="success" if articles else "fallback")
+        if articles:
+            crawlcache.put(url, response.headers, articles)
         return articles
     except:
+        perf.note(outcome="error")
         return []
 
-@st.cache_data(ttl=86400)
-def crawl_single_article_cached(url_path):
-    """크롤링: 헤더 추가, 인코딩 보정, 하이브리드 파싱(DOM+텍스트패턴)"""
-    full_url = f"http://www.cooknchefnews.com{url_path}"
+@st.cache_data(ttl=3600)
+def crawl_single_article_cached(url_path, base_url=config.SITES[config.DEFAULT_SITE]["base_url"]):
+    """크롤링: 헤더 추가, 인코딩 보정 후 parsing.parse_article_html (프로세스 풀에서 실행)
+
+    요청 실패는 CrawlError (캐시하지 않음). 기사가 바뀌지 않았으면(304) 파싱 없이 저장된 값을 반환한다.
+    """
+    perf.note(cache="miss")
+    full_url = f"{base_url}{url_path}"
     
-    # [봇 차단 방지]
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    # [봇 차단 방지] 헤더는 _crawl_get에서 추가
+    response, stored = _conditional_get(full_url, base_url, timeout=3.0)
+    if stored is not None:
+        return tuple(stored)
     
     try:
-        response = requests.get(full_url, headers=headers, timeout=3.0)
         # [한글 깨짐 방지]
         response.encoding = response.apparent_encoding 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        reg_date = "-"
-        author = "관리자"
-        cat, subcat = "뉴스", "이슈"
-
-        # ---------------------------------------------------------
-        # 1. 작성자 & 발행일시 추출
-        # ---------------------------------------------------------
-        target_text = ""
-        
-        # [Priority 1] 정확한 DOM 경로 (.viewTitle > dl > dd)
-        view_title_section = soup.select_one('.viewTitle')
-        if view_title_section:
-            dd_elem = view_title_section.select_one('dl dd')
-            if dd_elem:
-                target_text = dd_elem.get_text(separator=' ', strip=True)
-
-        # [Priority 2] 실패 시 "기사승인" 키워드 전수 조사
-        if "기사승인" not in target_text:
-            fallback_elem = soup.find(string=re.compile("기사승인"))
-            if fallback_elem:
-                target_text = fallback_elem.parent.get_text(separator=' ', strip=True)
-
-        # [Priority 3] <dd class='winfo'> 안의 <span class="date">에서 발행일시 추출
-        if reg_date == "-":
-            winfo_dd = soup.select_one("dd.winfo")
-            if winfo_dd:
-                date_span = winfo_dd.select_one("span.date")
-                if date_span:
-                    date_text = date_span.get_text(strip=True)
-                    # "2026.01.28" 형식을 "2026-01-28"로 변환
-                    if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                        reg_date = date_text.replace('.', '-')
+        meta = parse_html(parsing.parse_article_html, response.text)
+        author = meta[0]
         
-        # 파싱 ("쿡앤셰프 / 기사승인 : 2026-01-07 ...")
-        if "기사승인" in target_text:
-            parts = target_text.split("기사승인")
-            
-            # 1-1. 발행일시 (우측)
-            if len(parts) > 1:
-                right_part = parts[1]
-                date_match = re.search(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(:\d{2})?', right_part)
-                if date_match:
-                    reg_date = date_match.group()
-            
-            # 1-2. 작성자 (좌측)
-            left_part = parts[0]
-            left_part = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', left_part) # 이메일 제거
-            left_part = left_part.replace('/', '').replace('|', '').replace('기자', '').strip()
-            if left_part:
-                author = left_part
-        
-        # Fallback
-        if reg_date == "-":
-            date_match = re.search(r'\d{4}[.-]\d{2}[.-]\d{2}(\s+\d{2}:\d{2})?', soup.text)
-            if date_match: 
-                reg_date = date_match.group()
-                # "2026.01.28" 형식을 "2026-01-28"로 변환
-                if '.' in reg_date and ' ' not in reg_date:
-                    reg_date = reg_date.replace('.', '-')
-        
-        if author == "관리자" or len(author) > 20:
-             author_tag = soup.select_one('.user-name') or soup.select_one('.writer') or soup.select_one('.byline')
-             if author_tag: author = author_tag.text.strip()
-        
-        author = clean_author_name(author)
+        # 작성자 추출 실패("관리자" 기본값)는 fallback으로 집계
+        perf.note(outcome="fallback" if author == "관리자" else "success")
+        crawlcache.put(full_url, response.headers, meta)
+        return meta
+    except: 
+        perf.note(outcome="error")
+        return DEFAULT_ARTICLE_META
 
-        # ---------------------------------------------------------
-        # 2. 카테고리 추출
-        # ---------------------------------------------------------
-        navi_text = ""
-        
-        # [Priority 1] .naviLink 클래스
-        navi_elem = soup.select_one('.naviLink')
-        if navi_elem:
-            navi_text = navi_elem.get_text(separator=' ', strip=True)
-        
-        # [Priority 2] "Home >" 텍스트 패턴
-        if "Home" not in navi_text:
-            crumb_elem = soup.find(string=re.compile(r"Home\s*[>|]"))
-            if crumb_elem:
-                navi_text = crumb_elem.parent.get_text(separator=' ', strip=True)
-
-        # 파싱 ("Home > 푸드이슈 > ...")
-        if "Home" in navi_text and (">" in navi_text or "|" in navi_text):
-            clean_navi = re.sub(r'\s*[>|]\s*', '>', navi_text)
-            parts = clean_navi.split('>')
-            parts = [p.strip() for p in parts if p.strip()]
-            
-            if parts and parts[0].lower() == 'home':
-                parts = parts[1:]
-            
-            if len(parts) >= 1: cat = parts[0]
-            if len(parts) >= 2: subcat = parts[1]
+def fetch_article_list_page(page_num=1):
+    """crawl_article_list_page 계측 래퍼 (현재 사이트 주소 사용, 캐시 적중 여부, 기사 수 기록)
+
+    크롤링 실패/차단 중에는 crawlcache의 마지막 성공 목록(없으면 빈 목록)을 반환한다.
+    """
+    base_url = sites.info()["base_url"]
+    with perf.span("crawl.list", kind="crawl", page=page_num, cache="hit") as sp:
+        try:
+            articles = crawl_article_list_page(page_num, base_url)
+        except CrawlError:
+            entry = crawlcache.get(f"{base_url}/news/cate/?pagenum={page_num}")
+            articles = entry["result"] if entry else []
+            sp.attrs["stale"] = entry is not None
+        sp.attrs["rows"] = len(articles)
+        return articles
+
+def fetch_article_meta(url_path):
+    """crawl_single_article_cached 계측 래퍼 (현재 사이트 주소 사용, 캐시 적중 여부 기록)
+
+    크롤링 실패/차단 중에는 crawlcache의 마지막 성공 메타데이터(없으면 DEFAULT_ARTICLE_META)를 반환한다.
+    """
+    base_url = sites.info()["base_url"]
+    with perf.span("crawl.article", kind="crawl", path=url_path, cache="hit") as sp:
+        try:
+            return crawl_single_article_cached(url_path, base_url)
+        except CrawlError:
+            entry = crawlcache.get(f"{base_url}{url_path}")
+            sp.attrs["stale"] = entry is not None
+            return tuple(entry["result"]) if entry else DEFAULT_ARTICLE_META
+
+@st.cache_data(ttl=3600)
+def crawl_feed(feed_path, base_url=config.SITES[config.DEFAULT_SITE]["base_url"]):
+    """사이트맵/RSS 피드 -> DataFrame(path, published_at). 피드가 없거나 XML이 아니면 빈 DataFrame
+
+    요청 실패는 CrawlError (캐시하지 않음). 피드가 바뀌지 않았으면(304) 저장된 레코드를 사용한다.
+    """
+    perf.note(cache="miss")
+    url = f"{base_url}{feed_path}"
+    response, stored = _conditional_get(url, base_url, timeout=10.0)
+    if stored is not None:
+        return discovery.records_frame([tuple(r) for r in stored])
+    if response.status_code != 200:
+        perf.note(outcome="fallback")
+        return discovery.records_frame([])
+    try:
+        records = discovery.parse_feed(response.content)
+    except Exception:
+        perf.note(outcome="fallback")
+        return discovery.records_frame([])
+    perf.note(outcome="success" if records else "fallback")
+    if records:
+        crawlcache.put(url, response.headers, records)
+    return discovery.records_frame(records)
+
+def fetch_feed(feed_path):
+    """crawl_feed 계측 래퍼 (현재 사이트 주소 사용). 크롤링 실패/차단 중에는 빈 DataFrame"""
+    with perf.span("crawl.feed", kind="crawl", feed=feed_path, cache="hit") as sp:
+        try:
+            df = crawl_feed(feed_path, sites.info()["base_url"])
+        except CrawlError:
+            df = discovery.records_frame([])
+        sp.attrs["rows"] = len(df)
+        return df
+
+def crawl_published_from_list(start_date, end_date, max_pages):
+    """목록 페이지를 최신순으로 넘기며 기간 내 발행 기사 수집 (페이지 단위 날짜 변환은 벡터 연산)"""
+    s_ts, e_ts = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    found = []
+    found_older = False
+    for page_num in range(1, max_pages + 1):
+        articles = fetch_article_list_page(page_num)
+        if not articles:
+            break  # 더 이상 기사가 없으면 중단
+        df_page = pd.DataFrame(articles)
+        # "2026-01-28", "2026.01.28", "2026-01-28 14:30" 모두 앞 10자리로 날짜 변환
+        day = pd.to_datetime(df_page['published_date'].astype(str).str.slice(0, 10).str.replace('.', '-', regex=False), errors='coerce', format='%Y-%m-%d')
+        in_range = (day >= s_ts) & (day <= e_ts)
+        found.extend(df_page[in_range].to_dict('records'))
+        found_older = found_older or bool((day < s_ts).any())
+        # 기간 시작일보다 이전 기사만 있는 페이지가 나오면 중단 (최신순 정렬 가정)
+        if found_older and not in_range.any():
+            break
+    return found
+
+def discover_published(start_date, end_date, max_pages):
+    """기간 내 발행 기사 [{'path', 'published_date'}] (최신순)
+
+    사이트 설정의 feeds(기본 discovery.DEFAULT_FEEDS)를 순서대로 시도하여 기간 시작일 이전까지 담은 첫 피드를 쓰고,
+    없으면 목록 페이지 크롤링(최대 max_pages페이지)으로 대체한다.
+    """
+    for feed_path in sites.info().get("feeds", discovery.DEFAULT_FEEDS):
+        df = fetch_feed(feed_path)
+        if discovery.covers(df, start_date):
+            perf.note(discovery=feed_path)
+            df = discovery.published_between(df, start_date, end_date)
+            return [{'path': p, 'published_date': d} for p, d in zip(df['path'], df['published_at'].dt.strftime('%Y-%m-%d %H:%M'))]
+    perf.note(discovery="list")
+    return crawl_published_from_list(start_date, end_date, max_pages)
+
+# 추이 차트 기본 기간 (주). 전년 동주 비교를 위해 52주를 더 조회
+TREND_WEEKS = 104
+YOY_WEEKS = 52
+ANOMALY_LOOKBACK_DAYS = 28  # 일별/유입경로 이상치의 같은 요일 기준 4주
+
+def ensure_weekly_totals(week_starts):
+    """주간 UV/PV 캐시 채우기: 미확정 주 전체를 yearWeek 차원 GA4 조회 1회로 가져온다
+
+    GA4 주(yearWeek)는 일요일 시작이지만 1월 1일에서 끊기므로, 연도 경계에 걸친 주는
+    두 행으로 나뉜다. UV는 합산할 수 없으므로 그런 주만 기간 조회로 따로 가져온다.
+    """
+    missing = facts.missing_weeks(week_starts)
+    perf.note(weeks=len(missing))
+    if not missing:
+        return
+    today = datetime.now().strftime('%Y-%m-%d')
+    start, end = min(missing), min(week_range(max(missing))[1], today)
+    try:
+        df = run_ga4_report(start, end, ["yearWeek"], ["activeUsers", "screenPageViews"], strict=True)
+    except Exception:
+        return
+
+    rows, split_weeks = {}, set()
+    for year_week, uv, pv in df[['yearWeek', 'activeUsers', 'screenPageViews']].itertuples(index=False, name=None):
+        ws, we = ga4_week_span(year_week)
+        wk = week_key(ws)
+        if ws == wk and week_range(wk)[1] == we:
+            rows[wk] = (uv, pv)
         else:
-            path_div = soup.select_one('.path') or soup.select_one('.location') or soup.select_one('#navigation')
-            if path_div:
-                txt = path_div.get_text().strip()
-                parts = re.split(r'\s*[>|]\s*', txt)
-                parts = [p.strip() for p in parts if p.strip()]
-                if parts and parts[0].lower() == 'home': parts = parts[1:]
-                if len(parts) >= 1: cat = parts[0]
-                if len(parts) >= 2: subcat = parts[1]
-
-        # 3. 기타 정보
-        likes_elem = soup.select_one('.sns-like-count')
-        likes = int(likes_elem.text.replace(',', '').strip()) if likes_elem and likes_elem.text and likes_elem.text.replace(',', '').strip().isdigit() else 0
-        comments_elem = soup.select_one('.comment-count')
-        comments = int(comments_elem.text.replace(',', '').strip()) if comments_elem and comments_elem.text and comments_elem.text.replace(',', '').strip().isdigit() else 0
-        
-        return (author, likes, comments, cat, subcat, reg_date)
-    except: 
-        return ("관리자", 0, 0, "뉴스", "이슈", "-")
+            split_weeks.add(wk)
+
+    def fetch_whole_week(wk):
+        ws, we = week_range(wk)
+        res = run_ga4_report(ws, min(we, today), [], ["activeUsers", "screenPageViews"], strict=True)
+        return (int(res['activeUsers'].iloc[0]), int(res['screenPageViews'].iloc[0])) if not res.empty else (0, 0)
+
+    split_weeks &= set(missing)
+    if split_weeks:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {perf.submit(executor, fetch_whole_week, wk): wk for wk in split_weeks}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    rows[futures[future]] = future.result()
+                except Exception:
+                    pass
+    facts.write_weeks(rows)
+
+def fetch_weekly_trend(until, n_weeks=TREND_WEEKS):
+    """until이 속한 주까지 n_weeks주 추이 (오래된 주부터) + 전년 동주(52주 전) UV/PV
+
+    반환 컬럼: 주차, UV, PV, week_num, week_start, UV_전년, PV_전년, UV_z, PV_z, 이상
+    """
+    weeks = recent_weeks(n_weeks + YOY_WEEKS, until=until)
+    ensure_weekly_totals(weeks)
+    df = facts.weekly_totals(weeks[-1], weeks[0])
+    if df.empty:
+        return pd.DataFrame(columns=['주차', 'UV', 'PV'])
+    df = df.rename(columns={'activeUsers': 'UV', 'screenPageViews': 'PV'})
+    df_prev = df[['week_start', 'UV', 'PV']].assign(week_start=(pd.to_datetime(df['week_start']) + pd.Timedelta(weeks=YOY_WEEKS)).dt.strftime('%Y-%m-%d'))
+    # 이상치는 전년 구간까지 포함한 전체 이력으로 계산 (직전 8주 기준)
+    df = anomaly.annotate_weekly(df.sort_values('week_start').reset_index(drop=True))
+    df = df[df['week_start'] >= weeks[n_weeks - 1]].merge(
+        df_prev.rename(columns={'UV': 'UV_전년', 'PV': 'PV_전년'}), on='week_start', how='left'
+    )
+    df['주차'] = df['week_start'].map(week_label)
+    df['week_num'] = df['주차'].str.extract(r'(\d+)', expand=False).astype(int)
+    return compact_metrics(df[['주차', 'UV', 'PV', 'week_num', 'week_start', 'UV_전년', 'PV_전년', 'UV_z', 'PV_z', '이상']].reset_index(drop=True))
 
 @st.cache_data(ttl=3600, show_spinner="데이터 불러오는 중...")
-def load_all_dashboard_data(selected_week):
+def load_all_dashboard_data(period, end_date=None, site=config.DEFAULT_SITE):
+    """보고서 전체 데이터 로드 (site: config.SITES 키, 사이트별로 캐시가 분리됨)
+
+    period: 기간 키(주 'YYYY-MM-DD' 시작 일요일 / 월 'YYYY-MM' / 분기 'YYYY-Qn', utils.resolve_period)
+            또는 시작일('YYYY-MM-DD', end_date와 함께 사용). 캐시도 이 키로 구분된다.
+    비교 기간은 utils.previous_period (직전 월/분기 또는 직전 동일 일수).
+    PV 등 가산 지표는 팩트 테이블의 일별 데이터를 합산하고, UV 등 비가산 지표만 GA4에 조회한다.
+    """
+    with sites.use(site):
+        return _load_dashboard_data(period, end_date)
+
+def _load_dashboard_data(period, end_date=None):
+    perf.note_trace(cache="miss", period=period if end_date is None else f"{period} ~ {end_date}", site=sites.current())
     # 모든 반환 변수를 함수 시작 부분에서 초기화
     sel_uv, sel_pv = 0, 0
     df_daily = pd.DataFrame(columns=['날짜', 'UV', 'PV'])
@@ -290,504 +725,498 @@ def load_all_dashboard_data(selected_week):
     df_top10_sources = pd.DataFrame()
     published_article_count = 0
     df_all_articles_with_metadata = pd.DataFrame()
+    df_top10_daily = pd.DataFrame(columns=['pagePath', 'date', 'screenPageViews', 'activeUsers'])
+    writer_stats = compute_writer_stats(df_all_articles_with_metadata)
     
     try:
-        dr = WEEK_MAP[selected_week]
-        s_dt = dr.split(' ~ ')[0].replace('.', '-')
-        e_dt = dr.split(' ~ ')[1].replace('.', '-')
-        ls_dt = (datetime.strptime(s_dt, '%Y-%m-%d')-timedelta(days=7)).strftime('%Y-%m-%d')
-        le_dt = (datetime.strptime(e_dt, '%Y-%m-%d')-timedelta(days=7)).strftime('%Y-%m-%d')
+        _, s_dt, e_dt = resolve_period(period, end_date)
+        ls_dt, le_dt = previous_period(s_dt, e_dt)
     except (KeyError, ValueError, IndexError) as e:
         # 기본값 반환 (이미 초기화됨)
-        return (sel_uv, sel_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last, 
+        return DashboardReport(sel_uv, sel_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last, 
                 df_region_curr, df_region_last, df_age_curr, df_age_last, df_gender_curr, df_gender_last, 
-                df_top10, df_raw_all, new_visitor_ratio, search_inflow_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata)
+                df_top10, df_raw_all, new_visitor_ratio, search_inflow_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata, df_top10_daily, writer_stats)
 
     try:
-        # 1. KPI
-    summary = run_ga4_report(s_dt, e_dt, [], ["activeUsers", "screenPageViews", "newUsers"])
-    if not summary.empty:
-        sel_uv = int(summary['activeUsers'].iloc[0])
-        sel_pv = int(summary['screenPageViews'].iloc[0])
-        sel_new = int(summary['newUsers'].iloc[0])
-    else: sel_uv, sel_pv, sel_new = 0, 0, 0
-    new_visitor_ratio = round((sel_new / sel_uv * 100), 1) if sel_uv > 0 else 0
-
-    # 2. 일별 데이터
-    today = datetime.now().date()
-    e_dt_date = datetime.strptime(e_dt, '%Y-%m-%d').date()
-    actual_end_date = min(today, e_dt_date)
-    actual_e_dt = actual_end_date.strftime('%Y-%m-%d')
-    
-    df_daily = run_ga4_report(s_dt, actual_e_dt, ["date"], ["activeUsers", "screenPageViews"])
-    if not df_daily.empty:
-        df_daily = df_daily.rename(columns={'date':'날짜', 'activeUsers':'UV', 'screenPageViews':'PV'})
-        df_daily['날짜_원본'] = pd.to_datetime(df_daily['날짜'])
-        df_daily = df_daily.sort_values('날짜_원본')
-        df_daily = df_daily[df_daily['날짜_원본'].dt.date <= actual_end_date]
-        df_daily['날짜'] = df_daily['날짜_원본'].dt.strftime('%m-%d')
-        df_daily = df_daily.drop(columns=['날짜_원본'])
-    else:
-        df_daily = pd.DataFrame(columns=['날짜', 'UV', 'PV'])
-    
-    # 3. 3개월 추이
-    def fetch_week_data(week_label, date_str):
-        ws, we = date_str.split(' ~ ')[0].replace('.', '-'), date_str.split(' ~ ')[1].replace('.', '-')
-        res = run_ga4_report(ws, we, [], ["activeUsers", "screenPageViews"])
-        if not res.empty and 'activeUsers' in res.columns and 'screenPageViews' in res.columns and len(res) > 0:
-            try:
-                return {'주차': week_label, 'UV': int(res['activeUsers'].iloc[0]), 'PV': int(res['screenPageViews'].iloc[0])}
-            except: return None
-        return None
+        # 0. 팩트 테이블 동기화 (비교 기간 또는 이상치 기준 4주 중 이른 날짜~선택 기간, 미추출/미확정 날짜만 GA4에서 추출)
+        perf.section("0. 팩트 동기화")
+        base_dt = (datetime.strptime(s_dt, '%Y-%m-%d') - timedelta(days=ANOMALY_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+        ensure_facts(min(ls_dt, base_dt), min(e_dt, datetime.now().strftime('%Y-%m-%d')))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(fetch_week_data, wl, dstr) for wl, dstr in list(WEEK_MAP.items())[:12]]
-        results = [f.result() for f in concurrent.futures.as_completed(futures) if f.result()]
+        # 1. KPI (PV는 일별 합계를 합산, UV/신규는 비가산 지표라 GA4에서 직접 조회)
+        perf.section("1. KPI")
+        sel_pv = int(facts.daily_totals(s_dt, e_dt)['screenPageViews'].sum())
+        summary = run_ga4_report(s_dt, e_dt, [], ["activeUsers", "newUsers"])
+        if not summary.empty:
+            sel_uv = int(summary['activeUsers'].iloc[0])
+            sel_new = int(summary['newUsers'].iloc[0])
+        else: sel_uv, sel_new = 0, 0
+        new_visitor_ratio = round((sel_new / sel_uv * 100), 1) if sel_uv > 0 else 0
+
+        # 2. 일별 데이터
+        perf.section("2. 일별 데이터")
+        today = datetime.now().date()
+        e_dt_date = datetime.strptime(e_dt, '%Y-%m-%d').date()
+        actual_end_date = min(today, e_dt_date)
+        actual_e_dt = actual_end_date.strftime('%Y-%m-%d')
     
-    df_weekly = pd.DataFrame(results)
-    if not df_weekly.empty:
-        def extract_week_num(x):
-            match = re.search(r'\d+', str(x))
-            return int(match.group()) if match else 0
-        df_weekly['week_num'] = df_weekly['주차'].apply(extract_week_num)
-        
-        # 2026년 1,2,3,4주차는 2025년 51주차 오른편에 순차적으로 배치
-        # 주차 번호 리스트를 확인하여 연도 경계 처리
-        week_nums = df_weekly['week_num'].tolist()
-        max_week = max(week_nums) if week_nums else 0
-        
-        def sort_key(row):
-            week_num = row['week_num']
-            # 1~4주차이고, 최대 주차가 49 이상이면 (연도 경계) 52 + week_num으로 정렬
-            if week_num <= 4 and max_week >= 49:
-                return 52 + week_num
-            return week_num
-        
-        df_weekly['sort_key'] = df_weekly.apply(sort_key, axis=1)
-        df_weekly = df_weekly.sort_values('sort_key').drop(columns=['sort_key'])
-    else:
-        df_weekly = pd.DataFrame(columns=['주차', 'UV', 'PV'])
+        df_daily = facts.daily_totals(base_dt, actual_e_dt)
+        # 이상치 판정은 확정된 날짜까지만 (오늘/어제는 GA4 집계가 진행 중이라 급감으로 잡힘)
+        final_dt = df_daily.loc[df_daily['final'] == 1, 'date'].max() if not df_daily.empty else None
+        if not df_daily.empty:
+            # 같은 요일 기준 이상치 (기준 4주 포함 이력으로 계산 후 선택 기간만 남김)
+            df_daily = df_daily.rename(columns={'activeUsers':'UV', 'screenPageViews':'PV'})
+            df_daily = anomaly.annotate_daily(df_daily, s_dt).drop(columns=['final']).rename(columns={'date':'날짜'})
+            df_daily['날짜_원본'] = pd.to_datetime(df_daily['날짜'])
+            df_daily = df_daily.sort_values('날짜_원본')
+            df_daily = df_daily[df_daily['날짜_원본'].dt.date <= actual_end_date]
+            df_daily['날짜'] = df_daily['날짜_원본'].dt.strftime('%m-%d')
+            df_daily = df_daily.drop(columns=['날짜_원본'])
+        else:
+            df_daily = pd.DataFrame(columns=['날짜', 'UV', 'PV'])
+    
+        # 3. 장기 추이 (최근 TREND_WEEKS주 + 전년 동주, 주간 합계 캐시)
+        perf.section("3. 장기 추이")
+        df_weekly = fetch_weekly_trend(min(e_dt, datetime.now().strftime('%Y-%m-%d')))
     
-    active_article_count = 0 
-
-    # 4. 유입경로
-    def map_source(s):
-        s = s.lower()
-        if 'naver' in s: return '네이버'
-        if 'daum' in s: return '다음'
-        if 'facebook' in s: return '페이스북'
-        if '(direct)' in s: return '직접'
-        if 'google' in s: return '구글'
-        return '기타'
-    df_t_raw = run_ga4_report(s_dt, e_dt, ["sessionSource"], ["screenPageViews"])
-    if not df_t_raw.empty:
-        df_t_raw['유입경로'] = df_t_raw['sessionSource'].apply(map_source)
-        df_traffic_curr = df_t_raw.groupby('유입경로')['screenPageViews'].sum().reset_index().rename(columns={'screenPageViews':'조회수'})
+        active_article_count = 0 
+
+        # 4. 유입경로
+        perf.section("4. 유입경로")
+        def map_source(s):
+            s = s.lower()
+            if 'naver' in s: return '네이버'
+            if 'daum' in s: return '다음'
+            if 'facebook' in s: return '페이스북'
+            if '(direct)' in s: return '직접'
+            if 'google' in s: return '구글'
+            return '기타'
+        df_t_raw = facts.traffic_by_source(s_dt, e_dt)
+        if not df_t_raw.empty:
+            df_t_raw['유입경로'] = df_t_raw['sessionSource'].apply(map_source)
+            df_traffic_curr = df_t_raw.groupby('유입경로')['screenPageViews'].sum().reset_index().rename(columns={'screenPageViews':'조회수'})
+            # 유입경로별 이상치: 같은 요일 기준 4주 대비
+            df_src = facts.source_daily(base_dt, actual_e_dt)
+            df_src = df_src.assign(유입경로=df_src['sessionSource'].map(map_source)).rename(columns={'screenPageViews': '조회수'})
+            score_e_dt = min(actual_e_dt, final_dt) if isinstance(final_dt, str) else ''  # 확정된 날이 없으면 판정 안 함
+            df_traffic_curr = df_traffic_curr.merge(anomaly.source_period_scores(df_src[df_src['date'] <= score_e_dt], s_dt, score_e_dt), on='유입경로', how='left')
+            df_traffic_curr['이상'] = df_traffic_curr['이상'].fillna('')
         
-        search_engines = ['네이버', '구글', '다음']
-        search_pv = df_traffic_curr[df_traffic_curr['유입경로'].isin(search_engines)]['조회수'].sum()
-        total_pv_traffic = df_traffic_curr['조회수'].sum()
-        search_inflow_ratio = round((search_pv / total_pv_traffic * 100), 1) if total_pv_traffic > 0 else 0
-    else:
-        df_traffic_curr = pd.DataFrame(columns=['유입경로', '조회수'])
-        search_inflow_ratio = 0
+            search_engines = ['네이버', '구글', '다음']
+            search_pv = df_traffic_curr[df_traffic_curr['유입경로'].isin(search_engines)]['조회수'].sum()
+            total_pv_traffic = df_traffic_curr['조회수'].sum()
+            search_inflow_ratio = round((search_pv / total_pv_traffic * 100), 1) if total_pv_traffic > 0 else 0
+        else:
+            df_traffic_curr = pd.DataFrame(columns=['유입경로', '조회수'])
+            search_inflow_ratio = 0
     
-    df_tl_raw = run_ga4_report(ls_dt, le_dt, ["sessionSource"], ["screenPageViews"])
-    if not df_tl_raw.empty:
-        df_tl_raw['유입경로'] = df_tl_raw['sessionSource'].apply(map_source)
-        df_traffic_last = df_tl_raw.groupby('유입경로')['screenPageViews'].sum().reset_index().rename(columns={'screenPageViews':'조회수'})
-    else:
-        df_traffic_last = pd.DataFrame(columns=['유입경로', '조회수'])
-
-    # 5. 방문자 특성
-    def clean_and_group(df, col_name):
-        if df.empty: return pd.DataFrame(columns=['구분', 'activeUsers'])
-        df['구분'] = df[col_name].replace({'(not set)': '기타', '': '기타', 'unknown': '기타'}).fillna('기타')
-        return df.groupby('구분', as_index=False)['activeUsers'].sum()
-
-    region_map = {'Seoul':'서울','Gyeonggi-do':'경기','Incheon':'인천','Busan':'부산','Daegu':'대구','Gyeongsangnam-do':'경남','Gyeongsangbuk-do':'경북','Chungcheongnam-do':'충남','Chungcheongbuk-do':'충북','Jeollanam-do':'전남','Jeollabuk-do':'전북','Gangwon-do':'강원','Daejeon':'대전','Gwangju':'광주','Ulsan':'울산','Jeju-do':'제주','Sejong-si':'세종'}
+        df_tl_raw = facts.traffic_by_source(ls_dt, le_dt)
+        if not df_tl_raw.empty:
+            df_tl_raw['유입경로'] = df_tl_raw['sessionSource'].apply(map_source)
+            df_traffic_last = df_tl_raw.groupby('유입경로')['screenPageViews'].sum().reset_index().rename(columns={'screenPageViews':'조회수'})
+        else:
+            df_traffic_last = pd.DataFrame(columns=['유입경로', '조회수'])
+
+        # 5. 방문자 특성
+        perf.section("5. 방문자 특성")
+        def clean_and_group(df, col_name):
+            if df.empty: return pd.DataFrame(columns=['구분', 'activeUsers'])
+            df['구분'] = df[col_name].replace({'(not set)': '기타', '': '기타', 'unknown': '기타'}).fillna('기타')
+            return df.groupby('구분', as_index=False)['activeUsers'].sum()
+
+        region_map = {'Seoul':'서울','Gyeonggi-do':'경기','Incheon':'인천','Busan':'부산','Daegu':'대구','Gyeongsangnam-do':'경남','Gyeongsangbuk-do':'경북','Chungcheongnam-do':'충남','Chungcheongbuk-do':'충북','Jeollanam-do':'전남','Jeollabuk-do':'전북','Gangwon-do':'강원','Daejeon':'대전','Gwangju':'광주','Ulsan':'울산','Jeju-do':'제주','Sejong-si':'세종'}
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        f_reg_c = executor.submit(run_ga4_report, s_dt, e_dt, ["region"], ["activeUsers"], "activeUsers", 50)
-        f_reg_l = executor.submit(run_ga4_report, ls_dt, le_dt, ["region"], ["activeUsers"], "activeUsers", 50)
-        f_age_c = executor.submit(run_ga4_report, s_dt, e_dt, ["userAgeBracket"], ["activeUsers"], "activeUsers")
-        f_age_l = executor.submit(run_ga4_report, ls_dt, le_dt, ["userAgeBracket"], ["activeUsers"], "activeUsers")
-        f_gen_c = executor.submit(run_ga4_report, s_dt, e_dt, ["userGender"], ["activeUsers"], "activeUsers")
-        f_gen_l = executor.submit(run_ga4_report, ls_dt, le_dt, ["userGender"], ["activeUsers"], "activeUsers")
-
-        d_rc, d_rl = f_reg_c.result(), f_reg_l.result()
-        if not d_rc.empty: d_rc['region_mapped'] = d_rc['region'].map(region_map).fillna('기타')
-        if not d_rl.empty: d_rl['region_mapped'] = d_rl['region'].map(region_map).fillna('기타')
-        df_region_curr = clean_and_group(d_rc, 'region_mapped')
-        df_region_last = clean_and_group(d_rl, 'region_mapped')
-
-        d_ac, d_al = f_age_c.result(), f_age_l.result()
-        for df in [d_ac, d_al]:
-            if not df.empty:
-                df['temp_age'] = df['userAgeBracket'].replace({'unknown': '기타', '(not set)': '기타'}).fillna('기타')
-                df['구분'] = df['temp_age'].apply(lambda x: x + '세' if x != '기타' and '세' not in str(x) else x)
-        df_age_curr = d_ac[d_ac['구분'] != '기타'].groupby('구분', as_index=False)['activeUsers'].sum() if not d_ac.empty else pd.DataFrame(columns=['구분', 'activeUsers'])
-        df_age_last = d_al[d_al['구분'] != '기타'].groupby('구분', as_index=False)['activeUsers'].sum() if not d_al.empty else pd.DataFrame(columns=['구분', 'activeUsers'])
-
-        d_gc, d_gl = f_gen_c.result(), f_gen_l.result()
-        gender_map = {'male': '남성', 'female': '여성'}
-        df_gender_curr = pd.DataFrame(columns=['구분', 'activeUsers'])
-        df_gender_last = pd.DataFrame(columns=['구분', 'activeUsers'])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            f_reg_c = perf.submit(executor, run_ga4_report, s_dt, e_dt, ["region"], ["activeUsers"], "activeUsers", 50)
+            f_reg_l = perf.submit(executor, run_ga4_report, ls_dt, le_dt, ["region"], ["activeUsers"], "activeUsers", 50)
+            f_age_c = perf.submit(executor, run_ga4_report, s_dt, e_dt, ["userAgeBracket"], ["activeUsers"], "activeUsers")
+            f_age_l = perf.submit(executor, run_ga4_report, ls_dt, le_dt, ["userAgeBracket"], ["activeUsers"], "activeUsers")
+            f_gen_c = perf.submit(executor, run_ga4_report, s_dt, e_dt, ["userGender"], ["activeUsers"], "activeUsers")
+            f_gen_l = perf.submit(executor, run_ga4_report, ls_dt, le_dt, ["userGender"], ["activeUsers"], "activeUsers")
+
+            d_rc, d_rl = f_reg_c.result(), f_reg_l.result()
+            if not d_rc.empty: d_rc['region_mapped'] = d_rc['region'].map(region_map).fillna('기타')
+            if not d_rl.empty: d_rl['region_mapped'] = d_rl['region'].map(region_map).fillna('기타')
+            df_region_curr = clean_and_group(d_rc, 'region_mapped')
+            df_region_last = clean_and_group(d_rl, 'region_mapped')
+
+            d_ac, d_al = f_age_c.result(), f_age_l.result()
+            for df in [d_ac, d_al]:
+                if not df.empty:
+                    df['temp_age'] = df['userAgeBracket'].replace({'unknown': '기타', '(not set)': '기타'}).fillna('기타')
+                    df['구분'] = df['temp_age'].apply(lambda x: x + '세' if x != '기타' and '세' not in str(x) else x)
+            df_age_curr = d_ac[d_ac['구분'] != '기타'].groupby('구분', as_index=False)['activeUsers'].sum() if not d_ac.empty else pd.DataFrame(columns=['구분', 'activeUsers'])
+            df_age_last = d_al[d_al['구분'] != '기타'].groupby('구분', as_index=False)['activeUsers'].sum() if not d_al.empty else pd.DataFrame(columns=['구분', 'activeUsers'])
+
+            d_gc, d_gl = f_gen_c.result(), f_gen_l.result()
+            gender_map = {'male': '남성', 'female': '여성'}
+            df_gender_curr = pd.DataFrame(columns=['구분', 'activeUsers'])
+            df_gender_last = pd.DataFrame(columns=['구분', 'activeUsers'])
         
-        if not d_gc.empty:
-            d_gc['mapped'] = d_gc['userGender'].map(gender_map)
-            df_gender_curr = d_gc.dropna(subset=['mapped']).groupby('mapped', as_index=False)['activeUsers'].sum()
-            df_gender_curr = df_gender_curr.rename(columns={'mapped': '구분'})
-            total_gc = d_gc['activeUsers'].sum()
-            mapped_gc = df_gender_curr['activeUsers'].sum() if not df_gender_curr.empty else 0
-            if total_gc > 0 and mapped_gc == 0:
-                df_gender_curr = pd.DataFrame({'구분': ['기타'], 'activeUsers': [total_gc]})
+            if not d_gc.empty:
+                d_gc['mapped'] = d_gc['userGender'].map(gender_map)
+                df_gender_curr = d_gc.dropna(subset=['mapped']).groupby('mapped', as_index=False)['activeUsers'].sum()
+                df_gender_curr = df_gender_curr.rename(columns={'mapped': '구분'})
+                total_gc = d_gc['activeUsers'].sum()
+                mapped_gc = df_gender_curr['activeUsers'].sum() if not df_gender_curr.empty else 0
+                if total_gc > 0 and mapped_gc == 0:
+                    df_gender_curr = pd.DataFrame({'구분': ['기타'], 'activeUsers': [total_gc]})
         
-        if not d_gl.empty:
-            d_gl['mapped'] = d_gl['userGender'].map(gender_map)
-            df_gender_last = d_gl.dropna(subset=['mapped']).groupby('mapped', as_index=False)['activeUsers'].sum()
-            df_gender_last = df_gender_last.rename(columns={'mapped': '구분'})
-            total_gl = d_gl['activeUsers'].sum()
-            mapped_gl = df_gender_last['activeUsers'].sum() if not df_gender_last.empty else 0
-            if total_gl > 0 and mapped_gl == 0:
-                df_gender_last = pd.DataFrame({'구분': ['기타'], 'activeUsers': [total_gl]})
-
-    # 6. TOP 10 및 크롤링
-    # 6-0. 전체 활성 기사 데이터 가져오기 (활성기사 수, 발행기사 수 계산용)
-    df_raw_all_articles = run_ga4_report(s_dt, e_dt, ["pageTitle", "pagePath"], ["screenPageViews", "activeUsers", "newUsers", "userEngagementDuration", "bounceRate"], "screenPageViews", limit=None)
+            if not d_gl.empty:
+                d_gl['mapped'] = d_gl['userGender'].map(gender_map)
+                df_gender_last = d_gl.dropna(subset=['mapped']).groupby('mapped', as_index=False)['activeUsers'].sum()
+                df_gender_last = df_gender_last.rename(columns={'mapped': '구분'})
+                total_gl = d_gl['activeUsers'].sum()
+                mapped_gl = df_gender_last['activeUsers'].sum() if not df_gender_last.empty else 0
+                if total_gl > 0 and mapped_gl == 0:
+                    df_gender_last = pd.DataFrame({'구분': ['기타'], 'activeUsers': [total_gl]})
+
+        # 6. TOP 10 및 크롤링
+        perf.section("6. TOP 10 및 크롤링")
+        # 6-0. 전체 활성 기사 데이터 가져오기 (활성기사 수, 발행기사 수 계산용)
+        df_pages = facts.article_metrics(s_dt, e_dt)
+        df_raw_all_articles = article_rows(df_pages)
     
-    # 활성기사 수 계산 (전체 활성 기사 기준, 동일 기사는 합산)
-    active_article_count = 0
-    if not df_raw_all_articles.empty:
-        mask_article = df_raw_all_articles['pagePath'].str.contains(r'article|news|view|story', case=False, regex=True, na=False)
-        df_articles = df_raw_all_articles[mask_article]
-        if df_articles.empty:
-            df_articles = df_raw_all_articles[df_raw_all_articles['pagePath'].str.len() > 1]
-        # 동일 기사(pagePath)는 합산하여 고유 기사 수 계산
-        active_article_count = df_articles['pagePath'].nunique()
+        # 활성기사 수 계산 (전체 페이지 중 기사 경로 고유 개수, 동일 기사는 합산)
+        active_article_count = count_active_articles(df_pages)
     
-    # TOP 10 선정용 데이터 (크롤링은 top10만 수행)
-    df_raw_top = run_ga4_report(s_dt, e_dt, ["pageTitle", "pagePath"], ["screenPageViews", "activeUsers", "newUsers", "userEngagementDuration", "bounceRate"], "screenPageViews", limit=100)
+        # TOP 10 선정용 데이터 (크롤링은 top10만 수행) - 기존과 같이 사이트명 제목만 제외 (기사 경로 조건 없음)
+        df_raw_top = top_n_articles(compact_metrics(exclude_branded_titles(df_pages), ARTICLE_METRICS))
     
-    df_top10_sources = pd.DataFrame()
-    df_sources_raw = pd.DataFrame()  # 초기화 추가
-    best_source_map = {}  # 초기화 추가
+        df_top10_sources = pd.DataFrame()
+        df_sources_raw = pd.DataFrame()  # 초기화 추가
+        best_source_map = {}  # 초기화 추가
 
-    if not df_raw_top.empty:
-        def is_excluded(row):
-            t = str(row['pageTitle']).lower().replace(' ', '')
-            if 'cook&chef' in t or '쿡앤셰프' in t: return True
-            return False
-        exclude_mask = df_raw_top.apply(is_excluded, axis=1)
-        df_raw_all = df_raw_top[~exclude_mask].copy()
+        if not df_raw_top.empty:
+            # 사이트명 제목 제외는 후보 선정 시 적용됨
+            df_raw_all = df_raw_top
         
-        df_sorted = df_raw_all.sort_values('screenPageViews', ascending=False).head(10)
-        paths = df_sorted['pagePath'].tolist()
+            df_sorted = df_raw_all.sort_values('screenPageViews', ascending=False).head(10)
+            paths = df_sorted['pagePath'].tolist()
+            # 방문자 수/신규 방문자 수: TOP 10 경로만 GA4 조회 (기간 전체 기준 중복 제거 값)
+            df_sorted = attach_article_users(df_sorted, s_dt, e_dt)
         
-        if paths:
-            # 6-1. 유입경로 데이터 수집 (Raw Data)
-            filter_ex = FilterExpression(
-                filter=Filter(
-                    field_name="pagePath",
-                    in_list_filter=Filter.InListFilter(values=paths, case_sensitive=False)
-                )
-            )
-            df_sources_raw = run_ga4_report(
-                s_dt, e_dt, 
-                ["pagePath", "sessionSource"], 
-                ["screenPageViews"], 
-                limit=1000, 
-                dimension_filter=filter_ex
-            )
+            if paths:
+                # 6-1. 유입경로 데이터 수집 (팩트 테이블 pagePath × sessionSource 집계)
+                df_sources_raw = facts.article_sources(s_dt, e_dt, paths)
+                # 6-1-1. 기사별 일별 조회 곡선 (같은 팩트 테이블, 오늘까지)
+                df_top10_daily = fetch_top_daily(s_dt, actual_e_dt, paths)
             
-            if not df_sources_raw.empty:
-                # category (네이버, 구글 등) 매핑
-                df_sources_raw['category'] = df_sources_raw['sessionSource'].apply(map_source)
+                if not df_sources_raw.empty:
+                    # category (네이버, 구글 등) 매핑
+                    df_sources_raw['category'] = df_sources_raw['sessionSource'].apply(map_source)
                 
-                # [A] 테이블용: 기사별로 가장 많이 유입된 경로 찾기
-                # pagePath별로 조회수 내림차순 정렬 후 첫 번째 행 추출
-                df_best_source = df_sources_raw.sort_values('screenPageViews', ascending=False).drop_duplicates('pagePath')
-                # '기타'인 경우 구체적 경로 표시, 아니면 카테고리 표시
-                df_best_source['best_source_display'] = df_best_source.apply(
-                    lambda x: f"기타({x['sessionSource']})" if x['category'] == '기타' else x['category'], axis=1
-                )
-                best_source_map = dict(zip(df_best_source['pagePath'], df_best_source['best_source_display']))
+                    # [A] 테이블용: 기사별로 가장 많이 유입된 경로 찾기
+                    # pagePath별로 조회수 내림차순 정렬 후 첫 번째 행 추출
+                    df_best_source = df_sources_raw.sort_values('screenPageViews', ascending=False).drop_duplicates('pagePath')
+                    # '기타'인 경우 구체적 경로 표시, 아니면 카테고리 표시
+                    df_best_source['best_source_display'] = df_best_source.apply(
+                        lambda x: f"기타({x['sessionSource']})" if x['category'] == '기타' else x['category'], axis=1
+                    )
+                    best_source_map = dict(zip(df_best_source['pagePath'], df_best_source['best_source_display']))
                 
-                # [B] 차트용: (pagePath, category) 그룹핑 + 툴팁용 상세 경로(top_detail) 추출
-                # B-1. 그룹별 최다 유입 raw source 찾기
-                df_grp_best = df_sources_raw.sort_values('screenPageViews', ascending=False).drop_duplicates(['pagePath', 'category'])
-                df_grp_best = df_grp_best[['pagePath', 'category', 'sessionSource']].rename(columns={'sessionSource': 'top_detail'})
+                    # [B] 차트용: (pagePath, category) 그룹핑 + 툴팁용 상세 경로(top_detail) 추출
+                    # B-1. 그룹별 최다 유입 raw source 찾기
+                    df_grp_best = df_sources_raw.sort_values('screenPageViews', ascending=False).drop_duplicates(['pagePath', 'category'])
+                    df_grp_best = df_grp_best[['pagePath', 'category', 'sessionSource']].rename(columns={'sessionSource': 'top_detail'})
                 
-                # B-2. 그룹별 조회수 합계
-                df_grp_sum = df_sources_raw.groupby(['pagePath', 'category'], as_index=False)['screenPageViews'].sum()
+                    # B-2. 그룹별 조회수 합계
+                    df_grp_sum = df_sources_raw.groupby(['pagePath', 'category'], as_index=False)['screenPageViews'].sum()
                 
-                # B-3. 병합 (합계 + 상세경로)
-                df_top10_sources = pd.merge(df_grp_sum, df_grp_best, on=['pagePath', 'category'], how='left')
-                df_top10_sources = df_top10_sources.rename(columns={'category': '유입경로'})
+                    # B-3. 병합 (합계 + 상세경로)
+                    df_top10_sources = pd.merge(df_grp_sum, df_grp_best, on=['pagePath', 'category'], how='left')
+                    df_top10_sources = df_top10_sources.rename(columns={'category': '유입경로'})
 
-            else:
-                best_source_map = {}
+                else:
+                    best_source_map = {}
 
-        # 6-2. 크롤링 수행
-        scraped_data_dict = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(crawl_single_article_cached, path): idx for idx, path in enumerate(paths)}
-            for future in concurrent.futures.as_completed(futures):
-                idx = futures[future]
-                try:
-                    result = future.result(timeout=3.0)
-                    scraped_data_dict[idx] = result
-                except: scraped_data_dict[idx] = ("관리자", 0, 0, "뉴스", "이슈", "-")
+            # 6-2. 크롤링 수행
+            scraped_data_dict = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+                futures = {perf.submit(executor, fetch_article_meta, path): idx for idx, path in enumerate(paths)}
+                for future in concurrent.futures.as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        result = future.result(timeout=3.0)
+                        scraped_data_dict[idx] = result
+                    except: scraped_data_dict[idx] = DEFAULT_ARTICLE_META
         
-        scraped_data = [scraped_data_dict[i] for i in range(len(paths))]
-        auths, lks, cmts, cats, subcats, reg_dates = zip(*scraped_data) if scraped_data else ([], [], [], [], [], [])
+            scraped_data = [scraped_data_dict[i] for i in range(len(paths))]
+            auths, lks, cmts, cats, subcats, reg_dates = zip(*scraped_data) if scraped_data else ([], [], [], [], [], [])
         
-        # 6-3. 데이터 병합 및 정리
-        df_sorted['작성자'] = list(auths) if auths else ["관리자"] * len(df_sorted)
-        df_sorted['좋아요'] = list(lks) if lks else [0] * len(df_sorted)
-        df_sorted['댓글'] = list(cmts) if cmts else [0] * len(df_sorted)
-        df_sorted['카테고리'] = list(cats) if cats else ["뉴스"] * len(df_sorted)
-        df_sorted['세부카테고리'] = list(subcats) if subcats else ["이슈"] * len(df_sorted)
-        df_sorted['실발행일시'] = list(reg_dates) if reg_dates else ["-"] * len(df_sorted)
+            # 6-3. 데이터 병합 및 정리
+            df_sorted['작성자'] = list(auths) if auths else ["관리자"] * len(df_sorted)
+            df_sorted['좋아요'] = list(lks) if lks else [0] * len(df_sorted)
+            df_sorted['댓글'] = list(cmts) if cmts else [0] * len(df_sorted)
+            df_sorted['카테고리'] = list(cats) if cats else ["뉴스"] * len(df_sorted)
+            df_sorted['세부카테고리'] = list(subcats) if subcats else ["이슈"] * len(df_sorted)
+            df_sorted['실발행일시'] = list(reg_dates) if reg_dates else ["-"] * len(df_sorted)
         
-        def is_excluded_author(row):
-            a = str(row['작성자']).lower().replace(' ', '')
-            if '인기기사' in a: return True
-            return False
-            
-        exclude_mask_author = df_sorted.apply(is_excluded_author, axis=1)
-        df_top10 = df_sorted[~exclude_mask_author].copy()
-        df_top10['순위'] = range(1, len(df_top10)+1)
-        df_top10 = df_top10.rename(columns={'pageTitle': '제목', 'pagePath': '경로', 'screenPageViews': '전체조회수', 'activeUsers': '전체방문자수', 'userEngagementDuration': '평균체류시간', 'bounceRate': '이탈률'})
+            # 작성자 필터링 (인기기사 제외)
+            df_top10 = df_sorted[~popular_author_mask(df_sorted['작성자'])].copy()
+            df_top10['순위'] = range(1, len(df_top10)+1)
+            df_top10 = df_top10.rename(columns={'pageTitle': '제목', 'pagePath': '경로', 'screenPageViews': '전체조회수', 'activeUsers': '전체방문자수', 'userEngagementDuration': '평균체류시간', 'bounceRate': '이탈률'})
         
-        df_raw_all = df_raw_top.copy()
-        def format_duration(sec):
-            try:
-                sec_int = int(float(sec))
-                m, s = divmod(sec_int, 60)
-                return f"{m}분 {s}초"
-            except: return "0분 0초"
-        df_top10['체류시간_fmt'] = df_top10['평균체류시간'].apply(format_duration)
-        df_top10['발행일시'] = df_top10['실발행일시']
+            df_raw_all = df_raw_top
+            def format_duration(sec):
+                try:
+                    sec_int = int(float(sec))
+                    m, s = divmod(sec_int, 60)
+                    return f"{m}분 {s}초"
+                except: return "0분 0초"
+            df_top10['체류시간_fmt'] = df_top10['평균체류시간'].apply(format_duration)
+            df_top10['발행일시'] = df_top10['실발행일시']
         
-        if 'newUsers' in df_top10.columns and '전체방문자수' in df_top10.columns:
-            df_top10['신규방문자비율'] = df_top10.apply(
-                lambda row: f"{round((float(row['newUsers']) / float(row['전체방문자수']) * 100), 1) if float(row['전체방문자수']) > 0 else 0}%",
-                axis=1
-            )
-        else: df_top10['신규방문자비율'] = f"{new_visitor_ratio}%"
+            if 'newUsers' in df_top10.columns and '전체방문자수' in df_top10.columns:
+                users = df_top10['전체방문자수'].astype(float)
+                ratio = (df_top10['newUsers'].astype(float) / users.where(users > 0) * 100).round(1)
+                df_top10['신규방문자비율'] = (ratio.astype(str) + '%').where(users > 0, '0%')
+            else: df_top10['신규방문자비율'] = f"{new_visitor_ratio}%"
         
-        # [테이블용] 유입경로 1순위 컬럼 추가
-        if not df_sources_raw.empty and best_source_map:
-            df_top10['유입경로 1순위'] = df_top10['경로'].map(best_source_map).fillna("-")
-        else:
-            df_top10['유입경로 1순위'] = "-"
+            # [테이블용] 유입경로 1순위 컬럼 추가
+            if not df_sources_raw.empty and best_source_map:
+                df_top10['유입경로 1순위'] = df_top10['경로'].map(best_source_map).fillna("-")
+            else:
+                df_top10['유입경로 1순위'] = "-"
             
-        # 기존 로직 (최다유입 % 표시용 - 하위 호환성 유지)
-        if not df_top10_sources.empty:
-            page_sums = df_top10_sources.groupby('pagePath')['screenPageViews'].transform('sum')
-            df_top10_sources['ratio'] = (df_top10_sources['screenPageViews'] / page_sums * 100).round(1)
-            # 여기서는 최다유입 표시용으로 기존처럼 둠 (UI에서는 위에서 만든 '유입경로 1순위'를 쓸 예정)
-            df_top10['최다유입'] = df_top10['유입경로 1순위'] 
-        else:
-            df_top10['최다유입'] = "-"
+            # 기존 로직 (최다유입 % 표시용 - 하위 호환성 유지)
+            if not df_top10_sources.empty:
+                page_sums = df_top10_sources.groupby('pagePath')['screenPageViews'].transform('sum')
+                df_top10_sources['ratio'] = (df_top10_sources['screenPageViews'] / page_sums * 100).round(1)
+                # 여기서는 최다유입 표시용으로 기존처럼 둠 (UI에서는 위에서 만든 '유입경로 1순위'를 쓸 예정)
+                df_top10['최다유입'] = df_top10['유입경로 1순위'] 
+            else:
+                df_top10['최다유입'] = "-"
 
-    else: 
-        df_top10 = pd.DataFrame()
-        df_raw_all = pd.DataFrame()
-        df_top10_sources = pd.DataFrame()
+        else: 
+            df_top10 = pd.DataFrame()
+            df_raw_all = pd.DataFrame()
+            df_top10_sources = pd.DataFrame()
     
-    # 전체 활성 기사 데이터 정리 (발행기사 수 계산용, 6-7페이지용)
-    published_article_count = 0
-    df_raw_all_articles_filtered = pd.DataFrame()
-    df_all_articles_with_metadata = pd.DataFrame()  # 6-7페이지용 (크롤링 데이터 포함)
-    
-    if not df_raw_all_articles.empty:
-        def is_excluded_all(row):
-            t = str(row['pageTitle']).lower().replace(' ', '')
-            if 'cook&chef' in t or '쿡앤셰프' in t: return True
-            return False
-        exclude_mask_all = df_raw_all_articles.apply(is_excluded_all, axis=1)
-        df_raw_all_articles_filtered = df_raw_all_articles[~exclude_mask_all].copy()
-        
-        # 기사 경로 필터링
-        mask_article_all = df_raw_all_articles_filtered['pagePath'].str.contains(r'article|news|view|story', case=False, regex=True, na=False)
-        df_raw_all_articles_filtered = df_raw_all_articles_filtered[mask_article_all].copy()
-        
-        # 발행기사 수 계산: 전체 기사 목록 페이지 크롤링으로 속도 개선
+        # 전체 활성 기사 데이터 정리 (발행기사 수 계산용, 6-7페이지용)
+        perf.section("7. 발행기사 및 메타데이터")
         published_article_count = 0
-        s_dt_date = datetime.strptime(s_dt, '%Y-%m-%d').date()
-        e_dt_date = datetime.strptime(e_dt, '%Y-%m-%d').date()
-        
-        def is_published_in_week(reg_date_str):
-            if reg_date_str == "-" or not reg_date_str:
-                return False
-            try:
-                # "2026-01-28" 또는 "2026-01-28 14:30" 형식 파싱
-                date_part = reg_date_str.split()[0] if ' ' in reg_date_str else reg_date_str
-                # "2026.01.28" 형식도 처리
-                if '.' in date_part:
-                    date_part = date_part.replace('.', '-')
-                pub_date = datetime.strptime(date_part, '%Y-%m-%d').date()
-                return s_dt_date <= pub_date <= e_dt_date
-            except:
-                return False
-        
-        # 전체 기사 목록 페이지 크롤링 (여러 페이지 확인) - 속도 개선
-        published_articles_from_list = []
-        max_pages_to_check = 20  # 최대 20페이지까지 확인 (충분한 범위)
-        found_articles_in_week = False
-        found_older_articles = False
+        df_raw_all_articles_filtered = pd.DataFrame()
+        df_all_articles_with_metadata = pd.DataFrame()  # 6-7페이지용 (크롤링 데이터 포함)
+    
+        if not df_raw_all_articles.empty:
+            # 기사 경로/제목 제외 필터는 article_rows에서 적용됨
+            df_raw_all_articles_filtered = df_raw_all_articles
         
-        for page_num in range(1, max_pages_to_check + 1):
-            articles = crawl_article_list_page(page_num)
-            if not articles:
-                break  # 더 이상 기사가 없으면 중단
-            
-            page_has_week_article = False
-            for article in articles:
-                pub_date_str = article.get('published_date', '-')
-                if pub_date_str == '-':
-                    continue
-                
-                if is_published_in_week(pub_date_str):
-                    published_articles_from_list.append(article)
-                    page_has_week_article = True
-                    found_articles_in_week = True
-                else:
-                    # 주차 기간을 벗어난 기사 날짜 확인
-                    try:
-                        date_part = pub_date_str.split()[0] if ' ' in pub_date_str else pub_date_str
-                        if '.' in date_part:
-                            date_part = date_part.replace('.', '-')
-                        pub_date = datetime.strptime(date_part, '%Y-%m-%d').date()
-                        if pub_date < s_dt_date:
-                            found_older_articles = True
-                    except:
-                        pass
-            
-            # 주차 시작일보다 이전 기사만 있는 페이지가 나오면 중단 (최신순 정렬 가정)
-            if found_older_articles and not page_has_week_article:
-                break
+            # 발행기사 목록: 사이트맵/RSS 한 번 조회 (없거나 기간을 다 담지 못하면 목록 페이지 크롤링)
+            published_article_count = 0
+            s_dt_date = datetime.strptime(s_dt, '%Y-%m-%d').date()
+            e_dt_date = datetime.strptime(e_dt, '%Y-%m-%d').date()
+            # 목록 페이지 대체 시 주간 기준 최대 20페이지, 월/분기 등 긴 기간은 주 수에 비례하여 확장
+            max_pages_to_check = 20 * max(1, -(-((e_dt_date - s_dt_date).days + 1) // 7))
+            published_articles_from_list = discover_published(s_dt, e_dt, max_pages_to_check)
         
-        # 발행기사 수 계산은 GA4 데이터와 매칭 후에 수행
+            # 발행기사 수 계산은 GA4 데이터와 매칭 후에 수행
         
-        # 6-7페이지용: 해당 주차에 발행된 기사만 크롤링하여 메타데이터 획득
-        if published_articles_from_list:
-            published_paths = [a['path'] for a in published_articles_from_list]
-            # GA4 데이터와 매칭하여 조회수 등 정보 가져오기
-            df_published_articles = df_raw_all_articles_filtered[df_raw_all_articles_filtered['pagePath'].isin(published_paths)].copy()
+            # 6-7페이지용: 해당 주차에 발행된 기사만 크롤링하여 메타데이터 획득
+            if published_articles_from_list:
+                published_paths = [a['path'] for a in published_articles_from_list]
+                # GA4 데이터와 매칭하여 조회수 등 정보 가져오기
+                df_published_articles = df_raw_all_articles_filtered[df_raw_all_articles_filtered['pagePath'].isin(published_paths)]
             
-            # 발행기사 수 계산: GA4 데이터와 매칭된 기사만 카운트 (1페이지 발행기사 수와 동일한 기준)
-            published_article_count = len(df_published_articles) if not df_published_articles.empty else 0
+                # 발행기사 수 계산: GA4 데이터와 매칭된 기사만 카운트 (1페이지 발행기사 수와 동일한 기준)
+                published_article_count = len(df_published_articles) if not df_published_articles.empty else 0
             
-            if not df_published_articles.empty:
-                # GA4 데이터와 매칭된 기사의 경로만 사용 (df_published_articles의 실제 경로)
-                matched_paths = df_published_articles['pagePath'].tolist()
+                if not df_published_articles.empty:
+                    # 방문자 수는 발행 기사 경로만 GA4 조회
+                    df_published_articles = attach_article_users(df_published_articles, s_dt, e_dt)
+                    # GA4 데이터와 매칭된 기사의 경로만 사용 (df_published_articles의 실제 경로)
+                    matched_paths = df_published_articles['pagePath'].tolist()
+                
+                    # 해당 기사들에 대해 상세 정보 크롤링 (작성자, 카테고리 등)
+                    scraped_data_dict = {}
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+                        futures = {perf.submit(executor, fetch_article_meta, path): path for path in matched_paths}
+                        for future in concurrent.futures.as_completed(futures):
+                            path = futures[future]
+                            try:
+                                result = future.result(timeout=3.0)
+                                scraped_data_dict[path] = result
+                            except:
+                                scraped_data_dict[path] = DEFAULT_ARTICLE_META
                 
-                # 해당 기사들에 대해 상세 정보 크롤링 (작성자, 카테고리 등)
-                scraped_data_dict = {}
-                with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-                    futures = {executor.submit(crawl_single_article_cached, path): path for path in matched_paths}
-                    for future in concurrent.futures.as_completed(futures):
-                        path = futures[future]
-                        try:
-                            result = future.result(timeout=3.0)
-                            scraped_data_dict[path] = result
-                        except:
-                            scraped_data_dict[path] = ("관리자", 0, 0, "뉴스", "이슈", "-")
+                    # df_published_articles의 각 행에 맞춰서 크롤링 데이터 매핑 (경로 기준 join)
+                    df_meta = pd.DataFrame.from_dict(scraped_data_dict, orient='index', columns=ARTICLE_META_COLUMNS)
+                    df_all_articles_with_metadata = df_published_articles.join(df_meta, on='pagePath')
+                    df_all_articles_with_metadata = df_all_articles_with_metadata.fillna(dict(zip(ARTICLE_META_COLUMNS, DEFAULT_ARTICLE_META)))
                 
-                # df_published_articles의 각 행에 맞춰서 크롤링 데이터 매핑
-                df_all_articles_with_metadata = df_published_articles.copy()
-                df_all_articles_with_metadata['작성자'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[0]
-                )
-                df_all_articles_with_metadata['좋아요'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[1]
-                )
-                df_all_articles_with_metadata['댓글'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[2]
-                )
-                df_all_articles_with_metadata['카테고리'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[3]
-                )
-                df_all_articles_with_metadata['세부카테고리'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[4]
-                )
-                df_all_articles_with_metadata['실발행일시'] = df_all_articles_with_metadata['pagePath'].apply(
-                    lambda x: scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))[5] if len(scraped_data_dict.get(x, ("관리자", 0, 0, "뉴스", "이슈", "-"))) > 5 else "-"
-                )
+                    # 컬럼명 변경 및 정리
+                    df_all_articles_with_metadata = df_all_articles_with_metadata.rename(columns={
+                        'pageTitle': '제목', 
+                        'pagePath': '경로', 
+                        'screenPageViews': '전체조회수', 
+                        'activeUsers': '전체방문자수', 
+                        'userEngagementDuration': '평균체류시간', 
+                        'bounceRate': '이탈률'
+                    })
                 
-                # 컬럼명 변경 및 정리
-                df_all_articles_with_metadata = df_all_articles_with_metadata.rename(columns={
-                    'pageTitle': '제목', 
-                    'pagePath': '경로', 
-                    'screenPageViews': '전체조회수', 
-                    'activeUsers': '전체방문자수', 
-                    'userEngagementDuration': '평균체류시간', 
-                    'bounceRate': '이탈률'
-                })
+                    # 작성자 필터링 (인기기사 제외)
+                    df_all_articles_with_metadata = df_all_articles_with_metadata[~popular_author_mask(df_all_articles_with_metadata['작성자'])]
                 
-                # 작성자 필터링 (인기기사 제외)
-                def is_excluded_author_all(row):
-                    a = str(row['작성자']).lower().replace(' ', '')
-                    if '인기기사' in a: return True
-                    return False
-                exclude_mask_author_all = df_all_articles_with_metadata.apply(is_excluded_author_all, axis=1)
-                df_all_articles_with_metadata = df_all_articles_with_metadata[~exclude_mask_author_all].copy()
+                    # 반복되는 문자열은 category, 좋아요/댓글은 int32로 축소
+                    df_all_articles_with_metadata = df_all_articles_with_metadata.astype({
+                        '작성자': 'category', '카테고리': 'category', '세부카테고리': 'category',
+                        '좋아요': 'int32', '댓글': 'int32'
+                    })
+                else:
+                    df_all_articles_with_metadata = pd.DataFrame()
             else:
                 df_all_articles_with_metadata = pd.DataFrame()
-        else:
-            df_all_articles_with_metadata = pd.DataFrame()
+
+        # 8. 기자별 집계 (본명/필명 표를 한 번에 만들어 보고서와 함께 캐시)
+        perf.section("8. 기자별 집계")
+        writer_stats = compute_writer_stats(df_all_articles_with_metadata)
     except Exception as e:
         # 예외 발생 시에도 초기화된 기본값 반환
         pass
 
-    return (sel_uv, sel_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last, 
+    return DashboardReport(sel_uv, sel_pv, df_daily, df_weekly, df_traffic_curr, df_traffic_last, 
             df_region_curr, df_region_last, df_age_curr, df_age_last, df_gender_curr, df_gender_last, 
-            df_top10, df_raw_all, new_visitor_ratio, search_inflow_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata)
+            df_top10, df_raw_all, new_visitor_ratio, search_inflow_ratio, active_article_count, df_top10_sources, published_article_count, df_all_articles_with_metadata, df_top10_daily, writer_stats)
 
-def get_writers_df_real(df_target):
-    # 1. 엑셀 데이터로부터 매핑 딕셔너리 생성 (필명 -> 본명)
-    #    동일한 필명이 여러 명에게 할당되지 않았다고 가정 (1:1 또는 N:1 구조)
-    #    AUTHOR_MAPPING_DATA는 {'본명': ..., '필명': ...} 리스트
-    pen_to_real_map = {item['필명']: item['본명'] for item in AUTHOR_MAPPING_DATA}
-    
-    if df_target.empty or '작성자' not in df_target.columns: return pd.DataFrame()
+def load_group_overview(period, end_date=None, site_keys=None):
+    """여러 사이트 보고서를 동시에 로드하고 그룹 현황표를 만든다
 
-    # 2. 크롤링된 데이터(df_target)의 '작성자'(필명) 컬럼을 기준으로 본명 매핑
-    #    매핑되지 않는 필명은 '미상' 대신 원래 필명을 본명으로 사용하거나 별도 처리가능. 
-    #    여기서는 필명을 그대로 유지(혹은 '미상')하고 진행.
-    df_work = df_target.copy()
-    df_work['본명_mapped'] = df_work['작성자'].map(pen_to_real_map).fillna(df_work['작성자'])
-    
-    # 3. [기자별 집계]는 '필명(작성자)' 단위로 수행해야 views.py의 로직(필명 기준 필터링 등)과 호환됨.
-    #    따라서 GroupBy는 '작성자'(필명)로 수행하되, '본명' 컬럼을 보존해야 함.
-    writers = df_work.groupby(['작성자', '본명_mapped']).agg(
-        기사수=('제목','count'), 
-        총조회수=('전체조회수','sum'),
-        좋아요=('좋아요', 'sum'),
-        댓글=('댓글', 'sum')
-    ).reset_index()
-    
-    # 4. 정렬 (총조회수 내림차순)
-    writers = writers.sort_values('총조회수', ascending=False)
-    writers['순위'] = range(1, len(writers)+1)
-    
-    # 5. 평균조회수 계산
-    writers['평균조회수'] = (writers['총조회수']/writers['기사수']).astype(int)
-    
-    # 6. 컬럼명 조정 (views.py와의 호환성 유지)
-    #    views.py의 render_writer_real는 '작성자'를 본명으로, '필명'을 필명으로 출력하려고 시도함.
-    #    views.py의 render_writer_pen는 '필명'을 필명으로, '작성자'를 본명으로 출력하려고 시도함.
-    #    
-    #    따라서 반환하는 DataFrame의 컬럼을 다음과 같이 설정:
-    #    - '작성자': 본명 (Real Name)
-    #    - '필명': 필명 (Pen Name)
-    #    이렇게 하면 views.py에서:
-    #      - Tab 7(본명): 작성자(본명) | 필명(필명) -> OK
-    #      - Tab 8(필명): 필명(필명) | 본명(작성자) -> OK
-    
-    writers = writers.rename(columns={'작성자': '필명', '본명_mapped': '작성자'})
-    
-    return writers
\ No newline at end of file
+    사이트별 파이프라인은 병렬로 실행되고 GA4 호출은 GA4_SCHEDULER가 속성별/전체 동시 요청을 조절하므로,
+    사이트를 추가해도 전체 소요 시간이 사이트 수만큼 늘어나지 않는다. 각 사이트 결과는
+    load_all_dashboard_data 캐시(사이트별)를 그대로 사용한다.
+    반환: ({사이트 키: DashboardReport}, 그룹 현황 DataFrame)
+    """
+    site_keys = list(site_keys or config.SITES.keys())
+
+    def load_site(key):
+        # 사이트별 trace로 기록 (성능 진단 화면에서 사이트별 워터폴 확인)
+        with perf.trace(f"{config.SITES[key]['name']} {period}" + (f" ~ {end_date}" if end_date else "")):
+            return load_all_dashboard_data(period, end_date, key)
+
+    reports = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(site_keys))) as executor:
+        futures = {executor.submit(load_site, key): key for key in site_keys}
+        for future in concurrent.futures.as_completed(futures):
+            reports[futures[future]] = future.result()
+
+    rows = []
+    for key in site_keys:
+        r = reports[key]
+        rows.append({
+            '사이트': config.SITES[key]['name'], 'UV': r.cur_uv, 'PV': r.cur_pv,
+            '방문자당 페이지뷰': round(r.cur_pv / r.cur_uv, 1) if r.cur_uv > 0 else 0,
+            '신규 방문자 비율': r.new_ratio, '검색 유입 비율': r.search_ratio,
+            '활성 기사 수': r.active_article_count, '발행 기사 수': r.published_article_count,
+        })
+    df_overview = pd.DataFrame(rows)
+    if len(df_overview) > 1:
+        # 합계 행: UV는 사이트 간 중복 방문자를 구분할 수 없어 단순 합계 (상한값)
+        total = {'사이트': '그룹 합계', 'UV': int(df_overview['UV'].sum()), 'PV': int(df_overview['PV'].sum()),
+                 '활성 기사 수': int(df_overview['활성 기사 수'].sum()), '발행 기사 수': int(df_overview['발행 기사 수'].sum())}
+        total['방문자당 페이지뷰'] = round(total['PV'] / total['UV'], 1) if total['UV'] > 0 else 0
+        df_overview = pd.concat([df_overview, pd.DataFrame([total])], ignore_index=True)
+    return reports, df_overview
+
+def writer_mapping_date(df_target):
+    """본명-필명 매핑 기준일: 기사 중 가장 늦은 발행일 (발행일을 알 수 없으면 오늘)"""
+    if '실발행일시' not in df_target.columns:
+        return None
+    # 발행일시는 'YYYY-MM-DD HH:MM' 문자열이라 문자열 최댓값이 가장 늦은 날짜 ('-'는 숫자보다 앞)
+    latest = pd.to_datetime(df_target['실발행일시'].astype(str).max()[:10], errors='coerce')
+    return None if pd.isna(latest) else latest.date()
+
+def _rank_writers(df, key_cols):
+    """기자별 합계 -> 순위(총조회수 내림차순), 평균조회수, 점유율(%), 이상 표시"""
+    df = df.sort_values('총조회수', ascending=False)
+    df['순위'] = range(1, len(df)+1)
+    df['평균조회수'] = (df['총조회수']/df['기사수']).astype(int)
+    df = anomaly.annotate_groups(df, '평균조회수')
+    # 비율 계산 (각 지표 중에서의 점유율)
+    for col in ['총조회수', '평균조회수']:
+        total = df[col].sum()
+        df[f'{col}_비율'] = (df[col] / total * 100).round(1) if total > 0 else 0.0
+    return df[['순위'] + key_cols + WRITER_STAT_COLUMNS].reset_index(drop=True)
+
+def compute_writer_stats(df_target, on=None):
+    """기자별 집계 (7페이지): 기사 행은 필명 코드로 한 번만 합산하고, 본명 집계는 필명 표를 다시 묶어서 만든다.
+
+    필명은 직함을 제거(normalize)한 뒤 Categorical 코드로 묶고, 본명은 authors 레지스트리의 기준일(on, 기본은
+    가장 늦은 발행일) 매핑을 쓴다 (매핑 없는 필명은 필명을 본명으로 사용).
+    반환: WriterStats(by_real, by_pen) - 순위/본명(필명)/기사수/총조회수/평균조회수/좋아요/댓글/점유율/이상
+    """
+    if df_target.empty or '작성자' not in df_target.columns:
+        return WriterStats(pd.DataFrame(columns=['순위', '본명'] + WRITER_STAT_COLUMNS),
+                           pd.DataFrame(columns=['순위', '필명', '본명'] + WRITER_STAT_COLUMNS))
+
+    # 1. 필명 범주(고유값)만 정규화하고, 정규화 후 같아진 이름은 같은 코드로 합침
+    pens = pd.Categorical(df_target['작성자'])
+    cat_codes, pen_names = pd.factorize(author_names(pens.categories), sort=True)
+    codes = np.append(cat_codes, -1)[pens.codes]  # 작성자 결측(-1)은 집계 제외
+    valid = codes >= 0
+    n = len(pen_names)
+
+    # 2. 필명 코드별 합계 (기사 행을 훑는 유일한 단계)
+    def code_sum(col):
+        values = np.nan_to_num(pd.to_numeric(df_target[col], errors='coerce').to_numpy(dtype=float)[valid])
+        return np.bincount(codes[valid], weights=values, minlength=n).round().astype('int64')
+    by_pen = pd.DataFrame({
+        '필명': np.asarray(pen_names, dtype=object),
+        '기사수': np.bincount(codes[valid & df_target['제목'].notna().to_numpy()], minlength=n),
+        '총조회수': code_sum('전체조회수'),
+        '좋아요': code_sum('좋아요'),
+        '댓글': code_sum('댓글'),
+    })
+    by_pen = by_pen[by_pen['기사수'] > 0].reset_index(drop=True)
+    reals = authors.registry().real_names(by_pen['필명'], on or writer_mapping_date(df_target))
+    by_pen['본명'] = author_names(pd.Series(np.asarray(reals, dtype=object)))
+
+    # 3. 본명 코드별 합계 (필명 표 재집계)
+    real_codes, real_names = pd.factorize(by_pen['본명'], sort=True)
+    by_real = pd.DataFrame({'본명': np.asarray(real_names, dtype=object)})
+    for col in ['기사수', '총조회수', '좋아요', '댓글']:
+        by_real[col] = np.bincount(real_codes, weights=by_pen[col].to_numpy(dtype=float), minlength=len(real_names)).round().astype('int64')
+
+    return WriterStats(_rank_writers(by_real, ['본명']), _rank_writers(by_pen, ['필명', '본명']))
+
+def category_stats(df_articles, keys=('카테고리', '세부카테고리')):
+    """카테고리별 기사수/전체조회수/평균조회수와 다른 카테고리 대비 '이상' (기자별 집계와 같은 그룹 비교, 평균조회수 기준)"""
+    keys = list(keys)
+    cols = keys + ['기사수', '전체조회수', '평균조회수', '이상']
+    if df_articles.empty or '카테고리' not in df_articles.columns:
+        return pd.DataFrame(columns=cols)
+    df = df_articles.groupby(keys, observed=True).agg(기사수=('제목', 'count'), 전체조회수=('전체조회수', 'sum')).reset_index()
+    df['평균조회수'] = (df['전체조회수'] / df['기사수']).astype(int)
+    return anomaly.annotate_groups(df, '평균조회수')[cols]
+
+# 비교 기간 카테고리 집계 상한 (기간 길이와 관계없이 목록 페이지/기사 크롤링 비용 고정)
+CATEGORY_COMPARE_PAGES = 5
+CATEGORY_COMPARE_ARTICLES = 100
+
+@st.cache_data(ttl=3600)
+def load_category_counts(start_date, end_date, site=config.DEFAULT_SITE):
+    """기간 내 발행 기사의 카테고리별 기사 수 -> DataFrame(카테고리, 세부카테고리, 기사수)
+
+    카테고리 분석의 비교 기간용. 발행 기사 목록(discover_published, 목록 페이지 대체 시 최대
+    CATEGORY_COMPARE_PAGES페이지) 중 최신 CATEGORY_COMPARE_ARTICLES건만 메타데이터를 확인한다.
+    """
+    with sites.use(site):
+        articles = discover_published(start_date, end_date, CATEGORY_COMPARE_PAGES)
+        paths = [a['path'] for a in articles[:CATEGORY_COMPARE_ARTICLES]]
+        scraped = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = {perf.submit(executor, fetch_article_meta, path): path for path in paths}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    scraped[futures[future]] = future.result(timeout=3.0)
+                except:
+                    scraped[futures[future]] = DEFAULT_ARTICLE_META
+    if not scraped:
+        return pd.DataFrame(columns=['카테고리', '세부카테고리', '기사수'])
+    df_meta = pd.DataFrame.from_dict(scraped, orient='index', columns=ARTICLE_META_COLUMNS)
+    return df_meta.groupby(['카테고리', '세부카테고리']).size().rename('기사수').reset_index()
+
+def get_writers_df_real(df_target, on=None):
+    """하위 호환: 필명 기준 기자별 집계를 예전 컬럼 이름('작성자'=본명, '필명'=필명)으로 반환"""
+    if df_target.empty or '작성자' not in df_target.columns: return pd.DataFrame()
+    return compute_writer_stats(df_target, on).by_pen.rename(columns={'본명': '작성자'})
\ No newline at end of file
@@ -0,0 +1,102 @@
+# discovery.py
+"""사이트맵/RSS 기반 발행 기사 목록
+
+기사 목록 HTML을 페이지마다 내려받아 파싱하는 대신, 사이트맵(sitemap.xml, Google News 사이트맵 포함)이나
+RSS/Atom 피드를 한 번 내려받아 iterparse로 훑으며 (기사 경로, 발행일시) 레코드만 뽑는다.
+네트워크 요청은 data.crawl_feed가 담당하고, 이 모듈은 파싱과 DataFrame 변환만 한다.
+
+- 항목(url/item/entry)이 끝날 때마다 요소를 비워 큰 사이트맵도 메모리를 적게 쓴다.
+- 발행일시는 pd.to_datetime 한 번으로 변환한다 (시간대가 있으면 한국 시간으로 바꾼 뒤 시간대 정보 제거).
+- 수정일(lastmod/updated)은 수정할 때마다 바뀌어 발행 건수를 부풀리므로 발행일로 쓰지 않는다.
+  예외는 Google News 사이트맵 항목에 publication_date가 없을 때뿐이고, 날짜가 없는 항목은 버린다
+  (일반 사이트맵처럼 lastmod만 있으면 covers()가 False가 되어 목록 페이지 크롤링으로 대체).
+- 피드가 조회 기간 시작일까지 거슬러 올라가지 않으면(RSS는 보통 최근 N건만 제공) covers()가 False이고,
+  호출하는 쪽은 목록 페이지 크롤링으로 대체한다.
+"""
+import io
+import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+DEFAULT_FEEDS = ["/sitemap.xml", "/rss/allArticle.xml"]
+LOCAL_TZ = "Asia/Seoul"
+
+_ITEM_TAGS = {"url", "item", "entry"}
+_LINK_TAGS = ("loc", "link")
+_DATE_TAGS = ("publication_date", "pubDate", "published", "date")
+_MODIFIED_TAGS = ("lastmod", "updated")
+NEWS_NS = "http://www.google.com/schemas/sitemap-news/0.9"
+
+
+def _local(tag):
+    """'{namespace}name' -> 'name'"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_feed(data):
+    """사이트맵/RSS/Atom 바이트(또는 파일 객체)에서 [(링크, 발행일시 문자열)] 추출
+
+    날짜 후보가 여럿이면 _DATE_TAGS 앞쪽 우선, 발행일이 없으면 None (Google News 항목만 lastmod 사용).
+    사이트맵 인덱스(<sitemap>)는 건너뛴다.
+    """
+    source = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+    records = []
+    fields = {}
+    news = False
+    depth = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag in _ITEM_TAGS:
+                depth += 1
+                fields = {}
+                news = False
+            continue
+        if depth and tag in _ITEM_TAGS:
+            link = next((fields[t] for t in _LINK_TAGS if fields.get(t)), None)
+            published = next((fields[t] for t in _DATE_TAGS if fields.get(t)), None)
+            if published is None and news:
+                published = next((fields[t] for t in _MODIFIED_TAGS if fields.get(t)), None)
+            if link:
+                records.append((link, published))
+            depth -= 1
+            elem.clear()
+        elif depth:
+            news = news or elem.tag.startswith(f"{{{NEWS_NS}}}")
+            if tag == "link" and not (elem.text or "").strip():
+                fields.setdefault("link", elem.get("href"))  # Atom <link href="..."/>
+            elif elem.text and tag not in fields:
+                fields[tag] = elem.text.strip()
+    return records
+
+
+def records_frame(records):
+    """[(링크, 발행일시)] -> DataFrame(path, published_at), 최신순. 경로는 URL의 path?query"""
+    if not records:
+        return pd.DataFrame({"path": pd.Series(dtype=str), "published_at": pd.Series(dtype="datetime64[ns]")})
+    df = pd.DataFrame(records, columns=["link", "published"])
+    parts = df["link"].map(urlsplit)
+    df["path"] = [p.path + (f"?{p.query}" if p.query else "") for p in parts]
+    text = df["published"].fillna("").str.strip().str.replace(r"^(\d{4})\.(\d{2})\.(\d{2})", r"\1-\2-\3", regex=True)
+    # 시간대 표기가 있으면 한국 시간으로 변환, 없으면 한국 시간으로 간주
+    aware = text.str.contains(r"(?:Z|[+-]\d{2}:?\d{2}|GMT|UTC)$", regex=True)
+    df["published_at"] = pd.NaT
+    if aware.any():
+        df.loc[aware, "published_at"] = pd.to_datetime(text[aware], errors="coerce", utc=True, format="mixed").dt.tz_convert(LOCAL_TZ).dt.tz_localize(None)
+    if (~aware).any():
+        df.loc[~aware, "published_at"] = pd.to_datetime(text[~aware], errors="coerce", format="mixed")
+    df["published_at"] = pd.to_datetime(df["published_at"])
+    df = df.dropna(subset=["published_at"]).drop_duplicates("path")
+    return df[["path", "published_at"]].sort_values("published_at", ascending=False).reset_index(drop=True)
+
+
+def covers(df, start_date):
+    """피드가 start_date 이전 기사까지 포함하는지 (기간 전체를 빠짐없이 담고 있는지)"""
+    return not df.empty and df["published_at"].min() < pd.Timestamp(start_date)
+
+
+def published_between(df, start_date, end_date):
+    """start_date~end_date(포함) 발행 기사 DataFrame, 최신순"""
+    day = df["published_at"].dt.normalize()
+    return df[(day >= pd.Timestamp(start_date)) & (day <= pd.Timestamp(end_date))]
@@ -0,0 +1,245 @@
+# export.py
+"""보고서 내려받기 (Excel .xlsx / CSV .csv.zip)
+
+캐시된 보고서(data.DashboardReport)의 DataFrame을 그대로 읽어 섹션별 시트/CSV 파일로 쓴다.
+- 행은 EXPORT_CHUNK_ROWS개씩 잘라 쓰고, 쓴 바이트는 바로 내보내므로(제너레이터) 메모리 사용이 기간 길이와 무관하다.
+- xlsx는 외부 라이브러리 없이 최소 구성(SpreadsheetML, inlineStr)으로 직접 쓴다.
+- zip은 탐색(seek) 없이 순차로 쓰므로 Flask 스트리밍 응답에 바로 연결할 수 있다.
+"""
+import csv
+import io
+import math
+import re
+import zipfile
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+
+import pandas as pd
+
+EXPORT_CHUNK_ROWS = 5000
+
+MIME = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv.zip": "application/zip",
+}
+
+TOP10_COLUMNS = ['순위', '제목', '작성자', '카테고리', '세부카테고리', '발행일시', '전체조회수', '전체방문자수',
+                 '신규방문자비율', '체류시간_fmt', '이탈률', '좋아요', '댓글', '유입경로 1순위', '경로']
+ARTICLE_COLUMNS = ['제목', '작성자', '카테고리', '세부카테고리', '실발행일시', '전체조회수', '전체방문자수',
+                   '평균체류시간', '이탈률', '좋아요', '댓글', '경로']
+
+
+def category_summary(df_articles):
+    """카테고리/세부카테고리별 기사 수, 조회수, 이상 표시 (6페이지 표와 같은 기준, data.category_stats)"""
+    import data
+    return data.category_stats(df_articles)
+
+
+def sections(report):
+    """(시트 이름, DataFrame, 컬럼) 순서대로 생성 - 카테고리 요약 외에는 보고서 DataFrame을 그대로 넘김"""
+    yield "일별 추이", report.df_daily, None
+    yield "주간 추이", report.df_weekly, None
+    yield "Top10", report.df_top10, TOP10_COLUMNS
+    yield "발행기사", report.df_all_articles_with_metadata, ARTICLE_COLUMNS
+    yield "기자(본명)", report.writer_stats.by_real, None
+    yield "기자(필명)", report.writer_stats.by_pen, None
+    yield "카테고리", category_summary(report.df_all_articles_with_metadata), None
+    yield "유입경로(이번)", report.df_traffic_curr, None
+    yield "유입경로(비교)", report.df_traffic_last, None
+    yield "지역(이번)", report.df_region_curr, None
+    yield "지역(비교)", report.df_region_last, None
+    yield "연령(이번)", report.df_age_curr, None
+    yield "연령(비교)", report.df_age_last, None
+    yield "성별(이번)", report.df_gender_curr, None
+    yield "성별(비교)", report.df_gender_last, None
+
+
+def _column_values(series):
+    """컬럼 묶음 -> 셀 값 리스트 (결측 -> None, 숫자는 파이썬 int/float, 날짜 -> 문자열)"""
+    kind = series.dtype.kind
+    if kind in "iub":
+        return series.tolist()
+    if kind == "f":
+        return [None if v != v else v for v in series.tolist()]
+    if kind == "M":
+        return [None if v is pd.NaT else v.isoformat(sep=" ") for v in series.tolist()]
+    values = series.tolist()
+    if series.hasnans:
+        values = [None if missing else v for v, missing in zip(values, series.isna().tolist())]
+    return [v if v is None or isinstance(v, str) else _cell(v) for v in values]
+
+
+def _cell(value):
+    """기타 셀 값 정리: NumPy 스칼라 -> 파이썬 값, 날짜 -> 문자열"""
+    if hasattr(value, "item"):
+        value = value.item()  # numpy 스칼라
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def iter_rows(df, columns=None):
+    """(헤더, 행 묶음 제너레이터) - 행은 EXPORT_CHUNK_ROWS개씩 컬럼별로 꺼냄 (DataFrame 복사 없음)"""
+    cols = [c for c in (columns or df.columns) if c in df.columns]
+
+    def chunks():
+        for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+            block = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+            yield list(zip(*(_column_values(block[c]) for c in cols)))
+    return [str(c) for c in cols], chunks()
+
+
+class _Sink:
+    """ZipFile이 쓰는 바이트를 모아 두었다가 drain()으로 넘기는 순차 스트림 (seek 불가)"""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, b):
+        self._parts.append(bytes(b))
+        return len(b)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+def _sheet_names(names):
+    """엑셀 시트 이름 규칙 (31자, []:*?/\\ 불가, 중복 불가)"""
+    seen, result = set(), []
+    for name in names:
+        base = re.sub(r'[\[\]:*?/\\]', '_', name)[:31] or "Sheet"
+        candidate, i = base, 2
+        while candidate.lower() in seen:
+            suffix = f" ({i})"
+            candidate, i = base[:31 - len(suffix)] + suffix, i + 1
+        seen.add(candidate.lower())
+        result.append(candidate)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# [CSV] 섹션별 CSV (엑셀 한글 호환을 위해 UTF-8 BOM) 묶음 zip
+# -----------------------------------------------------------------------------
+def iter_csv_zip(report):
+    """섹션별 CSV를 담은 zip 바이트 스트림"""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i, (name, df, columns) in enumerate(sections(report), start=1):
+            header, chunks = iter_rows(df, columns)
+            with zf.open(f"{i:02d}_{_sheet_names([name])[0]}.csv", "w") as f:
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                buf.write("\ufeff")
+                writer.writerow(header)
+                for rows in chunks:
+                    writer.writerows(rows)
+                    f.write(buf.getvalue().encode("utf-8"))
+                    buf.seek(0)
+                    buf.truncate()
+                    yield sink.drain()
+                f.write(buf.getvalue().encode("utf-8"))
+            yield sink.drain()
+    yield sink.drain()
+
+
+# -----------------------------------------------------------------------------
+# [XLSX] 최소 구성 SpreadsheetML
+# -----------------------------------------------------------------------------
+_ILLEGAL_XML = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_CONTENT_TYPES = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                  '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                  '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                  '<Default Extension="xml" ContentType="application/xml"/>'
+                  '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                  '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                  '{sheets}</Types>')
+_SHEET_TYPE = ('<Override PartName="/xl/worksheets/sheet{n}.xml" '
+               'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>')
+_ROOT_RELS = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+              '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+              '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+              '</Relationships>')
+_WORKBOOK = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+             '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+             'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>{sheets}</sheets></workbook>')
+_WORKBOOK_RELS = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                  '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{rels}'
+                  '<Relationship Id="rIdStyles" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+                  '</Relationships>')
+_STYLES = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+           '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+           '<fonts count="2"><font><sz val="11"/><name val="맑은 고딕"/></font><font><b/><sz val="11"/><name val="맑은 고딕"/></font></fonts>'
+           '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+           '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+           '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+           '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+           '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+           '</styleSheet>')
+
+
+def _xml_cell(value, style=""):
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"{style}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c{style}><v>{value!r}</v></c>" if math.isfinite(value) else "<c/>"
+    text = escape(_ILLEGAL_XML.sub("", str(value)))
+    return f'<c t="inlineStr"{style}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xml_row(values, style=""):
+    return "<row>" + "".join(_xml_cell(v, style) for v in values) + "</row>"
+
+
+def iter_xlsx(report):
+    """섹션별 시트를 담은 xlsx 바이트 스트림 (머리글 행 굵게, 첫 행 고정)"""
+    sink = _Sink()
+    items = list(sections(report))
+    names = _sheet_names([name for name, _, _ in items])
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for n, (_, df, columns) in enumerate(items, start=1):
+            header, chunks = iter_rows(df, columns)
+            with zf.open(f"xl/worksheets/sheet{n}.xml", "w") as f:
+                f.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                         '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" state="frozen"/></sheetView></sheetViews>'
+                         '<sheetData>' + _xml_row(header, ' s="1"')).encode("utf-8"))
+                for rows in chunks:
+                    f.write("".join(_xml_row(r) for r in rows).encode("utf-8"))
+                    yield sink.drain()
+                f.write(b"</sheetData></worksheet>")
+            yield sink.drain()
+        count = len(items)
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES.format(sheets="".join(_SHEET_TYPE.format(n=n) for n in range(1, count + 1))))
+        zf.writestr("_rels/.rels", _ROOT_RELS)
+        zf.writestr("xl/workbook.xml", _WORKBOOK.format(sheets="".join(
+            f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{n}" r:id="rId{n}"/>' for n, name in enumerate(names, start=1))))
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS.format(rels="".join(
+            f'<Relationship Id="rId{n}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{n}.xml"/>' for n in range(1, count + 1))))
+        zf.writestr("xl/styles.xml", _STYLES)
+    yield sink.drain()
+
+
+def stream(report, fmt):
+    """fmt('xlsx' / 'csv.zip')에 맞는 바이트 스트림"""
+    if fmt == "xlsx":
+        return iter_xlsx(report)
+    if fmt == "csv.zip":
+        return iter_csv_zip(report)
+    raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+
+def filename(period, fmt, site=None):
+    """내려받기 파일 이름 (ASCII: cncnews_<기간 키>.<형식>)"""
+    key = "_".join(period) if isinstance(period, tuple) else str(period)
+    return f"{site or 'cncnews'}_{re.sub(r'[^0-9A-Za-z_-]', '', key)}.{fmt}"
@@ -0,0 +1,250 @@
+# facts.py
+"""페이지뷰 팩트 테이블 (date × pagePath × pageTitle × sessionSource)
+
+보고서의 유입경로 구성, TOP 10(일별 조회 곡선 포함), 기사별 유입경로, 활성기사 수, 일별 추이는 모두
+같은 페이지뷰 데이터를 다르게 집계한 것이다. GA4에서 하루 단위로 한 번만 추출해
+SQLite에 저장해 두고, 각 섹션은 로컬 GROUP BY로 계산한다.
+
+- 추출은 data.ensure_facts()가 담당하고, 이 모듈은 저장과 집계만 한다.
+- 사이트(GA4 속성)별로 DB 파일을 따로 쓴다 (기본 사이트는 DB_PATH, 그 외는 DB_PATH에 사이트 키를 붙인 경로).
+- 최근 FRESH_DAYS일은 GA4 집계가 계속 갱신되므로 확정하지 않고 다음 로드 때 다시 추출한다.
+- 주간 UV/PV(추이 차트)는 weekly_totals에 주 시작일(일요일) 키로 따로 저장한다.
+- 팩트에는 합산 가능한 지표(조회수, 참여 시간, 세션)만 둔다. 방문자 수(activeUsers/newUsers)는 날짜·유입경로를
+  넘어 합산할 수 없으므로 저장하지 않고, 필요한 기사만 data.fetch_article_users가 GA4에서 조회한다.
+  (일별 합계 daily_totals는 날짜 단위 GA4 값 그대로라 일별 UV로 쓸 수 있다)
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import config
+import sites
+
+DB_PATH = os.environ.get("CNCNEWS_FACTS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "facts.sqlite"))
+FRESH_DAYS = 2
+
+FACT_DIMENSIONS = ["date", "pagePath", "pageTitle", "sessionSource"]
+FACT_METRICS = ["screenPageViews", "userEngagementDuration", "sessions", "engagedSessions"]
+TOTAL_METRICS = ["activeUsers", "screenPageViews", "newUsers"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_facts (
+    date TEXT NOT NULL,
+    pagePath TEXT NOT NULL,
+    pageTitle TEXT NOT NULL,
+    sessionSource TEXT NOT NULL,
+    screenPageViews INTEGER NOT NULL DEFAULT 0,
+    userEngagementDuration INTEGER NOT NULL DEFAULT 0,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    engagedSessions INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_page_facts_date ON page_facts (date);
+CREATE TABLE IF NOT EXISTS daily_totals (
+    date TEXT PRIMARY KEY,
+    activeUsers INTEGER NOT NULL DEFAULT 0,
+    screenPageViews INTEGER NOT NULL DEFAULT 0,
+    newUsers INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS weekly_totals (
+    week_start TEXT PRIMARY KEY,
+    activeUsers INTEGER NOT NULL DEFAULT 0,
+    screenPageViews INTEGER NOT NULL DEFAULT 0,
+    fetched_at TEXT NOT NULL,
+    final INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS fact_days (
+    date TEXT PRIMARY KEY,
+    fetched_at TEXT NOT NULL,
+    final INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_write_lock = threading.Lock()
+_ready_paths = set()
+
+
+def db_path(site=None):
+    """사이트별 DB 경로 (sites.current() 기준)"""
+    site = site or sites.current()
+    if site == config.DEFAULT_SITE:
+        return DB_PATH
+    root, ext = os.path.splitext(DB_PATH)
+    return f"{root}.{site}{ext or '.sqlite'}"
+
+
+def connect():
+    """스키마가 준비된 연결 (호출마다 새 연결, 스레드 간 공유하지 않음)"""
+    path = db_path()
+    conn = sqlite3.connect(path, timeout=30)
+    if path not in _ready_paths:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _ready_paths.add(path)
+    return conn
+
+
+@contextmanager
+def _connection():
+    """트랜잭션 커밋 후 연결 종료"""
+    conn = connect()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def day_range(start_date, end_date):
+    s = datetime.strptime(start_date, '%Y-%m-%d')
+    e = datetime.strptime(end_date, '%Y-%m-%d')
+    return [(s + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((e - s).days + 1)]
+
+
+def missing_days(start_date, end_date):
+    """추출이 필요한 날짜 (미추출 또는 미확정). 오늘 이후 날짜는 제외"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    days = [d for d in day_range(start_date, end_date) if d <= today]
+    if not days:
+        return []
+    with _connection() as conn:
+        final = {r[0] for r in conn.execute(
+            "SELECT date FROM fact_days WHERE final = 1 AND date BETWEEN ? AND ?", (days[0], days[-1])
+        )}
+    return [d for d in days if d not in final]
+
+
+def write_day(day, df_facts, totals):
+    """하루치 팩트와 일별 합계를 교체 저장 (totals: TOTAL_METRICS 값 dict)"""
+    final = day <= (datetime.now() - timedelta(days=FRESH_DAYS)).strftime('%Y-%m-%d')
+    rows = [] if df_facts.empty else df_facts.reindex(columns=FACT_DIMENSIONS + FACT_METRICS).fillna(0).assign(date=day).itertuples(index=False, name=None)
+    with _write_lock, _connection() as conn:
+        conn.execute("DELETE FROM page_facts WHERE date = ?", (day,))
+        cur = conn.executemany(
+            f"INSERT INTO page_facts ({', '.join(FACT_DIMENSIONS + FACT_METRICS)}) VALUES ({', '.join('?' * len(FACT_DIMENSIONS + FACT_METRICS))})",
+            rows,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO daily_totals (date, activeUsers, screenPageViews, newUsers) VALUES (?, ?, ?, ?)",
+            (day, *(int(totals.get(m, 0)) for m in TOTAL_METRICS)),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO fact_days (date, fetched_at, final, rows) VALUES (?, ?, ?, ?)",
+            (day, datetime.now().isoformat(timespec='seconds'), int(final), max(cur.rowcount, 0)),
+        )
+
+
+def missing_weeks(week_starts):
+    """주간 합계가 없거나 미확정인 주 시작일 목록"""
+    if not week_starts:
+        return []
+    with _connection() as conn:
+        final = {r[0] for r in conn.execute(
+            "SELECT week_start FROM weekly_totals WHERE final = 1 AND week_start BETWEEN ? AND ?",
+            (min(week_starts), max(week_starts)),
+        )}
+    return [w for w in week_starts if w not in final]
+
+
+def write_weeks(rows):
+    """주간 합계 저장: rows = {주 시작일: (activeUsers, screenPageViews)}. 종료 후 FRESH_DAYS일이 지난 주만 확정"""
+    if not rows:
+        return
+    cutoff = (datetime.now() - timedelta(days=FRESH_DAYS + 6)).strftime('%Y-%m-%d')
+    now = datetime.now().isoformat(timespec='seconds')
+    with _write_lock, _connection() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO weekly_totals (week_start, activeUsers, screenPageViews, fetched_at, final) VALUES (?, ?, ?, ?, ?)",
+            [(w, int(uv), int(pv), now, int(w <= cutoff)) for w, (uv, pv) in rows.items()],
+        )
+
+
+def clear():
+    """저장된 팩트 전체 삭제 (벤치마크/재추출용)"""
+    with _write_lock, _connection() as conn:
+        for table in ("page_facts", "daily_totals", "weekly_totals", "fact_days"):
+            conn.execute(f"DELETE FROM {table}")
+
+
+def _query(sql, params):
+    with _connection() as conn:
+        return pd.read_sql_query(sql, conn, params=params)
+
+
+# -----------------------------------------------------------------------------
+# [로컬 집계]
+# -----------------------------------------------------------------------------
+def daily_totals(start_date, end_date):
+    """일별 UV/PV (date, activeUsers, screenPageViews, final - 확정 여부)"""
+    return _query(
+        "SELECT t.date, t.activeUsers, t.screenPageViews, COALESCE(d.final, 0) AS final FROM daily_totals t "
+        "LEFT JOIN fact_days d ON d.date = t.date WHERE t.date BETWEEN ? AND ? ORDER BY t.date",
+        (start_date, end_date),
+    )
+
+
+def weekly_totals(start_week, end_week):
+    """주간 UV/PV (week_start, activeUsers, screenPageViews, final - 확정 여부)"""
+    return _query(
+        "SELECT week_start, activeUsers, screenPageViews, final FROM weekly_totals WHERE week_start BETWEEN ? AND ? ORDER BY week_start",
+        (start_week, end_week),
+    )
+
+
+def traffic_by_source(start_date, end_date):
+    """유입경로(sessionSource)별 조회수"""
+    return _query(
+        "SELECT sessionSource, SUM(screenPageViews) AS screenPageViews FROM page_facts "
+        "WHERE date BETWEEN ? AND ? GROUP BY sessionSource ORDER BY screenPageViews DESC",
+        (start_date, end_date),
+    )
+
+
+def source_daily(start_date, end_date):
+    """일별 × 유입경로(sessionSource)별 조회수 (이상치 기준선 계산용)"""
+    return _query(
+        "SELECT date, sessionSource, SUM(screenPageViews) AS screenPageViews FROM page_facts "
+        "WHERE date BETWEEN ? AND ? GROUP BY date, sessionSource ORDER BY date",
+        (start_date, end_date),
+    )
+
+
+def article_metrics(start_date, end_date):
+    """페이지(pageTitle × pagePath)별 가산 지표, 조회수 내림차순. bounceRate는 세션 합계로 재계산"""
+    df = _query(
+        "SELECT pageTitle, pagePath, SUM(screenPageViews) AS screenPageViews, SUM(userEngagementDuration) AS userEngagementDuration, "
+        "SUM(sessions) AS sessions, SUM(engagedSessions) AS engagedSessions FROM page_facts "
+        "WHERE date BETWEEN ? AND ? GROUP BY pageTitle, pagePath ORDER BY screenPageViews DESC, pagePath",
+        (start_date, end_date),
+    )
+    sessions = df['sessions'].where(df['sessions'] > 0)
+    df['bounceRate'] = (1 - df['engagedSessions'] / sessions).fillna(0).clip(lower=0)
+    return df.drop(columns=['sessions', 'engagedSessions'])
+
+
+def article_daily(start_date, end_date, paths):
+    """지정 기사들의 일별 조회수 (pagePath × date, 유입경로 합산)"""
+    if not paths:
+        return pd.DataFrame(columns=['pagePath', 'date', 'screenPageViews'])
+    marks = ', '.join('?' * len(paths))
+    return _query(
+        "SELECT pagePath, date, SUM(screenPageViews) AS screenPageViews FROM page_facts "
+        f"WHERE date BETWEEN ? AND ? AND pagePath IN ({marks}) GROUP BY pagePath, date",
+        (start_date, end_date, *paths),
+    )
+
+
+def article_sources(start_date, end_date, paths):
+    """지정 기사들의 pagePath × sessionSource 조회수"""
+    if not paths:
+        return pd.DataFrame(columns=['pagePath', 'sessionSource', 'screenPageViews'])
+    marks = ', '.join('?' * len(paths))
+    return _query(
+        "SELECT pagePath, sessionSource, SUM(screenPageViews) AS screenPageViews FROM page_facts "
+        f"WHERE date BETWEEN ? AND ? AND pagePath IN ({marks}) GROUP BY pagePath, sessionSource",
+        (start_date, end_date, *paths),
+    )
@@ -0,0 +1,185 @@
+# live.py
+"""실시간(오늘 누적) 모드
+
+GA4 Realtime API(runRealtimeReport)는 최근 30분만 분 단위(minutesAgo)로 돌려준다.
+사이트별 LiveWindow가 이를 주기적으로 폴링해 분 버킷을 메모리에 쌓고, 오늘 누적 조회수와
+인기 기사를 계산한다. 과거 섹션(팩트 DB, 주간 추이 등)은 다시 계산하지 않는다.
+
+- 처음 폴링할 때 runReport(오늘)로 기준값을 받고, 이후 분 버킷만 더한다.
+  runReport는 몇 시간씩 늦게 집계되므로 기준 시각(baseline_until)은 실시간 창이 시작하는 30분 전으로 두고,
+  전체 조회수는 dateHourMinute 조회에서 기준 시각까지의 분만 더한다 (이후는 실시간 분 버킷).
+  집계가 기준 시각보다 늦으면 그 사이(processed_until ~ baseline_until)는 어느 쪽에도 없으므로 화면에 표시한다.
+  기사별 조회수는 인기 기사 목록용으로 pageTitle 조회로 따로 받는다 (분 단위로 자를 수 없어 근사값).
+- 폴링마다 30분 창 안의 분 버킷은 최신 값으로 교체하고, 값이 바뀐 버킷만 반영한다.
+  분별 합계는 minutesAgo 조회(최대 30행)로 받아 기사 수가 많아도 잘리지 않는다.
+- 마지막 폴링이 30분 창보다 오래됐으면(보는 사람이 없던 구간) 빠진 분을 복구할 수 없으므로 기준값을 다시 받는다.
+- 날짜가 바뀌면 창을 비우고 기준값을 다시 받는다.
+- 프로세스 메모리에만 보관하므로 재시작하면 기준값부터 다시 시작한다.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import data
+import perf
+import sites
+
+POLL_SECONDS = 60
+REALTIME_MINUTES = 30
+PAGE_LIMIT = 10000  # 기사별 조회 행 수 상한 (기준값 pageTitle, 실시간 minutesAgo × unifiedScreenName)
+TOP_N = 10
+CHART_MINUTES = 60
+
+_windows = {}
+_windows_lock = threading.Lock()
+
+
+class LiveWindow:
+    """사이트 하나의 오늘 누적 분 버킷"""
+
+    def __init__(self, site):
+        self.site = site
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self.last_poll = 0.0
+        self.polls = 0
+        self._reset(None)
+
+    def _reset(self, day):
+        self.day = day
+        self.baseline_until = None
+        self.processed_until = None  # runReport 집계가 반영된 마지막 분
+        self.baseline_pv = 0
+        self.baseline_pages = {}
+        self.minute_pages = {}  # 분(datetime) -> {기사 제목: 조회수}
+        self.minute_pv = {}  # 분(datetime) -> 전체 조회수
+        self.active_users = 0
+        self.updated_at = None
+        self.changed_buckets = 0
+
+    def refresh(self, min_interval=POLL_SECONDS, force=False):
+        """마지막 폴링 후 min_interval초가 지났으면 폴링 (동시에 한 요청만 폴링, 나머지는 기존 값 사용)"""
+        if not force and time.monotonic() - self.last_poll < min_interval:
+            return False
+        if not self._poll_lock.acquire(blocking=False):
+            return False
+        try:
+            with sites.use(self.site), perf.span("live.poll", kind="live", site=self.site) as sp:
+                sp.attrs["changed"] = self._poll()
+            self.last_poll = time.monotonic()
+            self.polls += 1
+            return True
+        finally:
+            self._poll_lock.release()
+
+    def _poll(self):
+        now = datetime.now().replace(second=0, microsecond=0)
+        today = now.strftime('%Y-%m-%d')
+        if self.day != today:
+            with self._lock:
+                self._reset(today)
+
+        # 마지막 폴링 후 실시간 창(30분)보다 오래 지났으면 그 사이 분 버킷은 다시 받을 수 없으므로 기준값부터 새로 받음
+        stale = self.updated_at is not None and datetime.now() - self.updated_at > timedelta(minutes=REALTIME_MINUTES)
+        if self.baseline_until is None or stale:
+            baseline_until = now - timedelta(minutes=REALTIME_MINUTES)
+            df_total = data.run_ga4_report(today, today, ["dateHourMinute"], ["screenPageViews"])
+            minutes = pd.to_datetime(df_total['dateHourMinute'], format='%Y%m%d%H%M', errors='coerce') if not df_total.empty else pd.Series(dtype='datetime64[ns]')
+            pv = pd.to_numeric(df_total.get('screenPageViews', pd.Series(dtype=int)), errors='coerce').fillna(0)
+            processed = minutes[pv > 0].max()
+            # 기사별 조회수는 인기 기사 목록용이므로 사이트명 제목은 GA4에서 제외 (PAGE_LIMIT을 기사 행에만 사용)
+            df_base = data.run_ga4_report(today, today, ["pageTitle"], ["screenPageViews"], "screenPageViews", limit=PAGE_LIMIT,
+                                          dimension_filter=data.title_exclusion_filter())
+            pages = {} if df_base.empty else df_base.groupby('pageTitle')['screenPageViews'].sum().astype(int).to_dict()
+            with self._lock:
+                self.baseline_pages = pages
+                # 실시간 창과 겹치는 분은 빼고 (분을 알 수 없는 행은 기준값에 포함)
+                self.baseline_pv = int(pv[minutes.isna() | (minutes <= baseline_until)].sum()) if not df_total.empty else int(sum(pages.values()))
+                self.baseline_until = baseline_until
+                self.processed_until = None if pd.isna(processed) else processed.to_pydatetime()
+                self.minute_pages, self.minute_pv = {}, {}
+
+        df_rt = data.run_realtime_report(["minutesAgo", "unifiedScreenName"], ["screenPageViews"], limit=PAGE_LIMIT,
+                                         dimension_filter=data.title_exclusion_filter("unifiedScreenName"))
+        df_rt_total = data.run_realtime_report(["minutesAgo"], ["screenPageViews"])
+        df_users = data.run_realtime_report([], ["activeUsers"])
+
+        def in_window(df):
+            """minutesAgo -> minute(datetime), 기준값 이후·오늘 날짜만"""
+            if df.empty:
+                return df.assign(minute=pd.Series(dtype='datetime64[ns]'))
+            minutes_ago = pd.to_numeric(df['minutesAgo'], errors='coerce').fillna(0).astype(int)
+            df = df.assign(minute=[now - timedelta(minutes=m) for m in minutes_ago])
+            return df[(df['minute'] > self.baseline_until) & (df['minute'].dt.strftime('%Y-%m-%d') == today)]
+
+        # 분 버킷: 기준값 이후, 오늘 날짜만
+        buckets = {}
+        for minute, grp in in_window(df_rt).groupby('minute'):
+            buckets[minute.to_pydatetime()] = grp.groupby('unifiedScreenName')['screenPageViews'].sum().astype(int).to_dict()
+        df_rt_total = in_window(df_rt_total)
+        totals = {m.to_pydatetime(): int(v) for m, v in df_rt_total.groupby('minute')['screenPageViews'].sum().items()}
+
+        with self._lock:
+            changed = 0
+            for minute, pages in buckets.items():
+                if self.minute_pages.get(minute) != pages:
+                    self.minute_pages[minute] = pages
+                    changed += 1
+            # 창 안에서 조회가 사라진 분(응답에 없음)은 0건으로 확정
+            window_start = now - timedelta(minutes=REALTIME_MINUTES - 1)
+            for minute in [m for m in self.minute_pages if m >= window_start and m not in buckets]:
+                del self.minute_pages[minute]
+                changed += 1
+            for minute in [m for m in self.minute_pv if m >= window_start and m not in totals]:
+                del self.minute_pv[minute]
+            self.minute_pv.update(totals)
+            self.active_users = int(df_users['activeUsers'].sum()) if not df_users.empty else 0
+            self.updated_at = datetime.now()
+            self.changed_buckets = changed
+        return changed
+
+    def snapshot(self, top_n=TOP_N, chart_minutes=CHART_MINUTES):
+        """화면 표시용 값: 오늘 누적 PV, 최근 30분 활성 사용자, 인기 기사, 분별 조회수"""
+        with self._lock:
+            pages = dict(self.baseline_pages)
+            for bucket in self.minute_pages.values():
+                for title, pv in bucket.items():
+                    pages[title] = pages.get(title, 0) + pv
+            # 분별 전체 조회수는 minutesAgo 합계 (기사별 버킷은 PAGE_LIMIT에서 잘릴 수 있음)
+            minute_pv = {m: sum(b.values()) for m, b in self.minute_pages.items()}
+            minute_pv.update(self.minute_pv)
+            snap = {
+                "site": self.site,
+                "day": self.day,
+                "updated_at": self.updated_at.isoformat(timespec='seconds') if self.updated_at else None,
+                "baseline_until": self.baseline_until.isoformat(timespec='minutes') if self.baseline_until else None,
+                "processed_until": self.processed_until.isoformat(timespec='minutes') if self.processed_until else None,
+                # 기준값에도 실시간 분 버킷에도 없는 구간 (runReport 집계 지연)
+                "gap_minutes": max(0, int((self.baseline_until - self.processed_until).total_seconds() // 60))
+                               if self.baseline_until and self.processed_until else 0,
+                "today_pv": self.baseline_pv + sum(minute_pv.values()),
+                "active_users_30m": self.active_users,
+                "polls": self.polls,
+                "changed_buckets": self.changed_buckets,
+            }
+
+        df_top = pd.DataFrame(list(pages.items()), columns=['제목', '조회수'])
+        df_top = data.exclude_branded_titles(df_top.rename(columns={'제목': 'pageTitle'})).rename(columns={'pageTitle': '제목'})
+        snap["df_top"] = df_top.sort_values('조회수', ascending=False).head(top_n).reset_index(drop=True)
+
+        end = datetime.now().replace(second=0, microsecond=0)
+        axis = [end - timedelta(minutes=i) for i in range(chart_minutes - 1, -1, -1)]
+        snap["df_minutes"] = pd.DataFrame({'시각': axis, '조회수': [minute_pv.get(m, 0) for m in axis]})
+        return snap
+
+
+def get_window(site=None):
+    """사이트별 LiveWindow (프로세스 전역, Streamlit 세션과 Flask 요청이 공유)"""
+    site = site or sites.current()
+    sites.info(site)
+    with _windows_lock:
+        if site not in _windows:
+            _windows[site] = LiveWindow(site)
+        return _windows[site]
@@ -0,0 +1,155 @@
+# metrics.py
+"""Prometheus 텍스트 형식 메트릭 (app_flask.py /metrics)
+
+perf 모듈의 span/trace 이벤트를 받아 카운터와 히스토그램으로 집계한다.
+외부 의존성 없이 exposition format 0.0.4만 출력한다.
+"""
+import os
+import sys
+import threading
+
+import perf
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(v):
+    return str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + (list(extra) if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name, doc, labels=()):
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(l, "")) for l in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, v in items:
+            lines.append(f"{self.name}{_fmt_labels(self.labels, key)} {v}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, doc, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}  # key -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(l, "")) for l in self.labels)
+        with self._lock:
+            st = self._values.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, b in enumerate(self.buckets):
+                if value <= b:
+                    st[i] += 1
+            st[-2] += value
+            st[-1] += 1
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, st in items:
+            for i, b in enumerate(self.buckets):
+                lines.append(f"{self.name}_bucket{_fmt_labels(self.labels, key, [('le', repr(b))])} {st[i]}")
+            lines.append(f"{self.name}_bucket{_fmt_labels(self.labels, key, [('le', '+Inf')])} {st[-1]}")
+            lines.append(f"{self.name}_sum{_fmt_labels(self.labels, key)} {st[-2]}")
+            lines.append(f"{self.name}_count{_fmt_labels(self.labels, key)} {st[-1]}")
+        return lines
+
+
+# -----------------------------------------------------------------------------
+# [메트릭 정의]
+# -----------------------------------------------------------------------------
+HTTP_REQUEST_SECONDS = Histogram("cncnews_http_request_seconds", "Flask 요청 처리 시간", ["route", "method", "status"])
+DASHBOARD_LOAD_SECONDS = Histogram("cncnews_dashboard_load_seconds", "load_all_dashboard_data 소요 시간", ["cache"])
+GA4_REQUESTS = Counter("cncnews_ga4_requests_total", "GA4 runReport 호출 수", ["report", "status"])
+GA4_REQUEST_SECONDS = Histogram("cncnews_ga4_request_seconds", "GA4 runReport 지연 시간", ["report"])
+CRAWL_REQUESTS = Counter("cncnews_crawl_requests_total", "사이트 크롤링 결과 (success/fallback/not_modified/timeout/error/open)", ["target", "outcome"])
+CACHE_REQUESTS = Counter("cncnews_cache_requests_total", "캐시 조회 결과 (hit/miss)", ["cache", "result"])
+
+REGISTRY = [HTTP_REQUEST_SECONDS, DASHBOARD_LOAD_SECONDS, GA4_REQUESTS, GA4_REQUEST_SECONDS, CRAWL_REQUESTS, CACHE_REQUESTS]
+
+
+def process_rss_bytes():
+    """현재 프로세스 RSS (/proc이 있는 리눅스만, 그 외는 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def process_peak_rss_bytes():
+    """프로세스 시작 이후 최대 RSS (ru_maxrss: macOS는 바이트, 리눅스 등은 KiB 단위). resource가 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# (이름, 설명, 값 함수) - 값이 None인 플랫폼에서는 출력하지 않음
+PROCESS_GAUGES = [
+    ("cncnews_process_resident_memory_bytes", "현재 프로세스 RSS", process_rss_bytes),
+    ("cncnews_process_peak_resident_memory_bytes", "프로세스 최대 RSS (시작 이후 최고치)", process_peak_rss_bytes),
+]
+
+
+def render():
+    lines = []
+    for m in REGISTRY:
+        lines.extend(m.collect())
+    for name, help_text, fn in PROCESS_GAUGES:
+        value = fn()
+        if value is None:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------------------------------------------------------
+# [perf 이벤트 연동]
+# -----------------------------------------------------------------------------
+_CRAWL_TARGETS = {"crawl.article": "article", "crawl.list": "list", "crawl.feed": "feed"}
+
+
+def _on_perf_event(event, obj):
+    if event == "trace":
+        cache = obj.attrs.get("cache", "hit")
+        DASHBOARD_LOAD_SECONDS.observe(obj.duration, cache=cache)
+        CACHE_REQUESTS.inc(cache="dashboard", result=cache)
+        return
+
+    attrs = obj.attrs
+    if obj.kind == "ga4":
+        report = attrs.get("report", "total")
+        GA4_REQUESTS.inc(report=report, status="error" if "error" in attrs else "ok")
+        GA4_REQUEST_SECONDS.observe(obj.duration, report=report)
+    elif obj.kind == "crawl" and obj.name in _CRAWL_TARGETS:
+        target = _CRAWL_TARGETS[obj.name]
+        CACHE_REQUESTS.inc(cache=target, result=attrs.get("cache", "hit"))
+        if "outcome" in attrs:
+            CRAWL_REQUESTS.inc(target=target, outcome=attrs["outcome"])
+
+
+perf.add_listener(_on_perf_event)
@@ -0,0 +1,54 @@
+# normalize.py
+"""기자 이름 정규화 (직함 제거, 1어절만 남김)
+
+크롤링 결과와 보고서 표마다 같은 작성자 문자열이 반복되므로
+- 직함 패턴은 모듈 로드 시 한 번만 컴파일하고
+- 문자열 단위 결과는 LRU로 기억하며
+- 컬럼 단위 API(author_names)는 고유값만 정규화한 뒤 코드로 되돌려 매핑한다.
+결과는 기존 utils.clean_author_name과 같다 (utils.clean_author_name은 이 모듈의 author_name).
+"""
+import re
+from functools import lru_cache
+
+UNKNOWN = "미상"
+
+# 직함 목록 (제거 순서 유지: 앞 직함을 지운 뒤 새로 붙는 문자열도 다음 패턴에서 제거됨)
+TITLES = ['편집인', '전문', '편집', '기자']
+_TITLE_PATTERNS = [re.compile(re.escape(t)) for t in TITLES]
+_TITLE_SET = frozenset(TITLES)
+
+
+@lru_cache(maxsize=8192)
+def author_name(name):
+    """기자 이름에서 불필요한 직함 등을 제거 - 1어절만 남김"""
+    if not name:
+        return UNKNOWN
+
+    # 기본 정리
+    name = str(name).replace('#', '').replace('전문기자', '').replace('기자', '').strip()
+
+    # 1단계: 2어절 이상이면 첫 번째 단어만 남김 (첫 단어가 직함이면 두 번째 단어)
+    words = name.split()
+    if len(words) > 1:
+        name = words[1] if words[0] in _TITLE_SET else words[0]
+    elif len(words) == 1:
+        name = words[0]
+
+    # 2단계: 공백 없이 붙어있는 직함 제거
+    for pattern in _TITLE_PATTERNS:
+        name = pattern.sub('', name)
+
+    # 3단계: 정리 (여러 공백을 하나로, 앞뒤 공백 제거)
+    name = ' '.join(name.split())
+    return name if name else UNKNOWN
+
+
+def author_names(values):
+    """컬럼 단위 정규화: 고유값만 author_name을 적용하고 결과를 원래 위치로 매핑 (Series 반환, 인덱스 유지, 결측은 '미상')"""
+    import numpy as np
+    import pandas as pd
+
+    values = values if isinstance(values, pd.Series) else pd.Series(values)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized = np.array([UNKNOWN if pd.isna(u) else author_name(u) for u in uniques], dtype=object)
+    return pd.Series(normalized[codes], index=values.index, name=values.name)
@@ -0,0 +1,165 @@
+# parsing.py
+"""쿡앤셰프 목록/기사 페이지 HTML 파싱 (네트워크·streamlit 의존 없음)
+
+data.crawl_* 함수에서 분리한 순수 함수. 기사 파싱은 data의 프로세스 풀 작업자에서 실행되므로
+이 모듈은 가볍게 임포트되어야 한다 (bs4, re, normalize만 사용).
+"""
+import re
+
+from bs4 import BeautifulSoup
+
+from normalize import author_name
+
+
+def parse_list_html(text):
+    """전체 기사 목록 페이지 -> [{'path', 'published_date'}]"""
+    soup = BeautifulSoup(text, 'html.parser')
+
+    articles = []
+    # <dl> 태그로 각 기사 추출
+    dl_list = soup.select('dl')
+
+    for dl in dl_list:
+        try:
+            # 기사 링크 추출
+            dt = dl.select_one('dt')
+            if not dt:
+                continue
+            link_elem = dt.select_one('a')
+            if not link_elem:
+                continue
+            article_path = link_elem.get('href', '')
+
+            # 발행일시 추출 (<dd class='winfo'><span class="date">)
+            winfo_dd = dl.select_one("dd.winfo")
+            if winfo_dd:
+                date_span = winfo_dd.select_one("span.date")
+                if date_span:
+                    date_text = date_span.get_text(strip=True)
+                    # "2026.01.28" 형식을 "2026-01-28"로 변환
+                    if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
+                        date_text = date_text.replace('.', '-')
+                    articles.append({
+                        'path': article_path,
+                        'published_date': date_text
+                    })
+        except:
+            continue
+
+    return articles
+
+
+def parse_article_html(text):
+    """기사 페이지 -> (작성자, 좋아요, 댓글, 카테고리, 세부카테고리, 발행일시). 하이브리드 파싱(DOM+텍스트패턴)"""
+    soup = BeautifulSoup(text, 'html.parser')
+
+    reg_date = "-"
+    author = "관리자"
+    cat, subcat = "뉴스", "이슈"
+
+    # ---------------------------------------------------------
+    # 1. 작성자 & 발행일시 추출
+    # ---------------------------------------------------------
+    target_text = ""
+
+    # [Priority 1] 정확한 DOM 경로 (.viewTitle > dl > dd)
+    view_title_section = soup.select_one('.viewTitle')
+    if view_title_section:
+        dd_elem = view_title_section.select_one('dl dd')
+        if dd_elem:
+            target_text = dd_elem.get_text(separator=' ', strip=True)
+
+    # [Priority 2] 실패 시 "기사승인" 키워드 전수 조사
+    if "기사승인" not in target_text:
+        fallback_elem = soup.find(string=re.compile("기사승인"))
+        if fallback_elem:
+            target_text = fallback_elem.parent.get_text(separator=' ', strip=True)
+
+    # [Priority 3] <dd class='winfo'> 안의 <span class="date">에서 발행일시 추출
+    if reg_date == "-":
+        winfo_dd = soup.select_one("dd.winfo")
+        if winfo_dd:
+            date_span = winfo_dd.select_one("span.date")
+            if date_span:
+                date_text = date_span.get_text(strip=True)
+                # "2026.01.28" 형식을 "2026-01-28"로 변환
+                if re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
+                    reg_date = date_text.replace('.', '-')
+
+    # 파싱 ("쿡앤셰프 / 기사승인 : 2026-01-07 ...")
+    if "기사승인" in target_text:
+        parts = target_text.split("기사승인")
+
+        # 1-1. 발행일시 (우측)
+        if len(parts) > 1:
+            right_part = parts[1]
+            date_match = re.search(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(:\d{2})?', right_part)
+            if date_match:
+                reg_date = date_match.group()
+
+        # 1-2. 작성자 (좌측)
+        left_part = parts[0]
+        left_part = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', left_part) # 이메일 제거
+        left_part = left_part.replace('/', '').replace('|', '').replace('기자', '').strip()
+        if left_part:
+            author = left_part
+
+    # Fallback
+    if reg_date == "-":
+        date_match = re.search(r'\d{4}[.-]\d{2}[.-]\d{2}(\s+\d{2}:\d{2})?', soup.text)
+        if date_match: 
+            reg_date = date_match.group()
+            # "2026.01.28" 형식을 "2026-01-28"로 변환
+            if '.' in reg_date and ' ' not in reg_date:
+                reg_date = reg_date.replace('.', '-')
+
+    if author == "관리자" or len(author) > 20:
+         author_tag = soup.select_one('.user-name') or soup.select_one('.writer') or soup.select_one('.byline')
+         if author_tag: author = author_tag.text.strip()
+
+    author = author_name(author)
+
+    # ---------------------------------------------------------
+    # 2. 카테고리 추출
+    # ---------------------------------------------------------
+    navi_text = ""
+
+    # [Priority 1] .naviLink 클래스
+    navi_elem = soup.select_one('.naviLink')
+    if navi_elem:
+        navi_text = navi_elem.get_text(separator=' ', strip=True)
+
+    # [Priority 2] "Home >" 텍스트 패턴
+    if "Home" not in navi_text:
+        crumb_elem = soup.find(string=re.compile(r"Home\s*[>|]"))
+        if crumb_elem:
+            navi_text = crumb_elem.parent.get_text(separator=' ', strip=True)
+
+    # 파싱 ("Home > 푸드이슈 > ...")
+    if "Home" in navi_text and (">" in navi_text or "|" in navi_text):
+        clean_navi = re.sub(r'\s*[>|]\s*', '>', navi_text)
+        parts = clean_navi.split('>')
+        parts = [p.strip() for p in parts if p.strip()]
+
+        if parts and parts[0].lower() == 'home':
+            parts = parts[1:]
+
+        if len(parts) >= 1: cat = parts[0]
+        if len(parts) >= 2: subcat = parts[1]
+    else:
+        path_div = soup.select_one('.path') or soup.select_one('.location') or soup.select_one('#navigation')
+        if path_div:
+            txt = path_div.get_text().strip()
+            parts = re.split(r'\s*[>|]\s*', txt)
+            parts = [p.strip() for p in parts if p.strip()]
+            if parts and parts[0].lower() == 'home': parts = parts[1:]
+            if len(parts) >= 1: cat = parts[0]
+            if len(parts) >= 2: subcat = parts[1]
+
+    # 3. 기타 정보
+    likes_elem = soup.select_one('.sns-like-count')
+    likes = int(likes_elem.text.replace(',', '').strip()) if likes_elem and likes_elem.text and likes_elem.text.replace(',', '').strip().isdigit() else 0
+    comments_elem = soup.select_one('.comment-count')
+    comments = int(comments_elem.text.replace(',', '').strip()) if comments_elem and comments_elem.text and comments_elem.text.replace(',', '').strip().isdigit() else 0
+
+    return (author, likes, comments, cat, subcat, reg_date)
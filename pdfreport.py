@@ -0,0 +1,369 @@
+# pdfreport.py
+"""서버 측 PDF 보고서 (A4 가로, 7개 섹션)
+
+브라우저 인쇄(PRINT_CSS + window.print) 없이 캐시된 보고서(data.DashboardReport)로
+HTML 템플릿을 채우고 WeasyPrint로 PDF를 만든다. 차트는 SVG로 직접 그린 정적 이미지라
+plotly/브라우저가 필요 없고, 같은 보고서면 항상 같은 PDF가 나온다.
+
+    python pdfreport.py --out reports              # 주간 목록(period_options('주간')) 전체를 병렬 생성
+    python pdfreport.py --out reports --weeks 4 --workers 2
+    python pdfreport.py --out reports --period 2026-Q1 --format html
+
+WeasyPrint는 PDF 생성 시에만 임포트한다 (pip install weasyprint, 시스템 pango 라이브러리 필요).
+--format html은 WeasyPrint 없이 같은 HTML을 저장한다.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+import config
+from utils import format_range, period_options, resolve_period
+
+SECTION_TITLES = [
+    "1. 전체 성과 요약", "2. 접근 경로", "3. 방문자 특성", "4. Top 10 기사 상세",
+    "5. Top 10 기사 추이", "6. 카테고리별 분석", "7. 기자별 분석",
+]
+WEEKLY_TREND_WEEKS = 12
+TREND_ARTICLES = 5
+
+REPORT_TEMPLATE = """<!doctype html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{{ title }}</title>
+<style>
+@page { size: A4 landscape; margin: 12mm 14mm 14mm; @bottom-right { content: counter(page) " / " counter(pages); font-size: 8pt; color: #78909c; } }
+body { font-family: 'Pretendard', 'Noto Sans CJK KR', 'Malgun Gothic', sans-serif; color: #263238; font-size: 9pt; }
+.report-title { font-size: 18pt; font-weight: 800; color: {{ navy }}; }
+.period { color: #78909c; margin: 2mm 0 5mm; }
+section { page-break-after: always; }
+section:last-child { page-break-after: auto; }
+h2 { font-size: 13pt; color: {{ navy }}; border-bottom: 2px solid {{ navy }}; padding-bottom: 1.5mm; margin: 0 0 4mm; }
+h3 { font-size: 10pt; margin: 4mm 0 2mm; }
+.kpis { display: flex; gap: 3mm; margin-bottom: 4mm; }
+.kpi { flex: 1; border: 1px solid #e0e0e0; border-radius: 2mm; padding: 2.5mm; text-align: center; }
+.kpi .label { color: #78909c; font-size: 8pt; }
+.kpi .value { font-size: 14pt; font-weight: 700; color: {{ navy }}; }
+.row { display: flex; gap: 6mm; }
+.row > div { flex: 1; min-width: 0; }
+table.tbl { border-collapse: collapse; width: 100%; font-size: 8pt; }
+table.tbl th { background: #f5f7fa; border-bottom: 1px solid #b0bec5; padding: 1.2mm; text-align: center; }
+table.tbl td { border-bottom: 1px solid #eceff1; padding: 1.2mm; text-align: right; }
+table.tbl td:first-child, table.tbl td.text { text-align: left; }
+.note { color: #78909c; font-size: 7.5pt; margin-top: 2mm; }
+.warn { color: {{ red }}; font-size: 8.5pt; margin: 2mm 0; }
+svg text { font-family: inherit; }
+</style>
+</head>
+<body>
+{% for s in sections %}
+<section>
+  {% if loop.first %}<div class="report-title">📰 {{ title }}</div><div class="period">📅 조회 기간: {{ period }} · 생성: {{ generated }}</div>{% endif %}
+  <h2>{{ s.title }}</h2>
+  {{ s.body | safe }}
+</section>
+{% endfor %}
+</body>
+</html>
+"""
+
+
+# -----------------------------------------------------------------------------
+# [정적 차트] SVG
+# -----------------------------------------------------------------------------
+def _fmt(v):
+    return f"{v:,.0f}" if isinstance(v, (int, float)) else str(v)
+
+
+def bar_chart(labels, series, width=480, height=200, colors=None):
+    """세로 묶음 막대 (series: {이름: 값 리스트}), 막대 위에 값 표시"""
+    colors = colors or config.CHART_PALETTE
+    names = list(series)
+    top = max([max(vals, default=0) for vals in series.values()] + [1]) * 1.15
+    left, bottom, legend = 8, 22, 14 if len(names) > 1 else 0
+    plot_w, plot_h = width - 2 * left, height - bottom - legend
+    slot = plot_w / max(len(labels), 1)
+    bar_w = slot * 0.75 / max(len(names), 1)
+    parts = []
+    for i, label in enumerate(labels):
+        x0 = left + i * slot + slot * 0.125
+        for j, name in enumerate(names):
+            v = float(series[name][i] or 0)
+            h = plot_h * v / top
+            x, y = x0 + j * bar_w, legend + plot_h - h
+            parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w * 0.92:.1f}" height="{h:.1f}" fill="{colors[j % len(colors)]}"/>')
+            parts.append(f'<text x="{x + bar_w * 0.46:.1f}" y="{y - 2:.1f}" font-size="7" text-anchor="middle">{_fmt(v)}</text>')
+        parts.append(f'<text x="{left + (i + 0.5) * slot:.1f}" y="{height - 8}" font-size="8" text-anchor="middle">{escape(str(label))}</text>')
+    parts += _legend(names, colors, left)
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">{"".join(parts)}</svg>'
+
+
+def hbar_chart(labels, values, width=360, height=None, color=config.COLOR_NAVY):
+    """가로 막대 (값과 비중% 표시)"""
+    height = height or 18 * len(labels) + 8
+    total = sum(float(v or 0) for v in values) or 1
+    top = max([float(v or 0) for v in values] + [1])
+    label_w, value_w = 90, 80
+    parts = []
+    for i, (label, v) in enumerate(zip(labels, values)):
+        y, w = 4 + i * 18, (width - label_w - value_w) * float(v or 0) / top
+        parts.append(f'<text x="{label_w - 4}" y="{y + 11}" font-size="8" text-anchor="end">{escape(str(label))}</text>')
+        parts.append(f'<rect x="{label_w}" y="{y + 2}" width="{w:.1f}" height="12" fill="{color}"/>')
+        parts.append(f'<text x="{label_w + w + 3:.1f}" y="{y + 11}" font-size="7.5">{_fmt(float(v or 0))} ({float(v or 0) / total * 100:.1f}%)</text>')
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">{"".join(parts)}</svg>'
+
+
+def line_chart(labels, series, width=480, height=200, colors=None, markers=None):
+    """꺾은선 (series: {이름: 값 리스트}), markers: 강조할 x 위치(이상 주차 등)"""
+    colors = colors or config.CHART_PALETTE
+    names = list(series)
+    values = [float(v) for vals in series.values() for v in vals if v == v and v is not None]
+    top = max(values + [1]) * 1.1
+    left, bottom, legend = 40, 22, 14
+    plot_w, plot_h = width - left - 8, height - bottom - legend
+    step = plot_w / max(len(labels) - 1, 1)
+
+    def xy(i, v):
+        return left + i * step, legend + plot_h - plot_h * float(v) / top
+
+    parts = [f'<line x1="{left}" y1="{legend + plot_h}" x2="{width - 8}" y2="{legend + plot_h}" stroke="#b0bec5" stroke-width="0.5"/>',
+             f'<text x="{left - 3}" y="{legend + 6}" font-size="7" text-anchor="end">{_fmt(top)}</text>']
+    for j, name in enumerate(names):
+        pts = [xy(i, v) for i, v in enumerate(series[name]) if v == v and v is not None]
+        path = " ".join(f"{x:.1f},{y:.1f}" for x, y in pts)
+        parts.append(f'<polyline points="{path}" fill="none" stroke="{colors[j % len(colors)]}" stroke-width="1.5"/>')
+    for i in markers or []:
+        x, y = xy(i, series[names[0]][i])
+        parts.append(f'<path d="M{x:.1f},{y - 5:.1f} L{x + 5:.1f},{y:.1f} L{x:.1f},{y + 5:.1f} L{x - 5:.1f},{y:.1f} Z" fill="{config.COLOR_RED}"/>')
+    every = max(1, len(labels) // 12)
+    for i, label in enumerate(labels):
+        if i % every == 0 or i == len(labels) - 1:
+            parts.append(f'<text x="{left + i * step:.1f}" y="{height - 8}" font-size="7" text-anchor="middle">{escape(str(label))}</text>')
+    parts += _legend(names, colors, left)
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">{"".join(parts)}</svg>'
+
+
+def _legend(names, colors, left):
+    if len(names) < 2:
+        return []
+    parts, x = [], left
+    for j, name in enumerate(names):
+        parts.append(f'<rect x="{x}" y="2" width="8" height="8" fill="{colors[j % len(colors)]}"/>')
+        parts.append(f'<text x="{x + 11}" y="9" font-size="8">{escape(str(name)[:24])}</text>')
+        x += 16 + 6 * min(len(str(name)), 24)
+    return parts
+
+
+# -----------------------------------------------------------------------------
+# [섹션] 보고서 -> HTML 조각
+# -----------------------------------------------------------------------------
+def _table(df, columns=None, formats=None):
+    """DataFrame -> 표 HTML (formats: {컬럼: 포맷 문자열})"""
+    if df is None or df.empty:
+        return '<p class="note">데이터 없음</p>'
+    df = df[[c for c in (columns or df.columns) if c in df.columns]].copy()
+    for col, fmt in (formats or {}).items():
+        if col in df.columns:
+            df[col] = df[col].map(lambda v: fmt.format(v) if v == v and v is not None else "-")
+    return df.to_html(index=False, classes="tbl", border=0, na_rep="-")
+
+
+def _compare(df_curr, df_last, key, value):
+    """이번/비교 기간 값을 key 기준으로 합친 표"""
+    merged = df_curr[[key, value]].merge(df_last[[key, value]], on=key, how="left", suffixes=("", "_비교")).fillna(0)
+    return merged.rename(columns={value: "이번", f"{value}_비교": "비교"})
+
+
+def section_summary(r):
+    pv_per_user = round(r.cur_pv / r.cur_uv, 1) if r.cur_uv > 0 else 0
+    kpis = [("활성 기사 수", f"{r.active_article_count:,}건"), ("발행 기사 수", f"{r.published_article_count:,}건"),
+            ("조회수(PV)", f"{r.cur_pv:,}"), ("방문자수(UV)", f"{r.cur_uv:,}"), ("방문자당 PV", pv_per_user),
+            ("신규 방문자 비율", f"{r.new_ratio}%"), ("검색 유입 비율", f"{r.search_ratio}%")]
+    body = '<div class="kpis">' + "".join(f'<div class="kpi"><div class="label">{k}</div><div class="value">{v}</div></div>' for k, v in kpis) + "</div>"
+    daily = bar_chart(r.df_daily["날짜"].tolist(), {"UV": r.df_daily["UV"].tolist(), "PV": r.df_daily["PV"].tolist()}, width=500) if not r.df_daily.empty else ""
+    weekly = ""
+    if not r.df_weekly.empty:
+        df_w = r.df_weekly.tail(WEEKLY_TREND_WEEKS).reset_index(drop=True)
+        marks = [i for i, flag in enumerate(df_w.get("이상", [])) if flag]
+        weekly = line_chart(df_w["주차"].tolist(), {"UV": df_w["UV"].tolist(), "PV": df_w["PV"].tolist()}, width=500, markers=marks)
+    body += f'<div class="row"><div><h3>일별 방문 추이</h3>{daily}</div><div><h3>최근 {WEEKLY_TREND_WEEKS}주 추이</h3>{weekly}</div></div>'
+    flagged = [f"{d} {flag}" for d, flag in zip(r.df_daily.get("날짜", []), r.df_daily.get("이상", [])) if flag]
+    if flagged:
+        body += f'<p class="warn">⚠ 평소와 다른 날: {", ".join(flagged)}</p>'
+    return body
+
+
+def section_traffic(r):
+    if r.df_traffic_curr.empty:
+        return '<p class="note">데이터 없음</p>'
+    df = _compare(r.df_traffic_curr, r.df_traffic_last, "유입경로", "조회수")
+    if "이상" in r.df_traffic_curr.columns:
+        df = df.merge(r.df_traffic_curr[["유입경로", "이상"]], on="유입경로", how="left")
+    chart = hbar_chart(r.df_traffic_curr["유입경로"].tolist(), r.df_traffic_curr["조회수"].tolist(), width=440)
+    table = _table(df, formats={"이번": "{:,.0f}", "비교": "{:,.0f}"})
+    return f'<div class="row"><div><h3>유입경로별 조회수</h3>{chart}</div><div><h3>이번 / 비교 기간</h3>{table}</div></div>'
+
+
+def section_demographics(r):
+    blocks = []
+    for title, curr, last in (("지역", r.df_region_curr, r.df_region_last), ("연령", r.df_age_curr, r.df_age_last), ("성별", r.df_gender_curr, r.df_gender_last)):
+        if curr.empty:
+            blocks.append(f'<div><h3>{title}</h3><p class="note">데이터 없음</p></div>')
+            continue
+        chart = hbar_chart(curr["구분"].tolist(), curr["activeUsers"].tolist(), width=300)
+        table = _table(_compare(curr, last, "구분", "activeUsers"), formats={"이번": "{:,.0f}", "비교": "{:,.0f}"})
+        blocks.append(f"<div><h3>{title}</h3>{chart}{table}</div>")
+    return '<div class="row">' + "".join(blocks) + "</div>"
+
+
+def section_top10_detail(r):
+    return _table(r.df_top10, ['순위', '제목', '작성자', '카테고리', '발행일시', '전체조회수', '전체방문자수',
+                               '신규방문자비율', '체류시간_fmt', '좋아요', '댓글', '유입경로 1순위'],
+                  formats={'전체조회수': "{:,}", '전체방문자수': "{:,}"}).replace("<th>체류시간_fmt</th>", "<th>평균체류시간</th>")
+
+
+def section_top10_trends(r):
+    if r.df_top10.empty or r.df_top10_daily.empty:
+        return '<p class="note">데이터 없음</p>'
+    top = r.df_top10.head(TREND_ARTICLES)
+    titles = dict(zip(top["경로"], top["제목"]))
+    wide = r.df_top10_daily[r.df_top10_daily["pagePath"].isin(titles)].pivot_table(
+        index="date", columns="pagePath", values="screenPageViews", aggfunc="sum", fill_value=0)
+    series = {f"{i + 1}. {titles[p][:14]}": wide[p].tolist() for i, p in enumerate(top["경로"]) if p in wide.columns}
+    chart = line_chart([d[5:] for d in wide.index], series, width=760, height=230)
+    sources = ""
+    if not r.df_top10_sources.empty:
+        df_src = r.df_top10_sources.merge(top[["경로", "순위"]], left_on="pagePath", right_on="경로")
+        df_src = df_src.sort_values(["순위", "screenPageViews"], ascending=[True, False])
+        sources = _table(df_src.rename(columns={"screenPageViews": "조회수", "ratio": "비중(%)"}),
+                         ["순위", "유입경로", "조회수", "비중(%)"], formats={"조회수": "{:,}"})
+    return f"<h3>상위 {TREND_ARTICLES}개 기사 일별 조회수</h3>{chart}<h3>유입경로 비중</h3>{sources}"
+
+
+def section_category(r):
+    import export
+    df = export.category_summary(r.df_all_articles_with_metadata)
+    if df.empty:
+        return '<p class="note">데이터 없음</p>'
+    main = df.groupby("카테고리", observed=True)[["기사수", "전체조회수"]].sum().reset_index()
+    chart = bar_chart(main["카테고리"].tolist(), {"기사수": main["기사수"].tolist()}, width=400)
+    table = _table(df, formats={"전체조회수": "{:,}", "평균조회수": "{:,}"})
+    return f'<div class="row"><div><h3>메인 카테고리별 기사 수</h3>{chart}</div><div><h3>세부 카테고리</h3>{table}</div></div>'
+
+
+def section_writers(r):
+    from views import format_writer_table
+    body = ""
+    for title, df, keys in (("본명 기준", r.writer_stats.by_real, ["본명"]), ("필명 기준", r.writer_stats.by_pen, ["필명", "본명"])):
+        body += f"<h3>{title}</h3>" + (_table(format_writer_table(df, keys)) if not df.empty else '<p class="note">데이터 없음</p>')
+    return body + '<p class="note">기사 1건당 조회수 = 전체 조회수 ÷ 발행기사 수, 괄호는 전체 대비 비율(%)</p>'
+
+
+SECTIONS = [section_summary, section_traffic, section_demographics, section_top10_detail,
+            section_top10_trends, section_category, section_writers]
+
+
+def render_html(report, period, site=config.DEFAULT_SITE):
+    """보고서 -> 7개 섹션 HTML 문서 (period: 기간 키 또는 (시작일, 종료일))"""
+    from jinja2 import Template
+    args = period if isinstance(period, tuple) else (period, None)
+    label, s_dt, e_dt = resolve_period(*args)
+    name = config.SITES[site]["name"]
+    return Template(REPORT_TEMPLATE).render(
+        title=f"{name} 성과보고서 ({label})", period=format_range(s_dt, e_dt),
+        generated=datetime.now().strftime('%Y-%m-%d %H:%M'), navy=config.COLOR_NAVY, red=config.COLOR_RED,
+        sections=[{"title": t, "body": fn(report)} for t, fn in zip(SECTION_TITLES, SECTIONS)],
+    )
+
+
+def render_pdf(report, period, site=config.DEFAULT_SITE):
+    """보고서 -> PDF 바이트 (WeasyPrint)"""
+    try:
+        from weasyprint import HTML
+    except ImportError as e:
+        raise RuntimeError("PDF 생성에는 weasyprint가 필요합니다 (pip install weasyprint)") from e
+    return HTML(string=render_html(report, period, site)).write_pdf()
+
+
+# -----------------------------------------------------------------------------
+# [배치] 주차별 병렬 생성 (프로세스 풀)
+# -----------------------------------------------------------------------------
+def _init_worker(workers):
+    """작업 프로세스 설정 (data 임포트 전): GA4 동시 요청 상한을 작업자 수로 나누고, 중첩 파싱 풀은 끔"""
+    config.GA4_MAX_CONCURRENT_PER_PROPERTY = max(1, config.GA4_MAX_CONCURRENT_PER_PROPERTY // workers)
+    config.GA4_MAX_CONCURRENT_TOTAL = max(1, config.GA4_MAX_CONCURRENT_TOTAL // workers)
+    config.CRAWL_PARSE_WORKERS = 1
+
+
+def render_to_file(period, out_dir, site=config.DEFAULT_SITE, fmt="pdf"):
+    """기간 하나를 불러와 out_dir에 저장. 반환: 파일 경로"""
+    import data
+    import export
+    args = period if isinstance(period, tuple) else (period, None)
+    report = data.load_all_dashboard_data(*args, site)
+    path = os.path.join(out_dir, export.filename(period, fmt, site))
+    if fmt == "html":
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_html(report, period, site))
+    else:
+        with open(path, "wb") as f:
+            f.write(render_pdf(report, period, site))
+    return path
+
+
+def _render_job(period, out_dir, site, fmt):
+    started = time.perf_counter()
+    return render_to_file(period, out_dir, site, fmt), time.perf_counter() - started
+
+
+def render_batch(periods, out_dir, site=config.DEFAULT_SITE, fmt="pdf", workers=None):
+    """여러 기간을 프로세스 풀에서 병렬 생성. 반환: {기간: (경로 또는 None, 소요초 또는 오류 메시지)}"""
+    import multiprocessing
+    os.makedirs(out_dir, exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(periods)))
+    results = {}
+    # fork는 스레드가 도는 프로세스에서 안전하지 않으므로 spawn (data.parse_html 풀과 같은 방식)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(workers,)) as pool:
+        futures = {pool.submit(_render_job, p, out_dir, site, fmt): p for p in periods}
+        for future in as_completed(futures):
+            period = futures[future]
+            try:
+                results[period] = future.result()
+            except Exception as e:
+                results[period] = (None, f"{type(e).__name__}: {e}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주간 성과보고서 PDF 일괄 생성")
+    parser.add_argument("--out", default="reports", help="저장 폴더 (기본: reports)")
+    parser.add_argument("--period", action="append", help="기간 키 (여러 번 지정 가능, 없으면 주간 목록 전체)")
+    parser.add_argument("--weeks", type=int, default=None, help="주간 목록 중 최근 N주만")
+    parser.add_argument("--site", default=config.DEFAULT_SITE, choices=list(config.SITES))
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--format", default="pdf", choices=["pdf", "html"])
+    args = parser.parse_args(argv)
+
+    # 앱 화면의 주차 선택 목록과 같은 목록 (period_options('주간'))
+    periods = args.period or list(period_options("주간", args.weeks))
+    started = time.perf_counter()
+    results = render_batch(periods, args.out, args.site, args.format, args.workers)
+    failed = 0
+    for period in periods:
+        path, info = results[period]
+        if path:
+            print(f"{period}  {info:6.1f}s  {path}")
+        else:
+            failed += 1
+            print(f"{period}  실패  {info}", file=sys.stderr)
+    print(f"{len(periods) - failed}/{len(periods)}건 생성, {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
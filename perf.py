@@ -0,0 +1,191 @@
+# perf.py
+"""단계별 타이밍 계측 (경량 span)
+
+load_all_dashboard_data 한 번을 trace 하나로 묶고, 그 안의 GA4 호출·크롤링·
+번호 섹션을 span으로 기록한다. 최근 MAX_TRACES건은 메모리에 보관되어
+app.py 진단 화면과 app_flask.py /admin/perf에서 워터폴로 표시된다.
+"""
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+MAX_TRACES = 20
+
+_traces = deque(maxlen=MAX_TRACES)
+_traces_lock = threading.Lock()
+_current_trace = contextvars.ContextVar("perf_trace", default=None)
+_current_span = contextvars.ContextVar("perf_span", default=None)
+_listeners = []
+
+
+class Span:
+    __slots__ = ("name", "kind", "start", "end", "attrs", "thread", "parent")
+
+    def __init__(self, name, kind, attrs, parent=None):
+        self.name = name
+        self.kind = kind
+        self.start = time.perf_counter()
+        self.end = None
+        self.attrs = attrs
+        self.thread = threading.current_thread().name
+        self.parent = parent
+
+    @property
+    def duration(self):
+        return (self.end or time.perf_counter()) - self.start
+
+
+class Trace:
+    def __init__(self, label, attrs):
+        self.label = label
+        self.attrs = attrs
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.end = None
+        self.spans = []
+        self._lock = threading.Lock()
+        self._section = None
+
+    @property
+    def duration(self):
+        return (self.end or time.perf_counter()) - self.start
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self):
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            "label": self.label,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_ms": round(self.duration * 1000, 1),
+            "attrs": dict(self.attrs),
+            "spans": [
+                {
+                    "name": s.name,
+                    "kind": s.kind,
+                    "offset_ms": round((s.start - self.start) * 1000, 1),
+                    "duration_ms": round(s.duration * 1000, 1),
+                    "thread": s.thread,
+                    "parent": s.parent.name if s.parent else None,
+                    "attrs": dict(s.attrs),
+                }
+                for s in spans
+            ],
+        }
+
+
+def add_listener(fn):
+    """span/trace 종료 시 호출될 콜백 등록: fn(event, obj), event는 'span' 또는 'trace'"""
+    _listeners.append(fn)
+
+
+def _notify(event, obj):
+    for fn in _listeners:
+        try:
+            fn(event, obj)
+        except Exception:
+            pass
+
+
+def _finish(span):
+    span.end = time.perf_counter()
+    t = _current_trace.get()
+    if t is not None:
+        t.add(span)
+    _notify("span", span)
+
+
+@contextmanager
+def trace(label, **attrs):
+    """대시보드 로드 1회 단위. 캐시 적중이 기본값이며, 실제 계산 시 본문에서 note_trace(cache='miss')"""
+    attrs.setdefault("cache", "hit")
+    t = Trace(label, attrs)
+    token_t = _current_trace.set(t)
+    token_s = _current_span.set(None)
+    try:
+        yield t
+    finally:
+        if t._section is not None:
+            _finish(t._section)
+            t._section = None
+        t.end = time.perf_counter()
+        _current_span.reset(token_s)
+        _current_trace.reset(token_t)
+        with _traces_lock:
+            _traces.append(t)
+        _notify("trace", t)
+
+
+@contextmanager
+def span(name, kind="step", **attrs):
+    """개별 작업(GA4 호출, 크롤링 등) 계측. trace 밖에서도 리스너에는 전달됨"""
+    parent = _current_span.get()
+    s = Span(name, kind, attrs, parent)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.attrs.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        _current_span.reset(token)
+        _finish(s)
+
+
+def section(name):
+    """번호 섹션 경계 표시: 이전 섹션을 닫고 새 섹션을 연다 (들여쓰기 없이 사용)"""
+    t = _current_trace.get()
+    if t is None:
+        return
+    if t._section is not None:
+        _finish(t._section)
+    t._section = Span(name, "section", {})
+    _current_span.set(t._section)
+
+
+def note(**attrs):
+    """현재 span에 속성 추가 (예: 캐시 함수 본문에서 cache='miss')"""
+    s = _current_span.get()
+    if s is not None:
+        s.attrs.update(attrs)
+
+
+def note_trace(**attrs):
+    t = _current_trace.get()
+    if t is not None:
+        t.attrs.update(attrs)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """ThreadPoolExecutor.submit 대체: 현재 trace/span 컨텍스트를 작업 스레드로 전달"""
+    ctx = contextvars.copy_context()
+    return executor.submit(ctx.run, fn, *args, **kwargs)
+
+
+def recent_traces(n=MAX_TRACES):
+    """최근 trace n건 (최신순, dict)"""
+    with _traces_lock:
+        items = list(_traces)[-n:]
+    return [t.to_dict() for t in reversed(items)]
+
+
+def summarize(trace_dict):
+    """trace 요약: GA4 호출/행 수, 크롤링 건수와 캐시 적중, 섹션별 소요시간"""
+    spans = trace_dict["spans"]
+    ga4 = [s for s in spans if s["kind"] == "ga4"]
+    crawl = [s for s in spans if s["kind"] == "crawl"]
+    return {
+        "ga4_calls": len(ga4),
+        "ga4_rows": sum(s["attrs"].get("rows", 0) for s in ga4),
+        "ga4_ms": round(sum(s["duration_ms"] for s in ga4), 1),
+        "crawl_calls": len(crawl),
+        "crawl_hits": sum(1 for s in crawl if s["attrs"].get("cache") == "hit"),
+        "crawl_ms": round(sum(s["duration_ms"] for s in crawl), 1),
+        "sections": {s["name"]: s["duration_ms"] for s in spans if s["kind"] == "section"},
+    }
@@ -0,0 +1,40 @@
+# sites.py
+"""현재 사이트(GA4 속성) 컨텍스트
+
+load_all_dashboard_data 한 번은 사이트 하나를 대상으로 실행된다. GA4 호출(run_ga4_report),
+크롤링 주소, 팩트 DB 경로가 모두 이 컨텍스트에서 사이트 정보를 읽는다.
+perf와 같은 contextvar 방식이라 perf.submit으로 넘긴 작업 스레드에도 그대로 전달된다.
+"""
+import contextvars
+from contextlib import contextmanager
+
+import config
+
+_current_site = contextvars.ContextVar("site", default=config.DEFAULT_SITE)
+
+
+def current():
+    """현재 사이트 키"""
+    return _current_site.get()
+
+
+def info(site=None):
+    """사이트 설정 (name, property_id, base_url). 알 수 없는 키는 KeyError"""
+    return config.SITES[site or current()]
+
+
+def set_current(site):
+    """스크립트 실행 단위로 사이트 지정 (Streamlit 스크립트 스레드 등, 해제하지 않음)"""
+    info(site)
+    _current_site.set(site)
+
+
+@contextmanager
+def use(site):
+    """블록 안에서만 사이트 지정"""
+    info(site)
+    token = _current_site.set(site)
+    try:
+        yield config.SITES[site]
+    finally:
+        _current_site.reset(token)
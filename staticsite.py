@@ -0,0 +1,228 @@
+# staticsite.py
+"""지난 주간 보고서 정적 사이트 생성 (nginx가 그대로 서빙)
+
+끝난 주는 내용이 바뀌지 않으므로, 매번 Flask/Streamlit이 보고서를 다시 그리는 대신
+주마다 보고서 한 장(report.html)을 파일로 만들어 둔다.
+templates/dashboard.html이 있으면 Flask 화면과 같은 템플릿/변수(app_flask.report_context)로,
+없으면 pdfreport.render_html 보고서(차트는 SVG로 내장)로 만든다.
+
+    python staticsite.py --out site                # 주간 목록(period_options('주간')) 중 끝난 주 전체
+    python staticsite.py --out site --weeks 4 --site cncnews
+    python staticsite.py --out site --force        # 변경 여부와 관계없이 다시 생성
+
+출력 폴더
+    index.html                              주차 목록
+    manifest.json                           주차별 스냅샷 해시, 생성/확인 시각 (증분 생성 기준)
+    <사이트>/<주 시작일>/report.html        보고서
+
+- 주마다 보고서를 불러와(팩트 테이블 캐시 사용) 스냅샷 해시를 구하고, manifest와 같으면 파일을 건드리지 않는다.
+- 주가 끝난 뒤 SEAL_DAYS일이 지나서 확인된 페이지는 확정으로 보고 불러오지도 않는다
+  (매핑 파일 버전이 바뀌었거나 --force면 다시 확인).
+- 데이터가 비어 있으면(GA4 인증 실패 등) 기존 페이지를 덮어쓰지 않는다.
+- Flask 앱(템플릿 렌더링용)은 주마다가 아니라 빌드마다 한 번만 만든다.
+
+nginx 예시 (로그인이 필요하면 auth_basic 등으로 같은 보호를 둘 것)
+    location /archive/ { alias /srv/cncnews/site/; add_header Cache-Control "public, max-age=86400"; }
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import config
+from utils import format_range, period_options, resolve_period
+
+VERSION = 2  # 페이지 구성이 바뀌면 올림 (전체 재생성)
+SEAL_DAYS = int(os.getenv("CNCNEWS_STATIC_SEAL_DAYS", "14"))
+PAGE = "report.html"
+
+INDEX_TEMPLATE = """<!doctype html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>주간 보고서 보관함</title>
+{{ css|safe }}
+</head>
+<body>
+<div class="report-title">🗂 주간 보고서 보관함</div>
+{% for site, rows in sites %}
+<div class="sub-header">{{ site }}</div>
+<table class="group-table">
+<tr><th>주차</th><th>기간</th><th>보고서</th><th>생성</th></tr>
+{% for r in rows %}
+<tr><td>{{ r.label }}</td><td>{{ r.period }}</td>
+<td><a href="{{ r.site }}/{{ r.week }}/report.html">보기</a></td>
+<td>{{ r.generated_at }}</td></tr>
+{% endfor %}
+</table>
+{% endfor %}
+</body>
+</html>
+"""
+
+
+def finished_weeks(count=None, today=None):
+    """주간 목록 중 종료일이 today(기본 오늘) 이전인 주 키 (최신순)"""
+    today = (today or date.today()).strftime('%Y-%m-%d')
+    return [k for k in period_options("주간", count) if resolve_period(k)[2] < today]
+
+
+def _digest(h, value):
+    import pandas as pd
+    if isinstance(value, pd.DataFrame):
+        h.update(repr((list(value.columns), [str(t) for t in value.dtypes], value.shape)).encode())
+        if len(value):
+            try:
+                h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+            except (TypeError, ValueError):
+                h.update(value.to_json(date_format="iso", default_handler=str).encode())
+    elif isinstance(value, tuple):
+        for v in value:
+            _digest(h, v)
+    else:
+        h.update(repr(value).encode())
+
+
+def snapshot_hash(report):
+    """보고서 스냅샷 해시 (모든 표의 열/형식/값 + 지표, VERSION 포함)"""
+    h = hashlib.sha256(f"v{VERSION}".encode())
+    _digest(h, tuple(report))
+    return h.hexdigest()
+
+
+def _is_empty(report):
+    return not report.cur_pv and report.df_daily.empty
+
+
+def _sealed(entry, registry_version, force):
+    """이전 생성분이 확정인지 (주 종료 후 SEAL_DAYS일 지나 확인됐고 매핑 파일 버전이 같음)"""
+    if force or not entry or entry.get("authors") != registry_version:
+        return False
+    ended = datetime.strptime(resolve_period(entry["week"])[2], '%Y-%m-%d')
+    return datetime.strptime(entry["checked_at"], '%Y-%m-%d %H:%M') >= ended + timedelta(days=SEAL_DAYS)
+
+
+def _write(path, text):
+    """같은 폴더의 임시 파일에 쓴 뒤 교체 (nginx가 쓰다 만 파일을 내보내지 않도록)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def make_app():
+    """templates/dashboard.html이 있으면 Flask 앱 (빌드당 한 번), 없으면 None (pdfreport 보고서 사용)"""
+    import app_flask
+    app = app_flask.create_app()
+    if not os.path.exists(os.path.join(app.root_path, app.template_folder, "dashboard.html")):
+        return None
+    return app
+
+
+def render_page(report, week, site, app=None):
+    """report.html 내용: Flask 대시보드 템플릿(app이 있을 때) 또는 pdfreport 보고서"""
+    if app is None:
+        import pdfreport
+        return pdfreport.render_html(report, week, site)
+    from flask import render_template
+
+    import app_flask
+    label, s_dt, e_dt = resolve_period(week)
+    with app.test_request_context(f"/dashboard?period={week}&site={site}"):
+        return render_template("dashboard.html", **app_flask.report_context(report, week, label, format_range(s_dt, e_dt), site))
+
+
+def build_week(out_dir, week, site, entry=None, force=False, app=None):
+    """주 하나를 필요할 때만 생성. 반환: (상태, 새 manifest 항목 또는 기존 항목)"""
+    import authors
+    registry_version = authors.registry().version
+    if _sealed(entry, registry_version, force):
+        return "확정", entry
+
+    import data
+    report = data.load_all_dashboard_data(week, None, site)
+    if _is_empty(report):
+        return "데이터 없음", entry
+    digest = snapshot_hash(report)
+    path = os.path.join(out_dir, site, week, PAGE)
+    now = datetime.now().strftime('%Y-%m-%d %H:%M')
+    if not force and entry and entry["hash"] == digest and os.path.exists(path):
+        # 내용은 그대로 - 확정 판정용 확인 시각만 갱신
+        return "변경 없음", dict(entry, checked_at=now, authors=registry_version)
+
+    _write(path, render_page(report, week, site, app))
+
+    label, s_dt, e_dt = resolve_period(week)
+    return "생성", {
+        "site": site, "week": week, "label": label, "period": format_range(s_dt, e_dt),
+        "hash": digest, "authors": registry_version,
+        "generated_at": now, "checked_at": now,
+    }
+
+
+def load_manifest(out_dir):
+    """manifest.json의 {'사이트/주': 항목} (없거나 VERSION이 다르면 빈 dict)"""
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return doc.get("pages", {}) if doc.get("version") == VERSION else {}
+
+
+def write_index(out_dir, pages):
+    """manifest.json과 index.html 저장"""
+    from jinja2 import Template
+    _write(os.path.join(out_dir, "manifest.json"),
+           json.dumps({"version": VERSION, "pages": pages}, ensure_ascii=False, indent=1, sort_keys=True))
+    by_site = {}
+    for entry in sorted(pages.values(), key=lambda e: e["week"], reverse=True):
+        by_site.setdefault(config.SITES.get(entry["site"], {}).get("name", entry["site"]), []).append(entry)
+    _write(os.path.join(out_dir, "index.html"), Template(INDEX_TEMPLATE).render(css=config.CSS, sites=by_site.items()))
+
+
+def build(out_dir, weeks, sites_=(config.DEFAULT_SITE,), force=False):
+    """여러 사이트/주를 증분 생성. 반환: [(사이트, 주, 상태, 소요초)]"""
+    pages = load_manifest(out_dir)
+    app = make_app()
+    results = []
+    for site in sites_:
+        for week in weeks:
+            key = f"{site}/{week}"
+            started = time.perf_counter()
+            try:
+                status, entry = build_week(out_dir, week, site, pages.get(key), force, app)
+            except Exception as e:
+                status, entry = f"실패 {type(e).__name__}: {e}", pages.get(key)
+            if entry:
+                pages[key] = entry
+            results.append((site, week, status, time.perf_counter() - started))
+    write_index(out_dir, pages)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="지난 주간 보고서 정적 사이트 생성")
+    parser.add_argument("--out", default="site", help="출력 폴더 (기본: site)")
+    parser.add_argument("--weeks", type=int, default=None, help="주간 목록 중 최근 N주만")
+    parser.add_argument("--site", action="append", choices=list(config.SITES), help="사이트 (여러 번 지정 가능, 기본: 기본 사이트)")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 다시 생성")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = build(args.out, finished_weeks(args.weeks), args.site or [config.DEFAULT_SITE], args.force)
+    for site, week, status, secs in results:
+        print(f"{site}/{week}  {secs:6.1f}s  {status}", file=sys.stderr if status.startswith("실패") else sys.stdout)
+    statuses = [status for _, _, status, _ in results]
+    built = statuses.count("생성")
+    failed = sum(s.startswith("실패") for s in statuses)
+    print(f"{built}건 생성, {len(results) - built - failed}건 유지, {failed}건 실패, {time.perf_counter() - started:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+# tests/conftest.py
+# 최상위 모듈(discovery, normalize 등)을 그대로 import 하도록 저장소 루트를 경로에 추가
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,95 @@
+# tests/test_authors.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import authors
+
+# '한별' 필명이 2025-06-30까지 김철수, 2025-07-01부터 이영희에게 넘어감
+# '새벽'은 기간이 겹치게 등록됨 (겹치는 날은 나중 항목 우선)
+ENTRIES = [
+    {"본명": "김철수", "필명": "김철수"},
+    {"본명": "김철수", "필명": "한별", "종료일": "2025-06-30"},
+    {"본명": "이영희", "필명": "한별", "시작일": "2025-07-01"},
+    {"본명": "이영희", "필명": "이영희"},
+    {"본명": "박민수", "필명": "새벽", "시작일": "2025-01-01", "종료일": "2025-12-31"},
+    {"본명": "최지훈", "필명": "새벽", "시작일": "2025-12-01"},
+    {"본명": "정다은", "필명": "가을", "시작일": "2026-01-01", "종료일": "2026-01-31"},
+]
+
+
+@pytest.fixture
+def registry():
+    return authors.AuthorRegistry(ENTRIES, version="test")
+
+
+@pytest.mark.parametrize("pen, on, expected", [
+    ("한별", "2025-06-30", "김철수"),  # 종료일 포함
+    ("한별", "2025-07-01", "이영희"),  # 시작일 포함
+    ("한별", "2020-01-01", "김철수"),  # 시작일 없음 = 처음부터
+    ("한별", "2099-12-31", "이영희"),  # 종료일 없음 = 계속
+    ("새벽", "2024-12-31", "새벽"),    # 어느 기간에도 없으면 필명 그대로
+    ("새벽", "2025-11-30", "박민수"),
+    ("새벽", "2025-12-15", "최지훈"),  # 겹치는 기간은 나중 항목
+    ("새벽", "2026-03-01", "최지훈"),
+    ("가을", "2025-12-31", "가을"),
+    ("가을", "2026-01-31", "정다은"),
+    ("가을", "2026-02-01", "가을"),
+    ("미등록", "2025-07-01", "미등록"),
+    ("김철수", pd.Timestamp("2025-07-01 13:00"), "김철수"),  # Timestamp/datetime도 날짜로
+])
+def test_real_name_uses_mapping_valid_on_date(registry, pen, on, expected):
+    assert registry.real_name(pen, on) == expected
+
+
+def test_pen_to_real_snapshot_excludes_expired_pens(registry):
+    assert registry.pen_to_real("2026-02-01") == {"김철수": "김철수", "한별": "이영희", "이영희": "이영희", "새벽": "최지훈"}
+    assert registry.pen_to_real("2026-02-01") is registry.pen_to_real("2026-02-01")  # 날짜별 스냅샷 재사용
+
+
+def test_pens_by_real_name(registry):
+    assert registry.pens("김철수") == ["김철수", "한별"]
+    assert registry.pens("김철수", "2025-07-01") == ["김철수"]
+    assert registry.pens("이영희", "2025-07-01") == ["한별", "이영희"]
+    assert registry.pens("미등록") == []
+
+
+@pytest.mark.parametrize("on, pens, expected", [
+    ("2025-06-01", ["한별", "김철수", "이영희"], ["김철수", "김철수", "이영희"]),
+    ("2025-08-01", ["한별", "김철수", "이영희"], ["이영희", "김철수", "이영희"]),
+    # 매핑 없는 필명은 그대로 본명 범주에 추가
+    ("2025-08-01", ["무명", "한별", "무명"], ["무명", "이영희", "무명"]),
+    # 결측은 결측 그대로 (코드 -1)
+    ("2025-08-01", ["한별", None, np.nan, "무명"], ["이영희", np.nan, np.nan, "무명"]),
+    ("2025-08-01", [], []),
+])
+def test_real_names_maps_codes(registry, on, pens, expected):
+    result = registry.real_names(pd.Series(pens, dtype=object), on)
+    assert isinstance(result, pd.Categorical)
+    assert [None if pd.isna(v) else v for v in result] == [None if pd.isna(e) else e for e in expected]
+
+
+def test_real_names_categories_keep_registry_order_and_append_unmapped(registry):
+    result = registry.real_names(pd.Categorical(["무명", "한별", "새벽"]), "2025-08-01")
+    assert list(result.categories) == ["김철수", "이영희", "박민수", "최지훈", "정다은", "무명"]
+    assert list(result) == ["무명", "이영희", "박민수"]
+    # 모든 필명이 등록돼 있으면 레지스트리 범주 그대로 (같은 dtype이라 concat/groupby가 코드로 묶임)
+    assert registry.real_names(["한별"], "2025-08-01").dtype == registry.real_dtype
+
+
+def test_registry_reloads_when_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "authors.json"
+    path.write_text('{"version": "v1", "authors": [{"본명": "김철수", "필명": "한별"}]}', encoding="utf-8")
+    monkeypatch.setattr(authors, "PATH", str(path))
+    monkeypatch.setattr(authors, "_registry", None)
+    assert authors.registry().real_name("한별") == "김철수"
+
+    path.write_text('{"version": "v2", "authors": [{"본명": "이영희", "필명": "한별"}]}', encoding="utf-8")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert authors.registry().version == "v2"
+    assert authors.registry().real_name("한별") == "이영희"
+
+    monkeypatch.setattr(authors, "PATH", str(tmp_path / "missing.json"))
+    assert len(authors.registry()) == 0
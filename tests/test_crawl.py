@@ -0,0 +1,223 @@
+# tests/test_crawl.py
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import bench
+import config
+import crawlcache
+import data
+
+BASE = config.SITES[config.DEFAULT_SITE]["base_url"]
+PATH = bench.article_path(3)
+
+
+@pytest.fixture(autouse=True)
+def crawl_env(tmp_path, monkeypatch):
+    """테스트마다 빈 임시 크롤링 캐시 DB (CNCNEWS_CRAWL_DB), 새 차단기, 현재 스레드 파싱"""
+    path = str(tmp_path / "crawl.sqlite")
+    monkeypatch.setenv("CNCNEWS_CRAWL_DB", path)
+    monkeypatch.setattr(crawlcache, "DB_PATH", path)
+    monkeypatch.setattr(crawlcache, "_ready", False)
+    monkeypatch.setattr(data, "_breakers", {})
+    monkeypatch.setattr(config, "CRAWL_PARSE_WORKERS", 1)
+    data.crawl_single_article_cached.clear()
+    data.crawl_article_list_page.clear()
+    yield
+    data.crawl_single_article_cached.clear()
+    data.crawl_article_list_page.clear()
+
+
+@pytest.fixture
+def site(monkeypatch):
+    """requests.get 대역 (bench.FakeSite: ETag / 304 지원)"""
+    fake = bench.FakeSite(datetime(2026, 1, 4))
+    monkeypatch.setattr(requests, "get", fake.get)
+    return fake
+
+
+def down(monkeypatch, status=None):
+    """사이트 장애: status가 없으면 연결 오류, 있으면 해당 HTTP 상태 응답"""
+    calls = []
+
+    def get(url, headers=None, timeout=None, **kwargs):
+        calls.append(url)
+        if status is None:
+            raise requests.ConnectionError(url)
+        return SimpleNamespace(status_code=status, headers={}, text="")
+
+    monkeypatch.setattr(requests, "get", get)
+    return calls
+
+
+def expire(breaker):
+    """open 상태의 reset_seconds 경과를 흉내"""
+    breaker.opened_at -= breaker.reset_seconds
+
+
+# -----------------------------------------------------------------------------
+# [1] CircuitBreaker 상태 전이
+# -----------------------------------------------------------------------------
+def test_breaker_opens_after_threshold_failures():
+    breaker = data.CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    for _ in range(2):
+        breaker.failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_allows_a_single_probe():
+    breaker = data.CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.failure()
+    expire(breaker)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()  # 시험 요청 결과가 나오기 전에는 한 건만
+
+
+def test_breaker_closes_on_probe_success():
+    breaker = data.CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    breaker.failure()
+    breaker.failure()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.success()
+    assert (breaker.state, breaker.failures) == ("closed", 0)
+    assert breaker.allow() and breaker.allow()
+
+
+def test_breaker_reopens_on_probe_failure():
+    breaker = data.CircuitBreaker(failure_threshold=3, reset_seconds=60)
+    for _ in range(3):
+        breaker.failure()
+    expire(breaker)
+    assert breaker.allow()
+    breaker.failure()  # half_open에서는 한 번 실패로 다시 open
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_success_resets_consecutive_failures():
+    breaker = data.CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    assert breaker.state == "closed"
+
+
+# -----------------------------------------------------------------------------
+# [2] _crawl_get: 실패 집계와 차단
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("status", [None, 500, 503, 429])
+def test_crawl_get_failures_open_the_breaker(monkeypatch, status):
+    calls = down(monkeypatch, status)
+    url = f"{BASE}{PATH}"
+    for _ in range(config.CRAWL_FAILURE_THRESHOLD):
+        with pytest.raises(data.CrawlError):
+            data._crawl_get(url, BASE, timeout=1.0)
+    assert data.crawl_breaker(BASE).state == "open"
+
+    # 차단 중에는 요청을 보내지 않고 CircuitOpen
+    with pytest.raises(data.CircuitOpen):
+        data._crawl_get(url, BASE, timeout=1.0)
+    assert len(calls) == config.CRAWL_FAILURE_THRESHOLD
+
+
+def test_crawl_get_passes_404_through(monkeypatch):
+    down(monkeypatch, 404)
+    for _ in range(config.CRAWL_FAILURE_THRESHOLD + 1):
+        assert data._crawl_get(f"{BASE}/missing", BASE, timeout=1.0).status_code == 404
+    assert data.crawl_breaker(BASE).state == "closed"
+
+
+def test_crawl_get_probe_success_closes_breaker(monkeypatch, site):
+    breaker = data.crawl_breaker(BASE)
+    for _ in range(config.CRAWL_FAILURE_THRESHOLD):
+        breaker.failure()
+    expire(breaker)
+    assert data._crawl_get(f"{BASE}{PATH}", BASE, timeout=1.0).status_code == 200
+    assert breaker.state == "closed"
+
+
+def test_breakers_are_per_site(monkeypatch):
+    down(monkeypatch)
+    for _ in range(config.CRAWL_FAILURE_THRESHOLD):
+        with pytest.raises(data.CrawlError):
+            data._crawl_get(f"{BASE}{PATH}", BASE, timeout=1.0)
+    assert data.crawl_breaker(BASE).state == "open"
+    assert data.crawl_breaker("http://other.example").state == "closed"
+
+
+# -----------------------------------------------------------------------------
+# [3] 304 응답은 저장된 결과 유지 (crawlcache.touch)
+# -----------------------------------------------------------------------------
+def test_not_modified_returns_stored_result_without_parsing(monkeypatch, site):
+    url = f"{BASE}{PATH}"
+    first = data.crawl_single_article_cached(PATH, BASE)
+    stored = crawlcache.get(url)
+    assert stored["etag"] and tuple(stored["result"]) == first
+
+    touched = []
+    monkeypatch.setattr(crawlcache, "touch", lambda u: touched.append(u))
+    monkeypatch.setattr(data.parsing, "parse_article_html", lambda text: pytest.fail("304에서 다시 파싱함"))
+    data.crawl_single_article_cached.clear()
+
+    assert data.crawl_single_article_cached(PATH, BASE) == first
+    assert site.not_modified == 1
+    assert touched == [url]
+
+
+def test_touch_keeps_result_and_validators(site):
+    url = f"{BASE}{PATH}"
+    data.crawl_single_article_cached(PATH, BASE)
+    before = crawlcache.get(url)
+
+    data.crawl_single_article_cached.clear()
+    data.crawl_single_article_cached(PATH, BASE)
+    assert site.not_modified == 1
+    assert crawlcache.get(url) == before
+
+
+def test_conditional_headers_from_stored_validators():
+    assert crawlcache.conditional_headers(None) == {}
+    crawlcache.put("u", {"ETag": '"abc"', "Last-Modified": "Sun, 04 Jan 2026 00:00:00 GMT"}, [1])
+    assert crawlcache.conditional_headers(crawlcache.get("u")) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Sun, 04 Jan 2026 00:00:00 GMT",
+    }
+    crawlcache.put("u", {}, [2])  # 검증자 없는 응답으로 덮어쓰면 조건부 헤더도 없음
+    assert crawlcache.conditional_headers(crawlcache.get("u")) == {}
+
+
+# -----------------------------------------------------------------------------
+# [4] 장애 중에는 마지막 성공 결과 (stale fallback)
+# -----------------------------------------------------------------------------
+def test_article_meta_falls_back_to_last_success(monkeypatch, site):
+    fresh = data.fetch_article_meta(PATH)
+    assert fresh != data.DEFAULT_ARTICLE_META
+
+    data.crawl_single_article_cached.clear()
+    calls = down(monkeypatch)
+    for _ in range(config.CRAWL_FAILURE_THRESHOLD + 2):
+        assert data.fetch_article_meta(PATH) == fresh
+    # 차단기가 열린 뒤에는 요청 없이 바로 저장된 결과
+    assert len(calls) == config.CRAWL_FAILURE_THRESHOLD
+
+
+def test_article_meta_without_stored_result_is_default(monkeypatch):
+    down(monkeypatch, 503)
+    assert data.fetch_article_meta(PATH) == data.DEFAULT_ARTICLE_META
+
+
+def test_list_page_falls_back_to_last_success(monkeypatch, site):
+    fresh = data.fetch_article_list_page(1)
+    assert len(fresh) == site.per_page
+
+    data.crawl_article_list_page.clear()
+    down(monkeypatch)
+    assert data.fetch_article_list_page(1) == fresh
+    assert data.fetch_article_list_page(2) == []  # 저장된 목록이 없는 페이지
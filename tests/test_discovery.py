@@ -0,0 +1,103 @@
+# tests/test_discovery.py
+import pandas as pd
+
+import discovery
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://www.cooknchefnews.com/news/articleView.html?idxno=101</loc><lastmod>2026-01-09T10:00:00+09:00</lastmod></url>
+  <url><loc>https://www.cooknchefnews.com/news/articleView.html?idxno=102</loc><lastmod>2026-01-08</lastmod></url>
+</urlset>
+"""
+
+NEWS_SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://www.cooknchefnews.com/news/articleView.html?idxno=201</loc>
+    <lastmod>2026-01-09T18:00:00+09:00</lastmod>
+    <news:news><news:publication_date>2026-01-05T09:30:00+09:00</news:publication_date><news:title>A</news:title></news:news></url>
+  <url><loc>https://www.cooknchefnews.com/news/articleView.html?idxno=202</loc>
+    <lastmod>2026-01-06T08:00:00+09:00</lastmod>
+    <news:news><news:title>B</news:title></news:news></url>
+</urlset>
+"""
+
+SITEMAP_INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.cooknchefnews.com/sitemap-1.xml</loc><lastmod>2026-01-09</lastmod></sitemap>
+</sitemapindex>
+"""
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>CNC</title>
+  <item><title>A</title><link>https://www.cooknchefnews.com/news/articleView.html?idxno=301</link><pubDate>Mon, 05 Jan 2026 00:30:00 GMT</pubDate></item>
+  <item><title>B</title><link>https://www.cooknchefnews.com/news/articleView.html?idxno=302</link><pubDate>2026.01.04 15:00</pubDate></item>
+  <item><title>C</title><link>https://www.cooknchefnews.com/news/articleView.html?idxno=301</link><pubDate>Mon, 05 Jan 2026 09:30:00 +0900</pubDate></item>
+</channel></rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>CNC</title><updated>2026-01-09T00:00:00Z</updated>
+  <entry><title>A</title><link href="https://www.cooknchefnews.com/news/articleView.html?idxno=401"/>
+    <published>2026-01-03T01:00:00Z</published><updated>2026-01-09T01:00:00Z</updated></entry>
+  <entry><title>B</title><link href="https://www.cooknchefnews.com/news/articleView.html?idxno=402"/>
+    <updated>2026-01-09T02:00:00Z</updated></entry>
+</feed>
+"""
+
+PATH = "/news/articleView.html?idxno="
+
+
+def frame(data):
+    return discovery.records_frame(discovery.parse_feed(data))
+
+
+def test_sitemap_lastmod_is_not_a_publication_date():
+    assert discovery.parse_feed(SITEMAP) == [
+        ("https://www.cooknchefnews.com/news/articleView.html?idxno=101", None),
+        ("https://www.cooknchefnews.com/news/articleView.html?idxno=102", None),
+    ]
+    df = frame(SITEMAP)
+    assert df.empty
+    assert not discovery.covers(df, "2026-01-04")
+
+
+def test_news_sitemap_prefers_publication_date_then_lastmod():
+    assert [p for _, p in discovery.parse_feed(NEWS_SITEMAP)] == ["2026-01-05T09:30:00+09:00", "2026-01-06T08:00:00+09:00"]
+    df = frame(NEWS_SITEMAP)
+    assert df["path"].tolist() == [PATH + "202", PATH + "201"]
+    assert df["published_at"].tolist() == [pd.Timestamp("2026-01-06 08:00"), pd.Timestamp("2026-01-05 09:30")]
+
+
+def test_sitemap_index_is_skipped():
+    assert discovery.parse_feed(SITEMAP_INDEX) == []
+
+
+def test_rss_dates_are_converted_to_local_time_and_deduplicated():
+    df = frame(RSS)
+    assert df["path"].tolist() == [PATH + "301", PATH + "302"]
+    assert df["published_at"].tolist() == [pd.Timestamp("2026-01-05 09:30"), pd.Timestamp("2026-01-04 15:00")]
+    assert discovery.covers(df, "2026-01-05")
+    assert not discovery.covers(df, "2026-01-04")
+
+
+def test_atom_uses_published_and_drops_update_only_entries():
+    assert discovery.parse_feed(ATOM) == [
+        ("https://www.cooknchefnews.com/news/articleView.html?idxno=401", "2026-01-03T01:00:00Z"),
+        ("https://www.cooknchefnews.com/news/articleView.html?idxno=402", None),
+    ]
+    df = frame(ATOM)
+    assert df["path"].tolist() == [PATH + "401"]
+    assert df["published_at"].tolist() == [pd.Timestamp("2026-01-03 10:00")]
+
+
+def test_published_between_is_inclusive_by_day():
+    df = frame(RSS)
+    assert discovery.published_between(df, "2026-01-05", "2026-01-05")["path"].tolist() == [PATH + "301"]
+    assert discovery.published_between(df, "2026-01-04", "2026-01-05")["path"].tolist() == [PATH + "301", PATH + "302"]
+
+
+def test_empty_records_frame_has_typed_columns():
+    df = discovery.records_frame([])
+    assert df.empty
+    assert list(df.columns) == ["path", "published_at"]
+    assert df["published_at"].dtype.kind == "M"
@@ -0,0 +1,122 @@
+# tests/test_facts.py
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import facts
+
+
+@pytest.fixture(autouse=True)
+def facts_db(tmp_path, monkeypatch):
+    """테스트마다 빈 임시 팩트 DB (CNCNEWS_FACTS_DB)"""
+    path = str(tmp_path / "facts.sqlite")
+    monkeypatch.setenv("CNCNEWS_FACTS_DB", path)
+    monkeypatch.setattr(facts, "DB_PATH", path)
+    return path
+
+
+def day(offset):
+    """오늘 기준 offset일 전 'YYYY-MM-DD'"""
+    return (datetime.now() - timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+def fact_rows(rows):
+    """[(pagePath, pageTitle, sessionSource, PV, 참여시간, 세션, 참여세션)] -> 팩트 DataFrame"""
+    return pd.DataFrame(rows, columns=["pagePath", "pageTitle", "sessionSource"] + facts.FACT_METRICS)
+
+
+A = ("/news/articleView.html?idxno=1", "기사 A")
+B = ("/news/articleView.html?idxno=2", "기사 B")
+TOTALS = {"activeUsers": 10, "screenPageViews": 30, "newUsers": 4}
+
+
+def test_only_unsettled_and_missing_days_are_extracted_again():
+    old, fresh = day(facts.FRESH_DAYS + 3), day(0)
+    facts.write_day(old, fact_rows([(*A, "google", 5, 50, 2, 1)]), TOTALS)
+    facts.write_day(fresh, fact_rows([(*A, "google", 7, 70, 3, 2)]), TOTALS)
+
+    # 확정된 날은 빠지고, 최근 FRESH_DAYS일과 추출하지 않은 날만 남음 (내일 이후는 제외)
+    assert facts.missing_days(old, day(-2)) == [d for d in facts.day_range(old, day(0)) if d != old]
+    df = facts.daily_totals(old, fresh)
+    assert df.set_index("date")["final"].to_dict() == {old: 1, fresh: 0}
+
+
+def test_rewriting_a_day_replaces_its_rows():
+    d = day(1)
+    facts.write_day(d, fact_rows([(*A, "google", 5, 50, 2, 1), (*B, "naver", 3, 30, 1, 1)]), TOTALS)
+    facts.write_day(d, fact_rows([(*A, "google", 8, 80, 4, 3)]), {**TOTALS, "screenPageViews": 8})
+
+    df = facts.article_metrics(d, d)
+    assert df[["pagePath", "screenPageViews"]].values.tolist() == [[A[0], 8]]
+    assert facts.daily_totals(d, d)["screenPageViews"].tolist() == [8]
+
+
+def test_period_sums_days_and_sources():
+    d1, d2 = day(10), day(9)
+    facts.write_day(d1, fact_rows([(*A, "google", 5, 50, 2, 1), (*A, "naver", 1, 10, 1, 1), (*B, "google", 4, 40, 2, 2)]), TOTALS)
+    facts.write_day(d2, fact_rows([(*A, "google", 2, 20, 1, 1), (*B, "naver", 6, 60, 3, 3)]), TOTALS)
+
+    df = facts.article_metrics(d1, d2)
+    assert df[["pagePath", "pageTitle", "screenPageViews", "userEngagementDuration"]].values.tolist() == [
+        [B[0], B[1], 10, 100],
+        [A[0], A[1], 8, 80],
+    ]
+    assert facts.article_metrics(d2, d2)["screenPageViews"].tolist() == [6, 2]
+    assert facts.traffic_by_source(d1, d2).values.tolist() == [["google", 11], ["naver", 7]]
+
+    daily = facts.article_daily(d1, d2, [A[0]]).sort_values("date")
+    assert daily[["date", "screenPageViews"]].values.tolist() == [[d1, 6], [d2, 2]]
+    sources = facts.article_sources(d1, d2, [A[0]]).sort_values("sessionSource")
+    assert sources[["sessionSource", "screenPageViews"]].values.tolist() == [["google", 7], ["naver", 1]]
+    assert facts.article_daily(d1, d2, []).empty
+
+
+def test_bounce_rate_is_recomputed_from_summed_sessions():
+    d1, d2 = day(10), day(9)
+    facts.write_day(d1, fact_rows([(*A, "google", 5, 50, 10, 6), (*B, "google", 1, 0, 0, 0)]), TOTALS)
+    facts.write_day(d2, fact_rows([(*A, "naver", 5, 50, 10, 9)]), TOTALS)
+
+    rates = facts.article_metrics(d1, d2).set_index("pagePath")["bounceRate"]
+    # 일별 이탈률 평균(0.25)이 아니라 세션 합계 기준: 1 - 15/20
+    assert rates[A[0]] == pytest.approx(0.25)
+    assert rates[B[0]] == 0  # 세션 0이면 0
+
+
+def test_weeks_are_final_only_after_fresh_days():
+    old, recent = day(facts.FRESH_DAYS + 20), day(facts.FRESH_DAYS + 3)
+    facts.write_weeks({old: (100, 300), recent: (50, 150)})
+
+    assert facts.missing_weeks([old, recent]) == [recent]
+    df = facts.weekly_totals(old, recent)
+    assert df[["week_start", "activeUsers", "screenPageViews", "final"]].values.tolist() == [
+        [old, 100, 300, 1],
+        [recent, 50, 150, 0],
+    ]
+
+
+def test_ensure_facts_refreshes_only_unsettled_days(monkeypatch):
+    import data
+
+    old, fresh = day(facts.FRESH_DAYS + 5), day(0)
+    facts.write_day(old, fact_rows([(*A, "google", 5, 50, 2, 1)]), TOTALS)
+    facts.write_day(fresh, fact_rows([(*A, "google", 1, 10, 1, 1)]), TOTALS)
+
+    extracted = []
+
+    def fake_report(start, end, dimensions, metrics, **kwargs):
+        days = facts.day_range(start, end)
+        return pd.DataFrame({"date": [d.replace("-", "") for d in days], "activeUsers": 3, "screenPageViews": 9, "newUsers": 1})
+
+    def fake_extract(d):
+        extracted.append(d)
+        return fact_rows([(*A, "google", 9, 90, 3, 2)])
+
+    monkeypatch.setattr(data, "run_ga4_report", fake_report)
+    monkeypatch.setattr(data, "extract_fact_day", fake_extract)
+
+    assert data.ensure_facts(old, fresh) == len(facts.day_range(old, fresh)) - 1
+    assert old not in extracted and fresh in extracted
+    assert facts.article_metrics(old, old)["screenPageViews"].tolist() == [5]
+    assert facts.article_metrics(fresh, fresh)["screenPageViews"].tolist() == [9]
+    assert facts.daily_totals(fresh, fresh)["screenPageViews"].tolist() == [9]
@@ -0,0 +1,54 @@
+# tests/test_normalize.py
+import numpy as np
+import pandas as pd
+import pytest
+
+import normalize
+from utils import clean_author_name
+
+# (입력, 기대값) - 기존 utils.clean_author_name 결과 그대로
+CASES = [
+    ("홍길동 기자", "홍길동"),
+    ("홍길동기자", "홍길동"),
+    ("#홍길동", "홍길동"),
+    ("  박민수  ", "박민수"),
+    ("편집인 홍길동", "홍길동"),
+    ("전문 김철수", "김철수"),
+    ("전문기자 김철수", "김철수"),
+    ("김철수 전문기자", "김철수"),
+    ("편집 이영희 기자", "이영희"),
+    ("이영희편집", "이영희"),
+    ("쿡앤셰프 편집인", "쿡앤셰프"),
+    ("기자", "미상"),
+    ("편집인", "미상"),
+    ("", "미상"),
+    (None, "미상"),
+    (0, "미상"),
+    (float("nan"), "nan"),  # 문자열 단위 API는 기존과 같이 'nan' (컬럼 API만 결측을 '미상'으로 처리)
+]
+
+
+@pytest.mark.parametrize("name, expected", CASES)
+def test_author_name_matches_previous_behaviour(name, expected):
+    assert normalize.author_name(name) == expected
+    assert clean_author_name(name) == expected
+
+
+def test_author_names_maps_unique_values_back_and_keeps_index():
+    values = pd.Series([name for name, _ in CASES if isinstance(name, str)] * 2, name="작성자")
+    values.index = values.index * 10
+    result = normalize.author_names(values)
+    assert result.index.equals(values.index)
+    assert result.name == "작성자"
+    assert result.tolist() == [normalize.author_name(v) for v in values]
+
+
+@pytest.mark.parametrize("missing", [None, np.nan, pd.NA])
+def test_author_names_missing_is_unknown(missing):
+    # 변경점: 기존 clean_author_name(NaN)은 'nan'이었으나 컬럼 API는 결측을 '미상'으로 통일
+    result = normalize.author_names(pd.Series(["홍길동 기자", missing, "홍길동기자"], dtype=object))
+    assert result.tolist() == ["홍길동", "미상", "홍길동"]
+
+
+def test_author_names_accepts_lists():
+    assert normalize.author_names(["편집인 홍길동", None]).tolist() == ["홍길동", "미상"]
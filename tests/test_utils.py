@@ -0,0 +1,49 @@
+# tests/test_utils.py
+import pytest
+
+import utils
+
+
+@pytest.mark.parametrize("period, end_date, expected", [
+    ("2026-01-04", "2026-01-10", ("2026-01-04 ~ 2026-01-10", "2026-01-04", "2026-01-10")),
+    ("2026-01-10", "2026-01-10", ("2026-01-10 ~ 2026-01-10", "2026-01-10", "2026-01-10")),
+    ("2026-01-07", None, ("2026년 1주차", "2026-01-04", "2026-01-10")),  # 일요일로 맞춤
+    ("2026-02", None, ("2026년 2월", "2026-02-01", "2026-02-28")),
+    ("2025-Q4", None, ("2025년 4분기", "2025-10-01", "2025-12-31")),
+])
+def test_resolve_period(period, end_date, expected):
+    assert utils.resolve_period(period, end_date) == expected
+
+
+@pytest.mark.parametrize("period, end_date, error", [
+    ("2026-01-10", "2026-01-04", ValueError),  # 시작일 > 종료일
+    ("2026-01-32", "2026-02-01", ValueError),
+    ("2026-01-04", "어제", ValueError),
+    ("2026-W01", None, KeyError),
+])
+def test_resolve_period_rejects_bad_input(period, end_date, error):
+    with pytest.raises(error):
+        utils.resolve_period(period, end_date)
+
+
+@pytest.mark.parametrize("query, status", [
+    ("start=2026-01-10&end=2026-01-04", 400),
+    ("start=2026-01-04&end=2026-13-01", 400),
+    ("period=2026-W01", 400),
+    ("start=2026-01-04&end=2026-01-10", None),
+    ("period=2026-02", None),
+    ("", None),  # 기간 없으면 이번 주
+])
+def test_period_from_request_rejects_bad_range(query, status):
+    from werkzeug.exceptions import HTTPException
+
+    import app_flask
+
+    app = app_flask.create_app()
+    with app.test_request_context(f"/dashboard?{query}"):
+        if status is None:
+            app_flask.period_from_request()
+            return
+        with pytest.raises(HTTPException) as e:
+            app_flask.period_from_request()
+    assert e.value.get_response().status_code == status
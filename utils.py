@@ -2,55 +2,168 @@
 import re
 from datetime import datetime, timedelta
 
-def clean_author_name(name):
-    """기자 이름에서 불필요한 직함 등을 제거 - 1어절만 남김"""
-    if not name: return "미상"
-    
-    # 기본 정리
-    name = str(name).replace('#', '').replace('전문기자', '').replace('기자', '').strip()
-    
-    # 직함 목록
-    titles = ['편집인', '전문', '편집', '기자']
-    
-    # 1단계: 공백으로 분리하여 단어별로 처리
-    words = name.split()
-    
-    # 2어절 이상이면 첫 번째 단어만 남김 (1어절만 유지)
-    if len(words) > 1:
-        # 첫 번째 단어가 직함이면 두 번째 단어 사용, 아니면 첫 번째 단어 사용
-        if words[0] in titles and len(words) > 1:
-            name = words[1]
-        else:
-            name = words[0]
-    elif len(words) == 1:
-        name = words[0]
-    else:
-        name = name
-    
-    # 2단계: 공백 없이 붙어있는 직함 제거 (정규표현식 사용)
-    for title in titles:
-        # "이름직함" 패턴 제거
-        name = re.sub(rf'{re.escape(title)}', '', name)
-        # "이름 직함" 패턴 제거 (공백 포함)
-        name = re.sub(rf'\s*{re.escape(title)}\s*', '', name)
-    
-    # 3단계: 정리 (여러 공백을 하나로, 앞뒤 공백 제거)
-    name = ' '.join(name.split()).strip()
-    
-    return name if name else "미상"
-
-def get_sunday_to_saturday_ranges(count=12):
-    """최근 주차(일~토) 계산"""
-    ranges = {}
-    today = datetime.now()
-    days_since_sunday = (today.weekday() + 1) % 7
-    last_sunday = today - timedelta(days=days_since_sunday)
-    for i in range(count):
-        start_date = last_sunday - timedelta(weeks=i)
-        end_date = start_date + timedelta(days=6)
-        label = f"{start_date.isocalendar()[1]}주차"
-        ranges[label] = f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
-    return ranges
-
-# 전역에서 사용할 주차 정보
-WEEK_MAP = get_sunday_to_saturday_ranges()
\ No newline at end of file
+from normalize import author_name
+
+# 기자 이름 정규화는 normalize 모듈 (컴파일된 패턴 + LRU, 컬럼 단위는 normalize.author_names)
+clean_author_name = author_name
+
+# -----------------------------------------------------------------------------
+# [기간 달력]
+# 모든 기간은 안정적인 키로 식별하고 호출 시점 기준으로 매번 계산한다
+# (장기 실행 프로세스에서도 자정 이후 최신 주차가 반영되고, 연도가 달라도 키가 겹치지 않음)
+#   - 주간: 일요일 시작일 'YYYY-MM-DD'
+#   - 월간: 'YYYY-MM'
+#   - 분기: 'YYYY-Qn'
+# -----------------------------------------------------------------------------
+def _to_date(d=None):
+    if d is None:
+        return datetime.now().date()
+    if isinstance(d, str):
+        return datetime.strptime(d, '%Y-%m-%d').date()
+    return d.date() if isinstance(d, datetime) else d
+
+def week_key(d=None):
+    """d가 속한 주(일~토)의 키 = 일요일 날짜"""
+    d = _to_date(d)
+    return (d - timedelta(days=(d.weekday() + 1) % 7)).strftime('%Y-%m-%d')
+
+def week_range(key):
+    start = _to_date(key)
+    return start.strftime('%Y-%m-%d'), (start + timedelta(days=6)).strftime('%Y-%m-%d')
+
+def week_label(key):
+    """화면 표시용 짧은 라벨 ("N주차", 시작 일요일의 ISO 주차 번호)"""
+    return f"{_to_date(key).isocalendar()[1]}주차"
+
+def week_title(key):
+    """연도를 포함한 라벨 ("2026년 41주차")"""
+    iso = _to_date(key).isocalendar()
+    return f"{iso[0]}년 {iso[1]}주차"
+
+def recent_weeks(count=12, until=None):
+    """until(기본 오늘)이 속한 주부터 과거로 count개 주 키 (최신순)"""
+    last = _to_date(week_key(until))
+    return [(last - timedelta(weeks=i)).strftime('%Y-%m-%d') for i in range(count)]
+
+def ga4_year_week(d):
+    """GA4 yearWeek 값 ('YYYYWW'): 주는 일요일 시작, 1월 1일은 항상 01주 (연초/연말 주는 7일 미만)"""
+    d = _to_date(d)
+    jan1 = d.replace(month=1, day=1)
+    offset = (jan1.weekday() + 1) % 7  # 1월 1일 이전 같은 주의 일수
+    return f"{d.year}{((d - jan1).days + offset) // 7 + 1:02d}"
+
+def ga4_week_span(year_week):
+    """GA4 yearWeek -> (시작일, 종료일) 'YYYY-MM-DD'. 연도 경계 주는 해당 연도 안의 날짜만 포함"""
+    year, week = int(str(year_week)[:4]), int(str(year_week)[4:])
+    jan1 = datetime(year, 1, 1).date()
+    offset = (jan1.weekday() + 1) % 7
+    start = max(jan1, jan1 + timedelta(days=7 * (week - 1) - offset))
+    end = min(datetime(year, 12, 31).date(), jan1 + timedelta(days=7 * week - offset - 1))
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+def month_range(key):
+    year, month = map(int, key.split('-'))
+    start = datetime(year, month, 1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+def month_title(key):
+    year, month = map(int, key.split('-'))
+    return f"{year}년 {month}월"
+
+def recent_months(count=12, until=None):
+    d = _to_date(until)
+    keys = []
+    year, month = d.year, d.month
+    for _ in range(count):
+        keys.append(f"{year}-{month:02d}")
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return keys
+
+def quarter_range(key):
+    year, q = int(key[:4]), int(key[-1])
+    start = datetime(year, 3 * q - 2, 1)
+    end = datetime(year + (q == 4), (3 * q) % 12 + 1, 1) - timedelta(days=1)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+def quarter_title(key):
+    return f"{key[:4]}년 {key[-1]}분기"
+
+def recent_quarters(count=8, until=None):
+    d = _to_date(until)
+    year, q = d.year, (d.month - 1) // 3 + 1
+    keys = []
+    for _ in range(count):
+        keys.append(f"{year}-Q{q}")
+        year, q = (year - 1, 4) if q == 1 else (year, q - 1)
+    return keys
+
+# 조회 단위별 (최근 키 목록, 키 -> 기간, 키 -> 라벨)
+PERIOD_KINDS = {
+    "주간": (recent_weeks, week_range, week_title),
+    "월간": (recent_months, month_range, month_title),
+    "분기": (recent_quarters, quarter_range, quarter_title),
+}
+
+def period_options(kind, count=None):
+    """선택 목록용 {키: 라벨} (최신순)"""
+    recent, _, title = PERIOD_KINDS[kind]
+    keys = recent(count) if count else recent()
+    return {k: title(k) for k in keys}
+
+def _period_kind(key):
+    if re.fullmatch(r'\d{4}-Q[1-4]', key):
+        return "분기"
+    if re.fullmatch(r'\d{4}-\d{2}', key):
+        return "월간"
+    if re.fullmatch(r'\d{4}-\d{2}-\d{2}', key):
+        return "주간"
+    raise KeyError(key)
+
+def resolve_period(period, end_date=None):
+    """기간 키 또는 시작일·종료일 -> (라벨, 시작일, 종료일). 알 수 없는 키는 KeyError, 잘못된 날짜(시작일 > 종료일 포함)는 ValueError
+
+    주간 키가 일요일이 아니면 해당 날짜가 속한 주로 맞춘다.
+    """
+    if end_date is not None:
+        if _to_date(period) > _to_date(end_date):
+            raise ValueError(f"시작일이 종료일보다 늦습니다: {period} > {end_date}")
+        return f"{period} ~ {end_date}", period, end_date
+    kind = _period_kind(str(period))
+    _, to_range, title = PERIOD_KINDS[kind]
+    if kind == "주간":
+        period = week_key(period)
+    s_dt, e_dt = to_range(period)
+    return title(period), s_dt, e_dt
+
+def period_labels(period, end_date=None):
+    """기간 키 또는 시작일·종료일 -> (조회 단위 '주간'/'월간'/'분기'/'기간', 'N일 간')
+
+    일수는 오늘까지만 센다 (진행 중인 주/월/분기).
+    """
+    _, s_dt, e_dt = resolve_period(period, end_date)
+    try:
+        kind = _period_kind(str(period)) if end_date is None else "기간"
+    except KeyError:
+        kind = "기간"
+    e_dt = min(e_dt, datetime.now().strftime('%Y-%m-%d'))
+    days = max(1, (datetime.strptime(e_dt, '%Y-%m-%d') - datetime.strptime(s_dt, '%Y-%m-%d')).days + 1)
+    return kind, f"{days}일 간"
+
+def format_range(start_date, end_date):
+    """'2026-01-04', '2026-01-10' -> '2026.01.04 ~ 2026.01.10'"""
+    return f"{start_date.replace('-', '.')} ~ {end_date.replace('-', '.')}"
+
+def previous_period(start_date, end_date):
+    """비교 기간: 달력 월/분기 전체면 직전 월/분기, 그 외에는 직전 동일 일수 기간"""
+    s = datetime.strptime(start_date, '%Y-%m-%d')
+    e = datetime.strptime(end_date, '%Y-%m-%d')
+    if s.day == 1 and (e + timedelta(days=1)).day == 1:
+        n_months = (e.year - s.year) * 12 + e.month - s.month + 1
+        if n_months in (1, 3):
+            ps = s
+            for _ in range(n_months):
+                ps = (ps - timedelta(days=1)).replace(day=1)
+            return ps.strftime('%Y-%m-%d'), (s - timedelta(days=1)).strftime('%Y-%m-%d')
+    days = (e - s).days + 1
+    return (s - timedelta(days=days)).strftime('%Y-%m-%d'), (e - timedelta(days=days)).strftime('%Y-%m-%d')
\ No newline at end of file
@@ -4,14 +4,13 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-import re
 
 # 모듈 임포트
 import config
+import sites
 from config import COLOR_NAVY, COLOR_RED, COLOR_GREY, CHART_PALETTE, COLOR_GENDER
-from utils import WEEK_MAP
-from datetime import datetime, timedelta
-import data
+from normalize import author_names
+from utils import period_labels, previous_period, resolve_period
 
 # ----------------- 차트 생성 헬퍼 함수 -----------------
 def create_donut_chart_with_val(df, names, values, color_map=None, height=350, margin=None, rotation=90, show_legend=False, limit_labels=None):
@@ -64,15 +63,20 @@ def create_donut_chart_with_val(df, names, values, color_map=None, height=350, m
     return fig
 
 # ----------------- 1. 성과 요약 -----------------
-def render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count=0):
-    st.markdown('<div class="section-header-container first-section"><div class="section-header">1. 주간 전체 성과 요약</div></div>', unsafe_allow_html=True)
+def render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily, active_article_count, published_article_count=0, period=None):
+    # 제목/KPI 라벨은 조회 기간 기준 (period: 주차/월/분기 키 또는 (시작일, 종료일))
+    try:
+        kind, span = period_labels(*period) if isinstance(period, tuple) else period_labels(period)
+    except (KeyError, ValueError, TypeError):
+        kind, span = "주간", "지난 7일 간"
+    st.markdown(f'<div class="section-header-container first-section"><div class="section-header">1. {kind} 전체 성과 요약</div></div>', unsafe_allow_html=True)
     pv_per_user = round(cur_pv/cur_uv, 1) if cur_uv > 0 else 0
     
     kpis = [
         ("활성 기사 수", active_article_count, "건"),
         ("발행 기사 수", published_article_count, "건"),
-        ("지난 7일 간<br>조회수(PV)", cur_pv, "건"),
-        ("지난 7일 간<br>방문자수(UV)", cur_uv, "명"), 
+        (f"{span}<br>조회수(PV)", cur_pv, "건"),
+        (f"{span}<br>방문자수(UV)", cur_uv, "명"), 
         ("방문자당 페이지뷰", pv_per_user, "건"),
         ("신규 방문자 비율", new_ratio, "%"),
         ("검색 유입 비율", search_ratio, "%")
@@ -87,34 +91,19 @@ def render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily,
     with c1:
         st.markdown('<div class="sub-header">📊 주간 일별 방문 추이</div>', unsafe_allow_html=True)
         if not df_daily.empty:
-            df_melted = df_daily.melt(id_vars='날짜')
+            df_melted = df_daily.melt(id_vars='날짜', value_vars=['UV', 'PV'])
             fig = px.bar(df_melted, x='날짜', y='value', color='variable', barmode='group', color_discrete_map={'UV': COLOR_GREY, 'PV': COLOR_NAVY}, text='value')
             fig.update_traces(texttemplate='%{text:,}', textposition='outside')
             fig.update_xaxes(type='category')
+            if '이상' in df_daily.columns:
+                for _, r in df_daily[df_daily['이상'] != ''].iterrows():
+                    fig.add_annotation(x=r['날짜'], y=r['PV'], text=r['이상'], showarrow=False, yshift=28, font=dict(color=COLOR_RED, size=11))
             fig.update_layout(legend_title_text=None, legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
             st.plotly_chart(fig, use_container_width=True, key="summary_daily_chart")
     with c2:
-        st.markdown('<div class="sub-header">📈 최근 3달 간 추이 분석</div>', unsafe_allow_html=True)
-        if not df_weekly.empty:
-            fig2 = go.Figure()
-            fig2.add_trace(go.Bar(x=df_weekly['주차'], y=df_weekly['UV'], name='UV', marker_color=COLOR_GREY))
-            fig2.add_trace(go.Bar(x=df_weekly['주차'], y=df_weekly['PV'], name='PV', marker_color=COLOR_NAVY))
-            
-            week_labels = df_weekly['주차'].tolist()
-            year_boundary_idx = None
-            for i, label in enumerate(week_labels):
-                week_num = int(re.search(r'\d+', str(label)).group()) if re.search(r'\d+', str(label)) else 0
-                if week_num == 1 and i > 0:
-                    prev_week_num = int(re.search(r'\d+', str(week_labels[i-1])).group()) if re.search(r'\d+', str(week_labels[i-1])) else 0
-                    if prev_week_num == 52:
-                        year_boundary_idx = i - 0.5
-                        break
-            
-            if year_boundary_idx is not None:
-                fig2.add_vline(x=year_boundary_idx, line_dash="dot", line_width=1, line_color="#78909c", opacity=0.7, annotation_text="2025/2026", annotation_position="top", annotation_font_size=10, annotation_font_color="#78909c")
-            
-            fig2.update_layout(barmode='group', plot_bgcolor='white', margin=dict(t=30), yaxis=dict(tickformat=","), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
-            st.plotly_chart(fig2, use_container_width=True, key="summary_weekly_chart")
+        render_weekly_trend(df_weekly)
+
+    render_anomaly_notes(df_daily, df_weekly)
     
     # 산식 각주
     st.markdown("""
@@ -127,7 +116,128 @@ def render_summary(df_weekly, cur_pv, cur_uv, new_ratio, search_ratio, df_daily,
     • 방문자당 페이지뷰: PV ÷ UV<br>
     • 신규 방문자 비율: (신규 방문자 수 ÷ 전체 방문자 수) × 100<br>
     &nbsp;&nbsp;&nbsp;&nbsp;※ 신규 방문자 수: GA4 newUsers (해당 기간 동안 처음 방문한 사용자 수)<br>
-    • 검색 유입 비율: (검색엔진 유입 조회수 ÷ 전체 조회수) × 100
+    • 검색 유입 비율: (검색엔진 유입 조회수 ÷ 전체 조회수) × 100<br>
+    • 이상 징후: 일별은 같은 요일 최근 4주, 주간은 직전 8주의 중앙값/MAD 대비 robust z가 ±3.5 이상 (집계가 확정되지 않은 최근 2일과 진행 중인 주는 제외)
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_weekly_trend(df_weekly):
+    """주간 UV/PV 추이 (12/52/104주 선택, 전년 동주 겹쳐보기)"""
+    horizons = {"최근 3달": 12, "최근 1년": 52, "최근 2년": 104}
+    h1, h2 = st.columns([3, 1])
+    with h2:
+        horizon = st.selectbox("추이 기간", list(horizons.keys()), key="summary_trend_horizon", label_visibility="collapsed")
+        show_yoy = st.checkbox("전년 동기 비교", key="summary_trend_yoy")
+    with h1:
+        st.markdown(f'<div class="sub-header">📈 {horizon} 간 추이 분석</div>', unsafe_allow_html=True)
+    if df_weekly.empty:
+        return
+
+    df_w = df_weekly.tail(horizons[horizon])
+    fig2 = go.Figure()
+    if 'week_start' in df_w.columns:
+        # 주 시작일(날짜) 축: 연도가 달라도 같은 "N주차"가 겹치지 않음
+        x = pd.to_datetime(df_w['week_start'])
+        hover = df_w['주차'] + ' (' + df_w['week_start'] + ')'
+        fig2.add_trace(go.Bar(x=x, y=df_w['UV'], name='UV', marker_color=COLOR_GREY, hovertext=hover))
+        fig2.add_trace(go.Bar(x=x, y=df_w['PV'], name='PV', marker_color=COLOR_NAVY, hovertext=hover))
+        if show_yoy and 'PV_전년' in df_w.columns:
+            fig2.add_trace(go.Scatter(x=x, y=df_w['UV_전년'], name='UV (전년)', mode='lines', line=dict(color=COLOR_GREY, dash='dot')))
+            fig2.add_trace(go.Scatter(x=x, y=df_w['PV_전년'], name='PV (전년)', mode='lines', line=dict(color=COLOR_RED, dash='dot')))
+        # 연도 경계 표시
+        for year in sorted(x.dt.year.unique())[1:]:
+            fig2.add_vline(x=pd.Timestamp(year=int(year), month=1, day=1).timestamp() * 1000, line_dash="dot", line_width=1, line_color=COLOR_GREY, opacity=0.7,
+                           annotation_text=str(year), annotation_position="top", annotation_font_size=10, annotation_font_color=COLOR_GREY)
+        fig2.update_xaxes(tickformat="%y.%m.%d")
+    else:
+        fig2.add_trace(go.Bar(x=df_w['주차'], y=df_w['UV'], name='UV', marker_color=COLOR_GREY))
+        fig2.add_trace(go.Bar(x=df_w['주차'], y=df_w['PV'], name='PV', marker_color=COLOR_NAVY))
+
+    if '이상' in df_w.columns and 'week_start' in df_w.columns:
+        df_flag = df_w[df_w['이상'] != '']
+        if not df_flag.empty:
+            fig2.add_trace(go.Scatter(x=pd.to_datetime(df_flag['week_start']), y=df_flag[['UV', 'PV']].max(axis=1), name='이상 주간', mode='markers',
+                                      marker=dict(color=COLOR_RED, size=9, symbol='diamond'), hovertext=df_flag['주차'] + ' ' + df_flag['이상']))
+
+    fig2.update_layout(barmode='group', plot_bgcolor='white', margin=dict(t=30), yaxis=dict(tickformat=","), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    st.plotly_chart(fig2, use_container_width=True, key="summary_weekly_chart")
+
+def render_anomaly_notes(df_daily, df_weekly):
+    """선택 기간의 이상 일자와 최근 주간 이상 표시 (anomaly 모듈 결과)"""
+    notes = []
+    if '이상' in df_daily.columns:
+        for _, r in df_daily[df_daily['이상'] != ''].iterrows():
+            notes.append(f"{r['날짜']} PV {r['PV']:,} {r['이상']} (같은 요일 4주 기준 z={r['PV_z']:+.1f})")
+    if '이상' in df_weekly.columns and not df_weekly.empty:
+        last = df_weekly.iloc[-1]
+        if last['이상']:
+            notes.append(f"{last['주차']} 주간 {last['이상']} (직전 8주 기준 UV z={last['UV_z']:+.1f}, PV z={last['PV_z']:+.1f})")
+    if notes:
+        st.warning("⚠️ 이상 징후: " + " / ".join(notes))
+
+# ----------------- 그룹 현황 -----------------
+def render_group_overview(df_overview):
+    st.markdown('<div class="section-header-container first-section"><div class="section-header">그룹 사이트 성과 현황</div></div>', unsafe_allow_html=True)
+    if df_overview.empty:
+        st.info("사이트 데이터가 없습니다.")
+        return
+    df_disp = df_overview.copy()
+    for col in ['UV', 'PV', '활성 기사 수', '발행 기사 수']:
+        df_disp[col] = df_disp[col].apply(lambda v: f"{int(v):,}" if pd.notna(v) else "-")
+    for col in ['신규 방문자 비율', '검색 유입 비율']:
+        df_disp[col] = df_disp[col].apply(lambda v: f"{v}%" if pd.notna(v) else "-")
+    st.dataframe(df_disp, use_container_width=True, hide_index=True, height="content")
+
+    df_sites = df_overview[df_overview['사이트'] != '그룹 합계']
+    df_melted = df_sites.melt(id_vars='사이트', value_vars=['UV', 'PV'])
+    fig = px.bar(df_melted, x='사이트', y='value', color='variable', barmode='group', text='value',
+                 color_discrete_map={'UV': COLOR_GREY, 'PV': COLOR_NAVY})
+    fig.update_traces(texttemplate='%{text:,}', textposition='outside')
+    fig.update_layout(plot_bgcolor='white', legend_title_text=None, yaxis=dict(tickformat=","), xaxis_title=None, yaxis_title=None)
+    st.plotly_chart(fig, use_container_width=True, key="group_overview_chart")
+    st.markdown("""
+    <div style='font-size: 0.85rem; color: #78909c; margin-top: 20px; padding-top: 10px; border-top: 1px solid #e0e0e0;'>
+    • 그룹 합계 UV: 사이트별 UV 단순 합계 (사이트 간 중복 방문자 포함)
+    </div>
+    """, unsafe_allow_html=True)
+
+# ----------------- 실시간 -----------------
+def render_live(snap):
+    """실시간 모드: 오늘 누적 KPI, 최근 60분 분별 조회수, 오늘 인기 기사 (live.LiveWindow.snapshot)"""
+    st.markdown('<div class="section-header-container first-section"><div class="section-header">실시간 오늘 현황</div></div>', unsafe_allow_html=True)
+    kpis = [
+        ("오늘 누적<br>조회수(PV)", f"{snap['today_pv']:,}", "건"),
+        ("최근 30분<br>활성 사용자", f"{snap['active_users_30m']:,}", "명"),
+        ("마지막 갱신", (snap['updated_at'] or "-")[11:16], ""),
+    ]
+    cols = st.columns(len(kpis))
+    for i, (l, v, u) in enumerate(kpis):
+        cols[i].markdown(f'<div class="kpi-container"><div class="kpi-label">{l}</div><div class="kpi-value">{v}<span class="kpi-unit">{u}</span></div></div>', unsafe_allow_html=True)
+
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown('<div class="sub-header">⏱️ 최근 60분 분별 조회수</div>', unsafe_allow_html=True)
+        df_m = snap['df_minutes']
+        fig = px.bar(df_m, x='시각', y='조회수', color_discrete_sequence=[COLOR_NAVY])
+        fig.update_layout(plot_bgcolor='white', xaxis_title=None, yaxis_title=None, yaxis=dict(tickformat=","), margin=dict(t=10))
+        fig.update_xaxes(tickformat="%H:%M")
+        st.plotly_chart(fig, use_container_width=True, key="live_minutes_chart")
+    with c2:
+        st.markdown('<div class="sub-header">🔥 오늘 인기 기사 TOP 10</div>', unsafe_allow_html=True)
+        df_top = snap['df_top'].copy()
+        df_top.insert(0, '순위', range(1, len(df_top) + 1))
+        df_top['조회수'] = df_top['조회수'].apply(lambda v: f"{int(v):,}")
+        st.dataframe(df_top, use_container_width=True, hide_index=True, height="content")
+
+    # runReport 집계 지연으로 기준값에도 실시간 분 버킷에도 없는 구간
+    gap_note = ""
+    if snap.get('gap_minutes'):
+        gap_note = f"<span style='color: {COLOR_RED};'>⚠️ GA4 집계 지연: {snap['processed_until'][11:16]}~{snap['baseline_until'][11:16]} ({snap['gap_minutes']:,}분) 조회수는 아직 포함되지 않음</span><br>"
+    st.markdown(f"""
+    <div style='font-size: 0.85rem; color: #78909c; margin-top: 20px; padding-top: 10px; border-top: 1px solid #e0e0e0;'>
+    {gap_note}• 오늘 누적 조회수: {snap['baseline_until'] or '-'}까지 GA4 집계 + 이후 GA4 실시간 분별 조회수<br>
+    • 활성 사용자: GA4 실시간 activeUsers (최근 30분)<br>
+    • 인기 기사: 페이지 제목(unifiedScreenName) 기준, 브랜드 페이지 제외
     </div>
     """, unsafe_allow_html=True)
 
@@ -151,8 +261,9 @@ def render_traffic(df_traffic_curr, df_traffic_last):
     df_m['비중 변화'] = (df_m['이번주 비중'] - df_m['지난주 비중']).round(1)
     
     df_m.sort_values('이번주 비중', ascending=False, inplace=True)
+    cols = ['유입경로', '이번주 비중', '지난주 비중', '비중 변화'] + (['이상'] if '이상' in df_m.columns else [])
     
-    st.dataframe(df_m[['유입경로', '이번주 비중', '지난주 비중', '비중 변화']].copy().assign(**{'비중 변화': lambda x: x['비중 변화'].apply(lambda v: f"{v:+.1f}%p")}), use_container_width=True, hide_index=True, height="content")
+    st.dataframe(df_m[cols].copy().assign(**{'비중 변화': lambda x: x['비중 변화'].apply(lambda v: f"{v:+.1f}%p")}), use_container_width=True, hide_index=True, height="content")
     
     # 산식 각주
     st.markdown("""
@@ -160,7 +271,8 @@ def render_traffic(df_traffic_curr, df_traffic_last):
     <strong>산식:</strong><br>
     • 유입경로별 조회수: GA4 sessionSource별 screenPageViews 합계<br>
     • 비중: (해당 유입경로 조회수 ÷ 전체 조회수) × 100<br>
-    • 비중 변화: 이번주 비중 - 지난주 비중 (%p)
+    • 비중 변화: 이번주 비중 - 지난주 비중 (%p)<br>
+    • 이상: 유입경로별 일별 조회수를 같은 요일 최근 4주 중앙값/MAD와 비교한 robust z를 기간 합산, |z| ≥ 3.5
     </div>
     """, unsafe_allow_html=True)
 
@@ -268,7 +380,6 @@ def render_demo_age_gender(df_age_curr, df_age_last, df_gender_curr, df_gender_l
 def render_top10_detail(df_top10):
     st.markdown('<div class="section-header-container"><div class="section-header">4. 최근 7일 조회수 TOP 10 기사 상세</div></div>', unsafe_allow_html=True)
     if not df_top10.empty:
-        from utils import clean_author_name
         df_p4 = df_top10.copy()
         def safe_format_int(x):
             try: return f"{int(float(x)):,}"
@@ -277,9 +388,8 @@ def render_top10_detail(df_top10):
             df_p4[c] = df_p4[c].apply(safe_format_int)
         # 작성자에서 직함 제거 (1어절만 남김)
         if '작성자' in df_p4.columns:
-            df_p4['작성자'] = df_p4['작성자'].apply(clean_author_name)
-        df_p4_display = df_p4.copy()
-        df_p4_display = df_p4_display.rename(columns={
+            df_p4['작성자'] = author_names(df_p4['작성자'])
+        df_p4_display = df_p4.rename(columns={
             '전체조회수': '최근 7일간 조회수',
             '전체방문자수': '최근 7일간 방문자수',
             '체류시간_fmt': '체류시간',
@@ -301,11 +411,10 @@ def render_top10_detail(df_top10):
     """, unsafe_allow_html=True)
 
 # ----------------- 5. Top 10 추이 -----------------
-def render_top10_trends(df_top10, df_top10_sources=None):
+def render_top10_trends(df_top10, df_top10_sources=None, df_top10_daily=None):
     st.markdown('<div class="section-header-container"><div class="section-header">5. TOP 10 기사 유입경로(매체)별 조회수 분포</div></div>', unsafe_allow_html=True)
     
     if not df_top10.empty:
-        from utils import clean_author_name
         df_p5 = df_top10.copy()
         def safe_format_int_col(x):
             try:
@@ -315,7 +424,7 @@ def render_top10_trends(df_top10, df_top10_sources=None):
         
         # 작성자에서 직함 제거 (1어절만 남김)
         if '작성자' in df_p5.columns:
-            df_p5['작성자'] = df_p5['작성자'].apply(clean_author_name)
+            df_p5['작성자'] = author_names(df_p5['작성자'])
         
         df_p5['전체조회수_fmt'] = df_p5['전체조회수'].apply(safe_format_int_col)
         df_p5 = df_p5.rename(columns={'전체조회수_fmt': '지난 7일간 조회수'})
@@ -361,87 +470,67 @@ def render_top10_trends(df_top10, df_top10_sources=None):
             st.plotly_chart(fig, use_container_width=True, key="top10_source_distribution_chart")
         else:
             st.warning("기사별 유입경로 상세 데이터가 없습니다.")
+
+        if df_top10_daily is not None and not df_top10_daily.empty:
+            render_top10_daily_curves(df_top10, df_top10_daily)
     
     # 산식 각주
     st.markdown("""
     <div style='font-size: 0.85rem; color: #78909c; margin-top: 20px; padding-top: 10px; border-top: 1px solid #e0e0e0;'>
     <strong>산식:</strong><br>
     • 유입경로별 조회수: GA4 sessionSource별 screenPageViews 합계<br>
+    • 일별 조회 곡선: 기사별 날짜별 screenPageViews (조회가 없는 날은 0)<br>
     • 유입경로 1순위: 해당 기사에 가장 많이 유입된 경로<br>
     • 조회수 분포: 기사별 유입경로(매체)별 조회수 비중
     </div>
     """, unsafe_allow_html=True)
 
+def render_top10_daily_curves(df_top10, df_top10_daily):
+    """TOP 10 기사별 일별 조회수 곡선 (스몰 멀티플, 기사별 y축 독립)"""
+    order = df_top10[['순위', '경로', '제목']].drop_duplicates('경로')
+    df_d = df_top10_daily.merge(order, left_on='pagePath', right_on='경로', how='inner')
+    if df_d.empty:
+        return
+    df_d['기사'] = df_d['순위'].astype(str) + '. ' + df_d['제목'].apply(lambda x: x[:12] + '...' if len(str(x)) > 12 else str(x))
+    df_d['날짜'] = pd.to_datetime(df_d['date'])
+    panels = (order['순위'].astype(str) + '. ' + order['제목'].apply(lambda x: x[:12] + '...' if len(str(x)) > 12 else str(x))).tolist()
+
+    fig = px.line(
+        df_d.sort_values('날짜'), x='날짜', y='screenPageViews', facet_col='기사', facet_col_wrap=5,
+        category_orders={'기사': panels}, markers=True, color_discrete_sequence=[COLOR_NAVY],
+        title='기사별 일별 조회수 추이', hover_data={'제목': True, '기사': False}
+    )
+    fig.update_yaxes(matches=None, showticklabels=True, tickformat=",", title_text=None)
+    fig.update_xaxes(tickformat="%m-%d", title_text=None)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=', 1)[-1], font_size=11))
+    fig.update_layout(plot_bgcolor='white', height=480, margin=dict(t=70), showlegend=False)
+    st.plotly_chart(fig, use_container_width=True, key="top10_daily_curves_chart")
+
 # ----------------- 6. 카테고리 -----------------
-def render_category(df_top10, selected_week=None):
+def render_category(df_top10, period=None):
     st.markdown('<div class="section-header-container"><div class="section-header">6. 카테고리별 분석</div></div>', unsafe_allow_html=True)
     if not df_top10.empty:
         df_real = df_top10
         
-        # 전주 데이터 가져오기
-        if selected_week and selected_week in WEEK_MAP:
-            dr = WEEK_MAP[selected_week]
-            s_dt = dr.split(' ~ ')[0].replace('.', '-')
-            e_dt = dr.split(' ~ ')[1].replace('.', '-')
-            ls_dt = (datetime.strptime(s_dt, '%Y-%m-%d')-timedelta(days=7)).strftime('%Y-%m-%d')
-            le_dt = (datetime.strptime(e_dt, '%Y-%m-%d')-timedelta(days=7)).strftime('%Y-%m-%d')
-            
-            # 전주 발행 기사 목록 페이지 크롤링
-            from data import crawl_article_list_page, crawl_single_article_cached
-            import concurrent.futures
-            
-            published_articles_last_week = []
-            for page_num in range(1, 6):  # 최대 5페이지만 확인 (성능 고려)
-                articles = crawl_article_list_page(page_num)
-                if not articles:
-                    break
-                for article in articles:
-                    pub_date_str = article.get('published_date', '-')
-                    if pub_date_str == '-':
-                        continue
-                    try:
-                        date_part = pub_date_str.split()[0] if ' ' in pub_date_str else pub_date_str
-                        if '.' in date_part:
-                            date_part = date_part.replace('.', '-')
-                        pub_date = datetime.strptime(date_part, '%Y-%m-%d').date()
-                        ls_dt_date = datetime.strptime(ls_dt, '%Y-%m-%d').date()
-                        le_dt_date = datetime.strptime(le_dt, '%Y-%m-%d').date()
-                        if ls_dt_date <= pub_date <= le_dt_date:
-                            published_articles_last_week.append(article)
-                        elif pub_date < ls_dt_date:
-                            break  # 더 오래된 기사는 중단
-                    except:
-                        continue
-            
-            # 전주 발행 기사의 카테고리 정보 크롤링
-            cat_main_last_dict = {}
-            cat_sub_last_dict = {}
-            scraped_last_week = {}
-            if published_articles_last_week:
-                last_week_paths = [a['path'] for a in published_articles_last_week[:50]]  # 최대 50개만 (성능 고려)
-                with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = {executor.submit(crawl_single_article_cached, path): path for path in last_week_paths}
-                    for future in concurrent.futures.as_completed(futures):
-                        path = futures[future]
-                        try:
-                            result = future.result(timeout=3.0)
-                            scraped_last_week[path] = result
-                        except:
-                            scraped_last_week[path] = ("관리자", 0, 0, "뉴스", "이슈", "-")
-                
-                # 카테고리별 기사 수 집계
-                for path, result in scraped_last_week.items():
-                    cat = result[3] if len(result) > 3 else "뉴스"
-                    subcat = result[4] if len(result) > 4 else "이슈"
-                    cat_main_last_dict[cat] = cat_main_last_dict.get(cat, 0) + 1
-                    key = (cat, subcat)
-                    cat_sub_last_dict[key] = cat_sub_last_dict.get(key, 0) + 1
-        else:
-            cat_main_last_dict = {}
-            cat_sub_last_dict = {}
-        
-        # 메인 카테고리
-        cat_main = df_real.groupby('카테고리').agg(기사수=('제목','count'), 전체조회수=('전체조회수','sum')).reset_index()
+        # 전주(비교 기간) 카테고리별 기사 수 - period: 주차/월/분기 라벨 또는 (시작일, 종료일)
+        # 발행 기사 확인은 data.load_category_counts(캐시, 기간과 관계없이 상한 고정)에서 처리
+        cat_main_last_dict = {}
+        cat_sub_last_dict = {}
+        try:
+            _, s_dt, e_dt = resolve_period(*period) if isinstance(period, tuple) else resolve_period(period)
+            ls_dt, le_dt = previous_period(s_dt, e_dt)
+        except (KeyError, ValueError, TypeError):
+            period = None
+        if period:
+            from data import load_category_counts
+            df_last = load_category_counts(ls_dt, le_dt, sites.current())
+            for cat, subcat, count in df_last[['카테고리', '세부카테고리', '기사수']].itertuples(index=False, name=None):
+                cat_main_last_dict[cat] = cat_main_last_dict.get(cat, 0) + int(count)
+                cat_sub_last_dict[(cat, subcat)] = int(count)
+        
+        # 메인 카테고리 (이상: 다른 카테고리 대비 기사 1건당 조회수)
+        from data import category_stats
+        cat_main = category_stats(df_real, ['카테고리'])
         total_main = cat_main['기사수'].sum()
         cat_main['기사수_num'] = cat_main['기사수']
         
@@ -480,11 +569,11 @@ def render_category(df_top10, selected_week=None):
                               yaxis=dict(range=[0, max_value * 1.2] if max_value > 0 else [0, 10]),
                               legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
         st.plotly_chart(fig_main, use_container_width=True, key="category_main_chart")
-        st.dataframe(cat_main[['카테고리', '기사수', '전체조회수', '평균조회수']], use_container_width=True, hide_index=True, height="content")
+        st.dataframe(cat_main[['카테고리', '기사수', '전체조회수', '평균조회수', '이상']], use_container_width=True, hide_index=True, height="content")
 
         # 세부 카테고리
         st.markdown('<div class="chart-header">세부 카테고리별 기사 수</div>', unsafe_allow_html=True)
-        cat_sub = df_real.groupby(['카테고리', '세부카테고리']).agg(기사수=('제목','count'), 전체조회수=('전체조회수','sum')).reset_index()
+        cat_sub = category_stats(df_real, ['카테고리', '세부카테고리'])
         total_sub = cat_sub['기사수'].sum()
         cat_sub['기사수_num'] = cat_sub['기사수']
         
@@ -537,7 +626,7 @@ def render_category(df_top10, selected_week=None):
                              yaxis=dict(range=[0, max_value_sub * 1.2] if max_value_sub > 0 else [0, 10]),
                              legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
         st.plotly_chart(fig_sub, use_container_width=True, key="category_sub_chart")
-        st.dataframe(cat_sub[['카테고리', '세부카테고리', '기사수', '전체조회수', '평균조회수']], use_container_width=True, hide_index=True, height="content")
+        st.dataframe(cat_sub[['카테고리', '세부카테고리', '기사수', '전체조회수', '평균조회수', '이상']], use_container_width=True, hide_index=True, height="content")
     
     # 산식 각주
     st.markdown("""
@@ -546,59 +635,36 @@ def render_category(df_top10, selected_week=None):
     • 기사 수: 카테고리별 기사 수 (비중% 포함)<br>
     • 전체조회수: 카테고리별 기사 조회수 합계<br>
     • 평균조회수: 카테고리 전체 조회수 ÷ 카테고리 기사 수<br>
-    • 비중: (카테고리 기사 수 ÷ 전체 기사 수) × 100
+    • 비중: (카테고리 기사 수 ÷ 전체 기사 수) × 100<br>
+    • 이상: 다른 카테고리 대비 평균조회수(로그 스케일)의 robust z가 ±3.5 이상
     </div>
     """, unsafe_allow_html=True)
 
 # ----------------- 7. 기자 (통합) -----------------
-def render_writer_integrated(writers_df, df_all_articles_with_metadata):
+def format_writer_table(df, key_cols):
+    """기자별 집계 표 -> 화면 표시용 (숫자 + 점유율 문자열)"""
+    def with_share(col):
+        return df[col].map('{:,}'.format) + ' (' + df[f'{col}_비율'].map('{:.1f}'.format) + '%)'
+    disp = df[['순위'] + key_cols + ['기사수']].assign(
+        총조회수_포맷=with_share('총조회수'),
+        평균조회수_포맷=with_share('평균조회수'),
+        좋아요_포맷=df['좋아요'].map('{:,}'.format),
+        댓글_포맷=df['댓글'].map('{:,}'.format),
+        이상=df['이상'],
+    )
+    disp.columns = ['순위'] + key_cols + ['발행기사 수', '전체 조회수', '기사 1건당 조회수', '좋아요 개수', '댓글 개수', '이상']
+    return disp
+
+def render_writer_integrated(writer_stats):
+    """writer_stats: data.compute_writer_stats 결과 (보고서와 함께 캐시된 본명/필명 기준 표)"""
     st.markdown('<div class="section-header-container"><div class="section-header">7. 이번주 기자별 분석</div></div>', unsafe_allow_html=True)
     
-    if not df_all_articles_with_metadata.empty and '작성자' in df_all_articles_with_metadata.columns:
+    if not writer_stats.by_real.empty:
         # 본명 기준: 본명별 합산
-        from data import AUTHOR_MAPPING_DATA
-        from utils import clean_author_name
-        pen_to_real_map = {item['필명']: item['본명'] for item in AUTHOR_MAPPING_DATA}
-        
-        df_work = df_all_articles_with_metadata.copy()
-        # 작성자 이름에서 직함 제거 (한 번 더 정리)
-        df_work['작성자'] = df_work['작성자'].apply(clean_author_name)
-        df_work['본명'] = df_work['작성자'].map(pen_to_real_map).fillna(df_work['작성자'])
-        
-        # 본명 기준 집계
-        writers_by_real = df_work.groupby('본명').agg(
-            기사수=('제목','count'), 
-            총조회수=('전체조회수','sum'),
-            좋아요=('좋아요', 'sum'),
-            댓글=('댓글', 'sum')
-        ).reset_index()
-        writers_by_real = writers_by_real.sort_values('총조회수', ascending=False)
-        writers_by_real['순위'] = range(1, len(writers_by_real)+1)
-        writers_by_real['평균조회수'] = (writers_by_real['총조회수']/writers_by_real['기사수']).astype(int)
-        
-        # 비율 계산 (각 지표 중에서의 점유율)
-        total_views = writers_by_real['총조회수'].sum()
-        total_avg_views = writers_by_real['평균조회수'].sum()  # 평균 조회수 합계 (점유율 계산용)
-        
         st.markdown('<div class="sub-header">본명 기준(전체 조회수 기준)</div>', unsafe_allow_html=True)
         st.markdown('<div style="font-size: 0.75rem; color: #78909c; margin-bottom: 5px;">(건, %)</div>', unsafe_allow_html=True)
         
-        disp_w = writers_by_real.copy()
-        # 비율 계산 및 포맷팅 (각 지표 중에서의 점유율)
-        disp_w['총조회수_비율'] = (disp_w['총조회수'] / total_views * 100).round(1) if total_views > 0 else 0
-        disp_w['평균조회수_비율'] = (disp_w['평균조회수'] / total_avg_views * 100).round(1) if total_avg_views > 0 else 0
-        
-        # 포맷팅: 숫자 + 비율
-        disp_w['총조회수_포맷'] = disp_w.apply(lambda x: f"{x['총조회수']:,} ({x['총조회수_비율']:.1f}%)", axis=1)
-        disp_w['평균조회수_포맷'] = disp_w.apply(lambda x: f"{x['평균조회수']:,} ({x['평균조회수_비율']:.1f}%)", axis=1)
-        disp_w['좋아요_포맷'] = disp_w['좋아요'].apply(lambda x: f"{x:,}")
-        disp_w['댓글_포맷'] = disp_w['댓글'].apply(lambda x: f"{x:,}")
-        
-        # 본명에서 직함 제거 (1어절만 남김)
-        disp_w['본명'] = disp_w['본명'].apply(clean_author_name)
-        
-        disp_w = disp_w[['순위', '본명', '기사수', '총조회수_포맷', '평균조회수_포맷', '좋아요_포맷', '댓글_포맷']]
-        disp_w.columns = ['순위', '본명', '발행기사 수', '전체 조회수', '기사 1건당 조회수', '좋아요 개수', '댓글 개수']
+        disp_w = format_writer_table(writer_stats.by_real, ['본명'])
         
         st.dataframe(
             disp_w, 
@@ -618,53 +684,12 @@ def render_writer_integrated(writers_df, df_all_articles_with_metadata):
         
         st.markdown("<br>", unsafe_allow_html=True)
         
-        # 필명 기준: 필명별 합산 (모든 필명 포함)
-        df_work_pen = df_all_articles_with_metadata.copy()
-        # 작성자 이름에서 직함 제거 (한 번 더 정리)
-        df_work_pen['작성자'] = df_work_pen['작성자'].apply(clean_author_name)
-        df_work_pen['본명_mapped'] = df_work_pen['작성자'].map(pen_to_real_map)
-        # 필명 기준은 모든 작성자(필명)를 포함 (본명과 같은 경우도 포함)
-        # 단, 매핑이 없는 경우는 본명으로 사용
-        df_work_pen['본명'] = df_work_pen['본명_mapped'].fillna(df_work_pen['작성자'])
-        
-        if not df_work_pen.empty:
-            writers_by_pen = df_work_pen.groupby('작성자').agg(
-                기사수=('제목','count'), 
-                총조회수=('전체조회수','sum'),
-                좋아요=('좋아요', 'sum'),
-                댓글=('댓글', 'sum')
-            ).reset_index()
-            writers_by_pen = writers_by_pen.rename(columns={'작성자': '필명'})
-            # 본명 매핑 (매핑이 없으면 필명 그대로)
-            writers_by_pen['본명'] = writers_by_pen['필명'].map(pen_to_real_map).fillna(writers_by_pen['필명'])
-            writers_by_pen = writers_by_pen.sort_values('총조회수', ascending=False)
-            writers_by_pen['순위'] = range(1, len(writers_by_pen)+1)
-            writers_by_pen['평균조회수'] = (writers_by_pen['총조회수']/writers_by_pen['기사수']).astype(int)
-            
-            # 비율 계산 (각 지표 중에서의 점유율)
-            total_views_pen = writers_by_pen['총조회수'].sum()
-            total_avg_views_pen = writers_by_pen['평균조회수'].sum()  # 평균 조회수 합계 (점유율 계산용)
-            
+        # 필명 기준: 필명별 합산 (모든 필명 포함, 매핑이 없으면 필명을 본명으로 사용)
+        if not writer_stats.by_pen.empty:
             st.markdown('<div class="sub-header">필명 기준(전체 조회수 기준)</div>', unsafe_allow_html=True)
             st.markdown('<div style="font-size: 0.75rem; color: #78909c; margin-bottom: 5px;">(건, %)</div>', unsafe_allow_html=True)
             
-            disp_w_pen = writers_by_pen.copy()
-            # 비율 계산 및 포맷팅 (각 지표 중에서의 점유율)
-            disp_w_pen['총조회수_비율'] = (disp_w_pen['총조회수'] / total_views_pen * 100).round(1) if total_views_pen > 0 else 0
-            disp_w_pen['평균조회수_비율'] = (disp_w_pen['평균조회수'] / total_avg_views_pen * 100).round(1) if total_avg_views_pen > 0 else 0
-            
-            # 포맷팅: 숫자 + 비율
-            disp_w_pen['총조회수_포맷'] = disp_w_pen.apply(lambda x: f"{x['총조회수']:,} ({x['총조회수_비율']:.1f}%)", axis=1)
-            disp_w_pen['평균조회수_포맷'] = disp_w_pen.apply(lambda x: f"{x['평균조회수']:,} ({x['평균조회수_비율']:.1f}%)", axis=1)
-            disp_w_pen['좋아요_포맷'] = disp_w_pen['좋아요'].apply(lambda x: f"{x:,}")
-            disp_w_pen['댓글_포맷'] = disp_w_pen['댓글'].apply(lambda x: f"{x:,}")
-            
-            # 본명, 필명에서 직함 제거 (1어절만 남김)
-            disp_w_pen['본명'] = disp_w_pen['본명'].apply(clean_author_name)
-            disp_w_pen['필명'] = disp_w_pen['필명'].apply(clean_author_name)
-            
-            disp_w_pen = disp_w_pen[['순위', '필명', '본명', '기사수', '총조회수_포맷', '평균조회수_포맷', '좋아요_포맷', '댓글_포맷']]
-            disp_w_pen.columns = ['순위', '필명', '본명', '발행기사 수', '전체 조회수', '기사 1건당 조회수', '좋아요 개수', '댓글 개수']
+            disp_w_pen = format_writer_table(writer_stats.by_pen, ['필명', '본명'])
             
             st.dataframe(
                 disp_w_pen, 
@@ -692,7 +717,8 @@ def render_writer_integrated(writers_df, df_all_articles_with_metadata):
     • 발행기사 수: 기자별 기사 수 합계<br>
     • 전체 조회수: 기자별 기사 조회수 합계 (전체 대비 비율 %)<br>
     • 기사 1건당 조회수: 총조회수 ÷ 발행기사 수 (전체 대비 비율 %)<br>
-    • 순위: 총조회수 기준 내림차순 정렬
+    • 순위: 총조회수 기준 내림차순 정렬<br>
+    • 이상: 기사 1건당 조회수(로그)를 전체 기자 중앙값/MAD와 비교한 robust z, |z| ≥ 3.5
     </div>
     """, unsafe_allow_html=True)
 
@@ -702,8 +728,8 @@ def render_writer_real(writers_df):
     if not writers_df.empty:
         disp_w = writers_df.copy()
         for c in ['총조회수','평균조회수','좋아요','댓글']: disp_w[c] = disp_w[c].apply(lambda x: f"{x:,}")
-        disp_w = disp_w[['순위', '작성자', '필명', '기사수', '총조회수', '평균조회수', '좋아요', '댓글']]
-        disp_w.columns = ['순위', '본명', '필명', '발행기사 수', '전체 조회 수', '기사 1건 당 평균 조회 수', '좋아요 개수', '댓글 개수']
+        disp_w = disp_w[['순위', '작성자', '필명', '기사수', '총조회수', '평균조회수', '좋아요', '댓글', '이상']]
+        disp_w.columns = ['순위', '본명', '필명', '발행기사 수', '전체 조회 수', '기사 1건 당 평균 조회 수', '좋아요 개수', '댓글 개수', '이상']
         st.dataframe(disp_w, use_container_width=True, hide_index=True, height="content")
 
 # ----------------- 8. 기자 (필명) - 하위 호환성 유지 -----------------
@@ -716,7 +742,54 @@ def render_writer_pen(writers_df):
             df_pen = df_pen.sort_values('순위')
             disp_w = df_pen.copy()
             for c in ['총조회수','평균조회수','좋아요','댓글']: disp_w[c] = disp_w[c].apply(lambda x: f"{x:,}")
-            disp_w = disp_w[['순위', '필명', '작성자', '기사수', '총조회수', '평균조회수', '좋아요', '댓글']]
-            disp_w.columns = ['순위', '필명', '본명', '발행기사 수', '전체 조회 수', '기사 1건 당 평균 조회 수', '좋아요 개수', '댓글 개수']
+            disp_w = disp_w[['순위', '필명', '작성자', '기사수', '총조회수', '평균조회수', '좋아요', '댓글', '이상']]
+            disp_w.columns = ['순위', '필명', '본명', '발행기사 수', '전체 조회 수', '기사 1건 당 평균 조회 수', '좋아요 개수', '댓글 개수', '이상']
             st.dataframe(disp_w, use_container_width=True, hide_index=True, height="content")
-        else: st.info("필명 기자 실적 없음")
\ No newline at end of file
+        else: st.info("필명 기자 실적 없음")
+# ----------------- 진단: 로드 성능 워터폴 -----------------
+def render_perf_panel(traces):
+    import perf
+    st.markdown('<div class="sub-header">⏱ 최근 데이터 로드 성능</div>', unsafe_allow_html=True)
+    if not traces:
+        st.info("기록된 로드가 없습니다.")
+        return
+
+    rows = []
+    for t in traces:
+        sm = perf.summarize(t)
+        rows.append({
+            '시작': t['started_at'], '주차': t['label'], '캐시': t['attrs'].get('cache', '-'),
+            '전체(ms)': t['duration_ms'], 'GA4 호출': sm['ga4_calls'], 'GA4 행': sm['ga4_rows'],
+            '크롤링': sm['crawl_calls'], '크롤링 캐시적중': sm['crawl_hits'],
+        })
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+    idx = st.selectbox(
+        "워터폴 대상", range(len(traces)), key="perf_trace_select",
+        format_func=lambda i: f"{traces[i]['started_at']} · {traces[i]['label']} · {traces[i]['duration_ms']:,.0f}ms"
+    )
+    spans = traces[idx]['spans']
+    if not spans:
+        st.info("캐시 적중: 세부 단계가 실행되지 않았습니다.")
+        return
+
+    df_sp = pd.DataFrame(spans)
+    def span_label(r):
+        a = r['attrs']
+        detail = a.get('report') or a.get('path') or (f"p{a['page']}" if 'page' in a else '')
+        return f"{r['name']} {detail}".strip()
+    df_sp['단계'] = df_sp.apply(span_label, axis=1)
+    df_sp['상세'] = df_sp['attrs'].apply(lambda a: ', '.join(f"{k}={v}" for k, v in a.items()))
+    kind_colors = {'section': COLOR_NAVY, 'ga4': COLOR_RED, 'crawl': '#8d6e63', 'step': COLOR_GREY}
+
+    fig = go.Figure()
+    for kind, grp in df_sp.groupby('kind'):
+        fig.add_trace(go.Bar(
+            y=grp.index.astype(str), x=grp['duration_ms'], base=grp['offset_ms'], orientation='h',
+            name=kind, marker_color=kind_colors.get(kind, COLOR_GREY),
+            customdata=grp[['단계', '상세', 'thread']].values,
+            hovertemplate='<b>%{customdata[0]}</b><br>%{base:,.0f}ms + %{x:,.0f}ms<br>%{customdata[1]}<br>%{customdata[2]}<extra></extra>'
+        ))
+    fig.update_yaxes(autorange='reversed', tickvals=df_sp.index.astype(str), ticktext=df_sp['단계'].str.slice(0, 40))
+    fig.update_layout(barmode='overlay', plot_bgcolor='white', xaxis_title='ms', height=max(300, 18 * len(df_sp)), margin=dict(l=10, r=10, t=30, b=30), legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    st.plotly_chart(fig, use_container_width=True, key="perf_waterfall_chart")